@@ -0,0 +1,6 @@
+"""Byteclasses benchmark suite.
+
+Benchmarks are plain functions named `bench_*` in `bench_*.py` modules. Each function
+performs its setup and returns the callable to time, or a dictionary of named callables
+for parametrized benchmarks. Run the suite with `python -m benchmarks.run`.
+"""
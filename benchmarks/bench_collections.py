@@ -0,0 +1,99 @@
+"""Collection type benchmarks."""
+
+from byteclasses.handlers.network.ipv4_hdr import IPv4Hdr
+from byteclasses.types.collections import ByteArray, String, structure
+from byteclasses.types.primitives.integers import UInt8, UInt16, UInt32
+
+IPV4_HDR = bytes.fromhex("450000543a2b40004001f6c2c0a80001c0a800c7")
+
+
+def _header_struct(**kwargs):
+    """Return a header structure class using the given structure arguments."""
+
+    @structure(byte_order=b"!", packed=True, **kwargs)
+    class Header:  # pylint: disable=R0903
+        """Benchmark header structure."""
+
+        ver_ihl: UInt8
+        dscp_ecn: UInt8
+        total_length: UInt16
+        identification: UInt16
+        flags_off: UInt16
+        time_to_live: UInt8
+        protocol: UInt8
+        header_checksum: UInt16
+        src_ip: UInt32
+        dst_ip: UInt32
+
+    return Header
+
+
+def bench_structure_init():
+    """Create flat and lazy structures."""
+    return {"flat": _header_struct(), "lazy": _header_struct(lazy=True), "ipv4_hdr": IPv4Hdr}
+
+
+def bench_structure_attach():
+    """Attach a nested header to new data."""
+    header = IPv4Hdr()
+    data = memoryview(bytearray(IPV4_HDR))
+    return lambda: header.attach(data, False)
+
+
+def bench_structure_rebase():
+    """Rebase a nested header onto a buffer."""
+    header = IPv4Hdr()
+    data = memoryview(bytearray(IPV4_HDR))
+    return lambda: header.rebase(data)
+
+
+def bench_ipv4_parse():
+    """Parse an IPv4 header and read nested union, array and bitfield members."""
+    data = bytearray(IPV4_HDR)
+
+    def parse():
+        header = IPv4Hdr.from_buffer(data)
+        return header.ver_ihl.ihl, header.flags_off.fragment_offset, header.src_ip.uint32.value, header.dst_ip.uint8[3]
+
+    return parse
+
+
+def bench_structure_unpack_from():
+    """Decode all structure members with the compiled struct."""
+    header_cls = _header_struct()
+    data = bytes(IPV4_HDR)
+    return lambda: header_cls.unpack_from(data)
+
+
+def bench_structure_eq():
+    """Compare structures by member values and by raw bytes."""
+    cases = {}
+    for mode in ("members", "bytes"):
+        header_cls = _header_struct(eq=mode)
+        first = header_cls.from_buffer(bytearray(IPV4_HDR))
+        second = header_cls.from_buffer(bytearray(IPV4_HDR))
+        cases[mode] = lambda first=first, second=second: first == second
+    return cases
+
+
+def bench_structure_hash():
+    """Hash a structure by raw bytes."""
+    header = _header_struct(hash="bytes").from_buffer(bytearray(IPV4_HDR))
+    return lambda: hash(header)
+
+
+def bench_byte_array_slice_assign():
+    """Assign a slice of a byte array."""
+    array = ByteArray(64)
+    value = list(range(32))
+
+    def assign():
+        array[16:48] = value
+
+    return assign
+
+
+def bench_string_value():
+    """Read a string value."""
+    string = String(32, value="hello byteclasses")
+    return lambda: string.value
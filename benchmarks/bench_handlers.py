@@ -0,0 +1,151 @@
+"""Data handler benchmarks."""
+
+import io
+import struct
+from pathlib import Path
+
+from byteclasses.handlers import detect
+from byteclasses.handlers.executables.elf import Elf64
+from byteclasses.handlers.executables.mach import Mach64
+from byteclasses.handlers.executables.pe import PE32
+from byteclasses.handlers.images.jpg.jpg import JPG
+from byteclasses.handlers.network.checksum import tcp_checksum, tcp_checksums
+from byteclasses.handlers.network.filter import F
+from byteclasses.handlers.network.packet import decode
+from byteclasses.handlers.network.pcap import Pcap, PcapWriter
+from byteclasses.handlers.network.pcapng import PcapNG, PcapNGWriter
+from byteclasses.handlers.network.reassembly import TCPReassembler
+
+DATA_DIR = Path(__file__).parent.parent / "tests" / "data"
+
+
+def bench_elf64_section_table():
+    """Parse an ELF file and every entry of its section table."""
+    data = (DATA_DIR / "hello_world.elf").read_bytes()
+    return lambda: list(Elf64(data).section_table)
+
+
+def bench_elf64_section_by_name():
+    """Look up a section by name."""
+    elf = Elf64((DATA_DIR / "hello_world.elf").read_bytes())
+    return lambda: elf.section_by_name(".text")
+
+
+def bench_elf64_symbol_lookup():
+    """Look up symbols by name and by address."""
+    symbols = Elf64((DATA_DIR / "hello_world.elf").read_bytes()).symbols()
+    address = symbols.by_name("main").st_value.value + 4
+    return {"name": lambda: symbols.by_name("main"), "address": lambda: symbols.by_address(address)}
+
+
+def bench_jpg_parse():
+    """Parse the segments of a JPG image."""
+    data = (DATA_DIR / "sample.jpg").read_bytes()
+    return lambda: JPG(data).segments
+
+
+def bench_elf64_relocations():
+    """Walk a relocation section with a reused entry and decode it column wise."""
+    elf = Elf64((DATA_DIR / "hello_world.elf").read_bytes())
+
+    def walk():
+        for entry in elf.iter_relocations(".rela.dyn"):
+            entry.r_offset.value  # pylint: disable=W0104
+
+    return {"iter": walk, "columns": lambda: elf.relocation_columns(".rela.dyn")}
+
+
+def bench_pe32_imports():
+    """Parse a PE file and walk its imports."""
+    data = (DATA_DIR / "hello_world.pe").read_bytes()
+    return lambda: list(PE32(data).iter_imports())
+
+
+def bench_mach64_load_commands():
+    """Parse a Mach-O file and extract its UUID and segment map."""
+    data = (DATA_DIR / "hello_world.mach-o").read_bytes()
+
+    def walk():
+        mach = Mach64(data)
+        return mach.uuid, [(segment.cmd.segname.value, len(segment.sections)) for segment in mach.segments]
+
+    return walk
+
+
+def bench_detect():
+    """Select the handler class of every sample file."""
+    samples = [(DATA_DIR / name).read_bytes() for name in ("hello_world.elf", "hello_world.pe", "sample.jpg")]
+    return lambda: [detect(sample) for sample in samples]
+
+
+def _synthetic_frames(count: int) -> list[bytes]:
+    """Return Ethernet frames cycling through TCP over IPv4, UDP over IPv6 and VLAN tagged UDP over IPv4."""
+    eth = b"\x00\x11\x22\x33\x44\x55\x66\x77\x88\x99\xaa\xbb"
+    tcp = struct.pack("!HHIIHHHH", 1234, 80, 1, 2, 0x5018, 65535, 0, 0) + b"GET / HTTP/1.1\r\n\r\n"
+    udp = struct.pack("!HHHH", 53, 5353, 8 + 12, 0) + bytes(12)
+    ipv4_tcp = struct.pack("!BBHHHBBH4s4s", 0x45, 0, 20 + len(tcp), 1, 0x4000, 64, 6, 0, bytes(4), bytes(4)) + tcp
+    ipv4_udp = struct.pack("!BBHHHBBH4s4s", 0x45, 0, 20 + len(udp), 1, 0x4000, 64, 17, 0, bytes(4), bytes(4)) + udp
+    ipv6_udp = struct.pack("!IHBB16s16s", 0x60000000, len(udp), 17, 64, bytes(16), bytes(16)) + udp
+    frames = [
+        eth + b"\x08\x00" + ipv4_tcp,
+        eth + b"\x86\xdd" + ipv6_udp,
+        eth + b"\x81\x00\x00\x05\x08\x00" + ipv4_udp,
+    ]
+    return [frames[idx % len(frames)] for idx in range(count)]
+
+
+def bench_packet_decode():
+    """Decode 1000 synthetic Ethernet frames into layers."""
+    frames = _synthetic_frames(1000)
+    return lambda: [decode(frame) for frame in frames]
+
+
+def bench_capture_index():
+    """Index 10000 packet records of in-memory pcap and pcapng captures."""
+    captures = {}
+    for name, writer_cls in (("pcap", PcapWriter), ("pcapng", PcapNGWriter)):
+        file = io.BytesIO()
+        with writer_cls(file) as writer:
+            for frame in _synthetic_frames(10000):
+                writer.write(frame, 0.0)
+        captures[name] = file.getvalue()
+    return {
+        "pcap": lambda: Pcap(memoryview(captures["pcap"])).offsets,
+        "pcapng": lambda: PcapNG(memoryview(captures["pcapng"])).offsets,
+    }
+
+
+def bench_checksum():
+    """Compute the TCP checksums of 1000 decoded synthetic frames, one by one and in a batch."""
+    packets = [decode(frame) for frame in _synthetic_frames(1000)]
+    tcp_packets = [packet for packet in packets if "tcp" in packet]
+    layers = [(packet["ipv4"].header, packet["tcp"]) for packet in tcp_packets]
+    return {
+        "scalar": lambda: [tcp_checksum(ip, tcp.header, tcp.payload) for ip, tcp in layers],
+        "batch": lambda: tcp_checksums(tcp_packets),
+    }
+
+
+def bench_tcp_reassembly():
+    """Reassemble 100 interleaved TCP flows of 100 in-order 100 byte segments each."""
+    packets = []
+    for idx in range(100 * 100):
+        port, seq = 1024 + idx % 100, 0xFFFFF000 + idx // 100 * 100
+        tcp = struct.pack("!HHIIHHHH", port, 80, seq & 0xFFFFFFFF, 0, 0x5010, 65535, 0, 0) + bytes(100)
+        ip = struct.pack("!BBHHHBBH4s4s", 0x45, 0, 20 + len(tcp), 1, 0, 64, 6, 0, bytes(4), bytes(4))
+        packets.append(decode(ip + tcp, 228))
+    return lambda: TCPReassembler().add_many(packets)
+
+
+def bench_packet_filter():
+    """Filter 10000 packets of an in-memory pcap capture, decoded one by one and masked in bulk."""
+    file = io.BytesIO()
+    with PcapWriter(file) as writer:
+        for frame in _synthetic_frames(10000):
+            writer.write(frame, 0.0)
+    capture = Pcap(memoryview(file.getvalue()))
+    packet_filter = ((F.ipv4.protocol == 6) & F.tcp.dst_port.in_({80, 443})).compile()
+    return {
+        "decoded": lambda: list(packet_filter.filter(capture.iter_packets())),
+        "mask": lambda: packet_filter.indices(capture),
+    }
@@ -0,0 +1,51 @@
+"""Primitive type benchmarks."""
+
+from byteclasses.handlers.network.ipv4_hdr import FlagsOff
+from byteclasses.types.primitives.floats import Float16, Float32, Float64
+from byteclasses.types.primitives.integers import Int8, Int16, Int32, Int64, UInt8, UInt16, UInt32, UInt64
+
+NUMERIC_TYPES = (Int8, Int16, Int32, Int64, UInt8, UInt16, UInt32, UInt64, Float16, Float32, Float64)
+
+
+def bench_value_get():
+    """Read the value of every numeric primitive type."""
+    cases = {}
+    for type_ in NUMERIC_TYPES:
+        instance = type_(1, byte_order=b"!")
+        cases[type_.__name__] = lambda instance=instance: instance.value
+    return cases
+
+
+def bench_value_set():
+    """Set the value of every numeric primitive type."""
+    cases = {}
+    for type_ in NUMERIC_TYPES:
+        instance = type_(byte_order=b"!")
+
+        def set_value(instance=instance):
+            instance.value = 1
+
+        cases[type_.__name__] = set_value
+    return cases
+
+
+def bench_bitfield_get():
+    """Read a multi-bit BitField field."""
+    flags_off = FlagsOff(byte_order=b"!", data=b"\x40\x10")
+    return lambda: flags_off.fragment_offset
+
+
+def bench_bitfield_set():
+    """Set a multi-bit BitField field."""
+    flags_off = FlagsOff(byte_order=b"!")
+
+    def set_field():
+        flags_off.fragment_offset = 0x1234
+
+    return set_field
+
+
+def bench_bitfield_flags():
+    """Decode all named fields of a BitField."""
+    flags_off = FlagsOff(byte_order=b"!", data=b"\x40\x10")
+    return flags_off.flags_tuple
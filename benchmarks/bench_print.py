@@ -0,0 +1,15 @@
+"""Byteclass rendering benchmarks."""
+
+import io
+
+from rich.console import Console  # pylint: disable=E0401
+
+from byteclasses.handlers.network.ipv4_hdr import IPv4Hdr
+from byteclasses.print import byteclass_inspect
+
+
+def bench_byteclass_inspect():
+    """Render a nested header table."""
+    header = IPv4Hdr()
+    console = Console(file=io.StringIO(), width=120)
+    return lambda: byteclass_inspect(header, console=console)
@@ -0,0 +1,115 @@
+"""Byteclasses benchmark runner.
+
+Times every benchmark in the suite, optionally saving the results as a JSON baseline or
+comparing them against a previously saved baseline.
+
+    python -m benchmarks.run --save benchmarks/baseline.json
+    python -m benchmarks.run --compare benchmarks/baseline.json --threshold 0.25
+
+Comparison exits with a non-zero status when any benchmark is slower than its baseline
+by more than the threshold. Baselines are machine specific, save a new baseline before
+comparing on a different machine.
+"""
+
+import argparse
+import fnmatch
+import importlib
+import json
+import platform
+import sys
+import timeit
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).parent
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+DEFAULT_THRESHOLD = 0.25
+
+
+def iter_benchmarks(pattern: str | None = None) -> Iterator[tuple[str, Callable[[], object]]]:
+    """Yield the name and timed callable of every benchmark matching pattern."""
+    for path in sorted(BENCH_DIR.glob("bench_*.py")):
+        module = importlib.import_module(f"{__package__ or BENCH_DIR.name}.{path.stem}")
+        for func_name, func in vars(module).items():
+            if not func_name.startswith("bench_") or not callable(func):
+                continue
+            name = f"{path.stem[len('bench_'):]}.{func_name[len('bench_'):]}"
+            if pattern is not None and not fnmatch.fnmatch(name, f"*{pattern}*"):
+                continue
+            cases = func()
+            if callable(cases):
+                yield name, cases
+            else:
+                for case_name, case in cases.items():
+                    yield f"{name}[{case_name}]", case
+
+
+def time_benchmark(func: Callable[[], object], repeat: int = 5, min_time: float = 0.05) -> float:
+    """Return the best time per call of func in seconds."""
+    timer = timeit.Timer(func)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    return min(timer.repeat(repeat, number)) / number
+
+
+def run(pattern: str | None = None, repeat: int = 5) -> dict[str, float]:
+    """Return the time per call of every benchmark matching pattern."""
+    results: dict[str, float] = {}
+    for name, func in iter_benchmarks(pattern):
+        results[name] = time_benchmark(func, repeat)
+        print(f"{name:<48} {results[name] * 1e6:>12.3f} us")
+    return results
+
+
+def compare(results: dict[str, float], baseline: dict[str, float], threshold: float) -> list[str]:
+    """Print a comparison table and return the names of regressed benchmarks."""
+    regressions: list[str] = []
+    print(f"\n{'benchmark':<48} {'baseline':>12} {'current':>12} {'ratio':>8}")
+    for name, current in results.items():
+        if name not in baseline:
+            print(f"{name:<48} {'-':>12} {current * 1e6:>10.3f}us {'new':>8}")
+            continue
+        ratio = current / baseline[name]
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            flag = " REGRESSION"
+        print(f"{name:<48} {baseline[name] * 1e6:>10.3f}us {current * 1e6:>10.3f}us {ratio:>7.2f}x{flag}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark suite."""
+    parser = argparse.ArgumentParser(description="Run the byteclasses benchmark suite.")
+    parser.add_argument("-k", dest="pattern", help="only run benchmarks whose name contains PATTERN")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repetitions per benchmark")
+    parser.add_argument("--save", type=Path, metavar="FILE", help="save results as a JSON baseline")
+    parser.add_argument("--compare", type=Path, metavar="FILE", help="compare results against a JSON baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"allowed slowdown ratio before failing a comparison (default {DEFAULT_THRESHOLD})",
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.pattern, args.repeat)
+    if args.save is not None:
+        baseline = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "benchmarks": results,
+        }
+        args.save.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare(results, baseline["benchmarks"], args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1 +1,5 @@
 """Pre-defined Data Handlers Package."""
+
+from ._detect import detect, open_any, register_magic
+
+__all__ = ["detect", "open_any", "register_magic"]
@@ -1,14 +1,46 @@
 """Generic Data Handler Class."""
 
+import builtins
+import mmap
+import os
 from abc import ABC
+from contextlib import suppress
+from typing import Any, TypeVar
+
+DataHandlerT = TypeVar("DataHandlerT", bound="_DataHandler")
+
+_MMAP_ACCESS = {
+    "r": ("rb", mmap.ACCESS_READ),
+    "r+": ("r+b", mmap.ACCESS_WRITE),
+}
+
+
+def _map_file(path: str | os.PathLike, mode: str = "r") -> mmap.mmap:
+    """Return a memory mapping of a file."""
+    try:
+        file_mode, access = _MMAP_ACCESS[mode]
+    except KeyError as err:
+        raise ValueError(f"Invalid mode ({mode!r}), must be 'r' or 'r+'") from err
+    with builtins.open(path, file_mode) as file:
+        return mmap.mmap(file.fileno(), 0, access=access)
 
 
 class _DataHandler(ABC):
-    """A generic data handler class."""
+    """A generic data handler class.
 
-    def __init__(self, data: bytes | bytearray) -> None:
+    Memoryview data is used in place, any other data is copied into a new bytearray.
+    A handler created from a memoryview aliases its source: changes to the source are
+    seen by the handler and its headers, and the source buffer cannot be resized or
+    released while the handler holds the view. Pass bytes(view) to work on a copy.
+    """
+
+    def __init__(self, data: bytes | bytearray | memoryview) -> None:
         """Initialize data handler instance."""
-        self._data: memoryview = memoryview(bytearray(data))
+        if isinstance(data, memoryview):
+            self._data: memoryview = data if data.format == "B" else data.cast("B")
+        else:
+            self._data = memoryview(bytearray(data))
+        self._mmap: mmap.mmap | None = None
 
     def __bytes__(self) -> bytes:
         """Return data handler bytes."""
@@ -26,6 +58,77 @@ class _DataHandler(ABC):
         """Return data handler string."""
         return str(self._data)
 
+    def __enter__(self: DataHandlerT) -> DataHandlerT:
+        """Enter data handler context."""
+        return self
+
+    def __exit__(self, exc_type: Any, *_: Any) -> None:
+        """Exit data handler context.
+
+        When the context is left by an exception, views held by its traceback must not
+        replace it with a BufferError, the mapping is then closed once they are released.
+        """
+        try:
+            self.close()
+        except BufferError:
+            if exc_type is None:
+                raise
+
+    @classmethod
+    def open(cls: type[DataHandlerT], path: str | os.PathLike, mode: str = "r", **kwargs: Any) -> DataHandlerT:
+        """Return a data handler over a memory mapped file.
+
+        Headers are attached directly to the mapping, nothing is copied. Files opened with
+        mode "r" are read-only, changes to files opened with mode "r+" are written back to
+        the file on flush or close.
+        """
+        return cls._from_mmap(_map_file(path, mode), **kwargs)
+
+    @classmethod
+    def _from_mmap(cls: type[DataHandlerT], mapping: mmap.mmap, **kwargs: Any) -> DataHandlerT:
+        """Return a data handler owning a memory mapping."""
+        try:
+            handler = cls(memoryview(mapping), **kwargs)  # type: ignore[call-arg]
+        except Exception:
+            # Views held by the traceback keep the mapping open until they are released
+            with suppress(BufferError):
+                mapping.close()
+            raise
+        handler._mmap = mapping
+        return handler
+
+    def flush(self) -> None:
+        """Write changes to a memory mapped file back to disk."""
+        if self._mmap is not None and not self._mmap.closed:
+            self._mmap.flush()
+
+    def close(self) -> None:
+        """Close the memory mapped file.
+
+        The handler data and everything derived from it, such as attached headers and
+        entry tables, are released before the mapping is closed and the handler must not
+        be used afterwards. BufferError is raised while views of the mapping are still
+        held elsewhere, the mapping then stays open until close is called again.
+        """
+        mapping = self._mmap
+        if mapping is None:
+            return
+        if not mapping.closed:
+            mapping.flush()
+            self._release()
+            try:
+                mapping.close()
+            except BufferError as err:
+                raise BufferError("Views of the memory mapped file are still in use") from err
+        self._mmap = None
+
+    def _release(self) -> None:
+        """Drop the handler data and every attribute derived from it."""
+        mapping = self._mmap
+        self.__dict__.clear()
+        self._data = memoryview(b"")
+        self._mmap = mapping
+
     @property
     def data(self) -> memoryview:
         """Return data handler data."""
@@ -0,0 +1,134 @@
+"""Data Format Detection.
+
+Handlers are selected by magic number through a byte prefix trie built once at import
+time. Magic numbers shared by several formats or handlers (the PE optional header
+magic, the ELF class, ...) are resolved by a resolver registered for the prefix.
+"""
+
+import os
+from collections.abc import Callable
+from typing import Any
+
+from ._data_handler import _DataHandler, _map_file
+from .executables.elf import Elf32, Elf64
+from .executables.mach import Fat, Mach32, Mach64
+from .executables.mach.fat import FAT_MAGIC32, FAT_MAGIC64
+from .executables.mach.mach_hdr import MH_MAGIC32, MH_MAGIC64
+from .executables.pe import PE32, PE64
+from .images import JPG
+from .network.pcap import Pcap
+from .network.pcap_hdr import PCAP_MAGIC, PCAP_MAGIC_NS
+from .network.pcapng import PcapNG
+from .network.pcapng_block import BlockType
+
+__all__ = ["detect", "open_any", "register_magic"]
+
+_Resolver = Callable[[memoryview], type[_DataHandler] | None]
+
+# Key of the resolver stored in a trie node
+_RESOLVER = -1
+
+_PE_MAGICS: dict[int, type[_DataHandler]] = {0x10B: PE32, 0x20B: PE64}
+# Java class files share the fat magic, their major version (>= 45) overlays nfat_arch
+_FAT_MAX_ARCHS = 45
+
+_magic_trie: dict[int, Any] = {}
+
+
+def register_magic(magic: bytes, handler: type[_DataHandler] | _Resolver) -> None:
+    """Register a handler class, or a resolver returning one, for a magic number prefix.
+
+    A resolver is called with a view of the data and returns the handler class or None
+    when the data is not a match. Longer prefixes take precedence over shorter ones.
+    """
+    if not magic:
+        raise ValueError("Magic must not be empty")
+    resolver: _Resolver
+    if isinstance(handler, type):
+        handler_cls = handler
+
+        def _resolve(_: memoryview) -> type[_DataHandler] | None:
+            return handler_cls
+
+        resolver = _resolve
+
+    else:
+        resolver = handler
+    node = _magic_trie
+    for byte in magic:
+        node = node.setdefault(byte, {})
+    node[_RESOLVER] = resolver
+
+
+def detect(data: bytes | bytearray | memoryview) -> type[_DataHandler] | None:
+    """Return the handler class for data, or None if the format is not recognized."""
+    view = data if isinstance(data, memoryview) else memoryview(data)
+    resolvers: list[_Resolver] = []
+    node = _magic_trie
+    for byte in view[:64]:
+        node = node.get(byte)  # type: ignore[assignment]
+        if node is None:
+            break
+        if _RESOLVER in node:
+            resolvers.append(node[_RESOLVER])
+    for resolver in reversed(resolvers):
+        handler_cls = resolver(view)
+        if handler_cls is not None:
+            return handler_cls
+    return None
+
+
+def open_any(source: bytes | bytearray | memoryview | str | os.PathLike, mode: str = "r") -> _DataHandler:
+    """Return a handler for a buffer or a file, selected by the magic number of the data.
+
+    Buffers are used in place without copying, files are memory mapped with mode (see
+    _DataHandler.open).
+    """
+    if isinstance(source, (str, os.PathLike)):
+        mapping = _map_file(source, mode)
+        try:
+            with memoryview(mapping) as view:
+                handler_cls = detect(view)
+            if handler_cls is None:
+                raise ValueError(f"Unrecognized data format ({os.fspath(source)!r})")
+        except Exception:
+            mapping.close()
+            raise
+        return handler_cls._from_mmap(mapping)
+    view = source if isinstance(source, memoryview) else memoryview(source)
+    handler_cls = detect(view)
+    if handler_cls is None:
+        raise ValueError(f"Unrecognized data format ({bytes(view[:8])!r})")
+    return handler_cls(view)  # type: ignore[call-arg]
+
+
+def _resolve_pe(view: memoryview) -> type[_DataHandler] | None:
+    """Return the PE handler matching the optional header magic."""
+    if len(view) < 0x40:
+        return None
+    nt_offset = int.from_bytes(view[0x3C:0x40], "little")
+    if view[nt_offset : nt_offset + 4] != b"PE\x00\x00":
+        return None
+    return _PE_MAGICS.get(int.from_bytes(view[nt_offset + 24 : nt_offset + 26], "little"))
+
+
+def _resolve_fat(view: memoryview) -> type[_DataHandler] | None:
+    """Return the fat binary handler unless the data is a Java class file."""
+    if len(view) < 8 or not 0 < int.from_bytes(view[4:8], "big") < _FAT_MAX_ARCHS:
+        return None
+    return Fat
+
+
+register_magic(b"\x7fELF\x01", Elf32)
+register_magic(b"\x7fELF\x02", Elf64)
+register_magic(b"MZ", _resolve_pe)
+# Big endian Mach-Os are not registered, the Mach-O handlers read native byte order headers
+register_magic(MH_MAGIC32, Mach32)
+register_magic(MH_MAGIC64, Mach64)
+register_magic(FAT_MAGIC32, _resolve_fat)
+register_magic(FAT_MAGIC64, _resolve_fat)
+register_magic(b"\xff\xd8\xff", JPG)
+for _magic in (PCAP_MAGIC, PCAP_MAGIC_NS):
+    register_magic(_magic.to_bytes(4, "little"), Pcap)
+    register_magic(_magic.to_bytes(4, "big"), Pcap)
+register_magic(BlockType.SECTION_HDR.to_bytes(4, "little"), PcapNG)
@@ -0,0 +1,71 @@
+"""Lazily Indexed Entry Table."""
+
+from collections.abc import Callable, Iterator, Sequence
+from typing import Generic, TypeVar, overload
+
+EntryT = TypeVar("EntryT")
+
+
+class _EntryTable(Sequence, Generic[EntryT]):
+    """A table of fixed size entries over a buffer.
+
+    Entries are views over the buffer, created on first access and cached.
+    """
+
+    def __init__(
+        self,
+        new_entry: Callable[[memoryview], EntryT],
+        data: memoryview,
+        offset: int,
+        entry_size: int,
+        count: int,
+    ) -> None:
+        """Initialize entry table instance."""
+        if offset < 0 or entry_size < 0 or count < 0 or offset + entry_size * count > len(data):
+            raise ValueError("Insufficient data")
+        self._new_entry = new_entry
+        self._data = data
+        self._offset = offset
+        self._entry_size = entry_size
+        self._entries: list[EntryT | None] = [None] * count
+
+    def __repr__(self) -> str:
+        """Return entry table representation."""
+        return f"{self.__class__.__name__}(offset={self._offset}, entry_size={self._entry_size}, count={len(self)})"
+
+    def __len__(self) -> int:
+        """Return entry count."""
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[EntryT]:
+        """Return an entry iterator."""
+        for idx in range(len(self._entries)):
+            yield self._entry(idx)
+
+    @overload
+    def __getitem__(self, key: int) -> EntryT: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> list[EntryT]: ...
+
+    def __getitem__(self, key: int | slice) -> EntryT | list[EntryT]:
+        """Return an entry or a list of entries."""
+        if isinstance(key, slice):
+            return [self._entry(idx) for idx in range(*key.indices(len(self._entries)))]
+        if key < 0:
+            key += len(self._entries)
+        if not 0 <= key < len(self._entries):
+            raise IndexError(f"index {key} out of range")
+        return self._entry(key)
+
+    def _entry(self, idx: int) -> EntryT:
+        """Return the entry at idx, creating it on first access."""
+        entry = self._entries[idx]
+        if entry is None:
+            start = self._offset + idx * self._entry_size
+            entry = self._entries[idx] = self._new_entry(self._data[start : start + self._entry_size])
+        return entry
+
+    def entry_offset(self, idx: int) -> int:
+        """Return the buffer offset of the entry at idx."""
+        return self._offset + idx * self._entry_size
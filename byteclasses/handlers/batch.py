@@ -0,0 +1,185 @@
+"""Parallel Batch Parsing.
+
+Files are parsed in worker processes. Every worker memory maps its files, runs an
+extraction function against the handler and only sends the extracted results back, so
+handlers and file data never cross process boundaries.
+"""
+
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, NamedTuple
+
+from ..constants import _PARAMS
+from ..types.collections.record_array import RecordArray
+from ._data_handler import _DataHandler
+from ._detect import open_any
+
+__all__ = ["BatchResult", "parse_many", "parse_many_records"]
+
+DEFAULT_CHUNK_SIZE = 32
+
+_Path = str | os.PathLike
+
+
+class BatchResult(NamedTuple):
+    """Extraction result of a single file, error is set when the file failed."""
+
+    path: _Path
+    value: Any
+    error: str | None
+
+
+def _open(path: _Path, handler: type[_DataHandler] | None) -> _DataHandler:
+    """Return a handler over a memory mapped file."""
+    if handler is None:
+        return open_any(path)
+    return handler.open(path)
+
+
+def _format_error(err: Exception) -> str:
+    """Return a picklable description of an exception."""
+    return f"{type(err).__name__}: {err}"
+
+
+def _parse_chunk(
+    handler: type[_DataHandler] | None, extract: Callable[[Any], Any], paths: list[_Path]
+) -> list[tuple[Any, str | None]]:
+    """Return the extracted value or the error of every file in a chunk."""
+    results: list[tuple[Any, str | None]] = []
+    for path in paths:
+        try:
+            with _open(path, handler) as data_handler:
+                results.append((extract(data_handler), None))
+        except Exception as err:  # pylint: disable=W0718
+            results.append((None, _format_error(err)))
+    return results
+
+
+def _parse_chunk_records(
+    handler: type[_DataHandler] | None, extract: Callable[[Any], Any], record_type: type, paths: list[_Path]
+) -> tuple[bytes, list[str | None]]:
+    """Return the packed records and the errors of every file in a chunk.
+
+    Failed files are packed as zero filled records.
+    """
+    struct = getattr(record_type, _PARAMS).get_struct()
+    data = bytearray(struct.size * len(paths))
+    errors: list[str | None] = []
+    for idx, path in enumerate(paths):
+        try:
+            with _open(path, handler) as data_handler:
+                # Records are packed before being copied in, a failed record is left zero filled
+                record = struct.pack(*extract(data_handler))
+            data[idx * struct.size : (idx + 1) * struct.size] = record
+            errors.append(None)
+        except Exception as err:  # pylint: disable=W0718
+            errors.append(_format_error(err))
+    return bytes(data), errors
+
+
+def _iter_chunks(
+    submit: Callable[[list[_Path]], Future],
+    paths: Iterable[_Path],
+    chunk_size: int,
+    max_in_flight: int,
+) -> Iterator[tuple[list[_Path], Any]]:
+    """Yield every chunk of paths with its result, keeping at most max_in_flight chunks queued."""
+    pending: deque[tuple[list[_Path], Future]] = deque()
+    path_iter = iter(paths)
+    while True:
+        while len(pending) < max_in_flight:
+            chunk = list(islice(path_iter, chunk_size))
+            if not chunk:
+                break
+            pending.append((chunk, submit(chunk)))
+        if not pending:
+            return
+        chunk, future = pending.popleft()
+        yield chunk, future.result()
+
+
+def _run_inline(func: Callable[..., Any], *args: Any) -> Future:
+    """Return a completed future holding the result of func."""
+    future: Future = Future()
+    future.set_result(func(*args))
+    return future
+
+
+def _run(
+    func: Callable[..., Any],
+    args: tuple[Any, ...],
+    paths: Iterable[_Path],
+    workers: int | None,
+    chunk_size: int,
+    max_in_flight: int | None,
+) -> Iterator[tuple[list[_Path], Any]]:
+    """Yield every chunk of paths with the result of func, run in a process pool."""
+    if chunk_size < 1:
+        raise ValueError(f"Invalid chunk size ({chunk_size})")
+    if workers == 0:
+        yield from _iter_chunks(lambda chunk: _run_inline(func, *args, chunk), paths, chunk_size, 1)
+        return
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from _iter_chunks(
+            lambda chunk: executor.submit(func, *args, chunk), paths, chunk_size, max_in_flight or workers * 2
+        )
+
+
+def parse_many(
+    paths: Iterable[_Path],
+    handler: type[_DataHandler] | None = None,
+    *,
+    extract: Callable[[Any], Any],
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_in_flight: int | None = None,
+) -> Iterator[BatchResult]:
+    """Yield the result of extract for every file, in the order of paths.
+
+    Files are opened with handler, or with the handler detected by open_any when handler
+    is None. Paths are submitted to a pool of worker processes (all CPUs by default,
+    workers=0 parses in the current process) in chunks of chunk_size, at most
+    max_in_flight chunks (twice the number of workers by default) are queued at a time.
+    Exceptions raised while parsing a file are captured in the error of its result.
+
+    extract must be picklable, i.e. a module level function, and should return plain
+    values rather than handlers or views of the file data.
+    """
+    for chunk, results in _run(_parse_chunk, (handler, extract), paths, workers, chunk_size, max_in_flight):
+        for path, (value, error) in zip(chunk, results):
+            yield BatchResult(path, value, error)
+
+
+def parse_many_records(
+    paths: Iterable[_Path],
+    record_type: type,
+    handler: type[_DataHandler] | None = None,
+    *,
+    extract: Callable[[Any], tuple[Any, ...]],
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_in_flight: int | None = None,
+) -> tuple[RecordArray, list[BatchResult]]:
+    """Return a record array of the values extracted from every file and the failed files.
+
+    extract returns the member values of a record_type record, records are packed in the
+    workers so only raw record data is sent back. Records of failed files are zero
+    filled, the failed files are returned as results with the record index as value.
+    See parse_many for the remaining arguments.
+    """
+    data = bytearray()
+    failed: list[BatchResult] = []
+    count = 0
+    for chunk, (chunk_data, errors) in _run(
+        _parse_chunk_records, (handler, extract, record_type), paths, workers, chunk_size, max_in_flight
+    ):
+        data += chunk_data
+        for path, error in zip(chunk, errors):
+            if error is not None:
+                failed.append(BatchResult(path, count, error))
+            count += 1
+    return RecordArray(record_type, count, data=data), failed
@@ -1,32 +1,61 @@
 """Elf Handler Class."""
 
+from collections.abc import Iterator
 from functools import cached_property
 
+from ....constants import _PARAMS
+from ....types.collections._collection import members
+from ....types.collections.record_array import RecordArray
 from ..._data_handler import _DataHandler
+from ..._entry_table import _EntryTable
+from .dyn_entry import DynEntry32, DynEntry64, DynTag
 from .elf_hdr import ElfHdr32, ElfHdr64
+from .note_hdr import NoteHdr32, NoteHdr64
 from .pentry import PEntry32, PEntry64
+from .rel_entry import RelEntry32, RelEntry64
+from .rela_entry import RelAEntry32, RelAEntry64
 from .sentry import SEntry32, SEntry64
+from .shdr import SHdrType
+from .sym_entry import SymEntry32, SymEntry64
+from .symbol_table import SymbolTable, _cstring
 
 __all__ = [
     "Elf32",
     "Elf64",
 ]
 
+_RelEntryType = type[RelEntry32 | RelEntry64 | RelAEntry32 | RelAEntry64]
+
 
 class Elf(_DataHandler):
     """Elf Executable Handler.
 
-    Handles 32-bit and 64-bit ELFs.
+    Handles 32-bit and 64-bit ELFs. Program, section and symbol tables are indexed
+    lazily, entries are views over the Elf data created on first access.
     """
 
-    def __init__(self, hdr_cls: type[ElfHdr32 | ElfHdr64], data: bytes | bytearray = bytearray(b"")) -> None:
+    _pentry_cls: type[PEntry32 | PEntry64]
+    _sentry_cls: type[SEntry32 | SEntry64]
+    _sym_cls: type[SymEntry32 | SymEntry64]
+    _dyn_cls: type[DynEntry32 | DynEntry64]
+    _rel_cls: type[RelEntry32 | RelEntry64]
+    _rela_cls: type[RelAEntry32 | RelAEntry64]
+    _note_cls: type[NoteHdr32 | NoteHdr64]
+    # r_info symbol index shift and relocation type mask
+    _r_sym_shift: int
+    _r_type_mask: int
+
+    def __init__(
+        self, hdr_cls: type[ElfHdr32 | ElfHdr64], data: bytes | bytearray | memoryview = bytearray(b"")
+    ) -> None:
         """Initialize Elf Handler instance."""
         super().__init__(data)
-        self._hdr = hdr_cls()
         try:
-            self._hdr.attach(memoryview(self._data))  # type: ignore
-        except AttributeError as err:
+            self._hdr: ElfHdr32 | ElfHdr64 = hdr_cls.from_buffer(self._data)  # type: ignore
+        except ValueError as err:
             raise ValueError("Insufficient data") from err
+        self._strtabs: dict[int, bytes] = {}
+        self._symbol_tables: dict[bool, SymbolTable] = {}
 
     def __str__(self) -> str:
         """Return Elf Executable string."""
@@ -72,66 +101,227 @@ class Elf(_DataHandler):
         """Return Elf Section Hdr Offset property."""
         return self.hdr.e_shoff
 
+    @cached_property
+    def program_table(self) -> _EntryTable[PEntry32 | PEntry64]:
+        """Return Elf Program Table."""
+        return _EntryTable(
+            self._pentry_cls,
+            self._data,
+            self.hdr.e_phoff.value,
+            self.hdr.e_phentsize.value,
+            self.hdr.e_phnum.value,
+        )
+
+    @cached_property
+    def section_table(self) -> _EntryTable[SEntry32 | SEntry64]:
+        """Return Elf Section Table."""
+        return _EntryTable(
+            self._sentry_cls,
+            self._data,
+            self.hdr.e_shoff.value,
+            self.hdr.e_shentsize.value,
+            self.hdr.e_shnum.value,
+        )
+
+    @cached_property
+    def section_names(self) -> tuple[str, ...]:
+        """Return the names of all sections, read from the section name string table."""
+        shstrndx = self.hdr.e_shstrndx.value
+        if not 0 < shstrndx < len(self.section_table):
+            return ("",) * len(self.section_table)
+        shstrtab = self._strtab(shstrndx)
+        return tuple(_cstring(shstrtab, section.hdr.sh_name.value) for section in self.section_table)
+
+    @cached_property
+    def _section_index(self) -> dict[str, int]:
+        """Return a section name to section index mapping."""
+        index: dict[str, int] = {}
+        for idx, name in enumerate(self.section_names):
+            if name:
+                index.setdefault(name, idx)
+        return index
+
+    def section_by_name(self, name: str) -> SEntry32 | SEntry64:
+        """Return the first section named name."""
+        return self.section_table[self._section_index[name]]
+
+    def section_data(self, section: SEntry32 | SEntry64) -> memoryview:
+        """Return a view of the section contents."""
+        if int(section.hdr.sh_type) == SHdrType.NOBITS:
+            return self._data[0:0]
+        offset = section.hdr.sh_offset.value
+        size = section.hdr.sh_size.value
+        if offset + size > len(self._data):
+            raise ValueError("Insufficient data")
+        return self._data[offset : offset + size]
+
+    def _strtab(self, idx: int) -> bytes:
+        """Return the contents of a string table section."""
+        if idx not in self._strtabs:
+            self._strtabs[idx] = bytes(self.section_data(self.section_table[idx]))
+        return self._strtabs[idx]
+
+    def symbols(self, dynamic: bool = False) -> SymbolTable:
+        """Return the symbol table, or the dynamic symbol table if dynamic is set.
+
+        An empty table is returned when the Elf has no such table.
+        """
+        if dynamic not in self._symbol_tables:
+            sym_type = SHdrType.DYNSYM if dynamic else SHdrType.SYMTAB
+            for section in self.section_table:
+                if int(section.hdr.sh_type) == sym_type:
+                    entry_size = section.hdr.sh_entsize.value or getattr(self._sym_cls, _PARAMS).get_layout().length
+                    table = SymbolTable(
+                        self._sym_cls,
+                        self._data,
+                        section.hdr.sh_offset.value,
+                        entry_size,
+                        section.hdr.sh_size.value // entry_size,
+                        self._strtab(section.hdr.sh_link.value),
+                    )
+                    break
+            else:
+                table = SymbolTable(self._sym_cls, self._data, 0, 0, 0, b"")
+            self._symbol_tables[dynamic] = table
+        return self._symbol_tables[dynamic]
+
+    def _sections(self, sh_type: SHdrType) -> Iterator[SEntry32 | SEntry64]:
+        """Yield every section of type sh_type."""
+        for section in self.section_table:
+            if int(section.hdr.sh_type) == sh_type:
+                yield section
+
+    def iter_dynamic(self) -> Iterator[DynEntry32 | DynEntry64]:
+        """Yield the dynamic section entries preceding the terminating NULL entry.
+
+        A single entry instance is re-attached to every record, so an entry is only
+        valid until the next one is requested.
+        """
+        for section in self._sections(SHdrType.DYNAMIC):
+            for entry in self._dyn_cls.iter_from(self.section_data(section)):  # type: ignore[union-attr]
+                if int(entry.d_tag) == DynTag.NULL:
+                    return
+                yield entry
+
+    def _relocation_section(self, section: SEntry32 | SEntry64 | str) -> tuple[memoryview, _RelEntryType]:
+        """Return the data and entry type of a relocation section."""
+        if isinstance(section, str):
+            section = self.section_by_name(section)
+        sh_type = int(section.hdr.sh_type)
+        if sh_type == SHdrType.RELA:
+            return self.section_data(section), self._rela_cls
+        if sh_type == SHdrType.REL:
+            return self.section_data(section), self._rel_cls
+        raise ValueError(f"Section is not a relocation section ({section.type})")
+
+    @property
+    def relocation_sections(self) -> list[SEntry32 | SEntry64]:
+        """Return all REL and RELA sections."""
+        return [*self._sections(SHdrType.REL), *self._sections(SHdrType.RELA)]
+
+    def iter_relocations(
+        self, section: SEntry32 | SEntry64 | str
+    ) -> Iterator[RelEntry32 | RelEntry64 | RelAEntry32 | RelAEntry64]:
+        """Yield the entries of a REL or RELA section, given as a section entry or name.
+
+        A single entry instance is re-attached to every record, so an entry is only
+        valid until the next one is requested.
+        """
+        data, rel_cls = self._relocation_section(section)
+        entries: Iterator[RelEntry32 | RelEntry64 | RelAEntry32 | RelAEntry64]
+        entries = rel_cls.iter_from(data)  # type: ignore[union-attr]
+        return entries
+
+    def relocation_array(self, section: SEntry32 | SEntry64 | str) -> RecordArray:
+        """Return a zero-copy record array over a REL or RELA section.
+
+        The NumPy view of the array (`.array`) provides every member as a column.
+        """
+        data, rel_cls = self._relocation_section(section)
+        record_length = getattr(rel_cls, _PARAMS).get_layout().length
+        return RecordArray(rel_cls, len(data) // record_length, data=data)
+
+    def relocation_columns(self, section: SEntry32 | SEntry64 | str) -> dict[str, list[int]]:
+        """Return the members of every entry of a REL or RELA section column wise.
+
+        Entries are decoded with a single compiled struct pass. The r_info symbol index
+        and relocation type are added as the r_sym and r_type columns.
+        """
+        data, rel_cls = self._relocation_section(section)
+        struct = getattr(rel_cls, _PARAMS).get_struct()
+        if len(data) % struct.size:
+            raise ValueError(f"Trailing partial relocation ({len(data) % struct.size} bytes)")
+        names = [member_.name for member_ in members(rel_cls)]
+        values = list(zip(*struct.iter_unpack(data))) or [() for _ in names]
+        columns: dict[str, list[int]] = {name: list(column) for name, column in zip(names, values)}
+        columns["r_sym"] = [info >> self._r_sym_shift for info in columns["r_info"]]
+        columns["r_type"] = [info & self._r_type_mask for info in columns["r_info"]]
+        return columns
+
+    def iter_notes(self) -> Iterator[tuple[NoteHdr32 | NoteHdr64, memoryview, memoryview]]:
+        """Yield the header, name and descriptor of every note in the note sections.
+
+        The name, including its null terminator, and the descriptor are views over the
+        Elf data. A single header instance is re-attached to every note, so a header is
+        only valid until the next note is requested.
+        """
+        hdr = None
+        hdr_length = getattr(self._note_cls, _PARAMS).get_layout().length
+        for section in self._sections(SHdrType.NOTE):
+            data = self.section_data(section)
+            align = 8 if section.hdr.sh_addralign.value == 8 else 4
+            offset = 0
+            while offset + hdr_length <= len(data):
+                if hdr is None:
+                    hdr = self._note_cls.from_buffer(data, offset)  # type: ignore[union-attr]
+                else:
+                    hdr.rebase(data, offset)
+                name_start = offset + hdr_length
+                name_size = hdr.n_namesz.value
+                desc_start = name_start + -(-name_size // align) * align
+                desc_size = hdr.n_descsz.value
+                if desc_start + desc_size > len(data):
+                    raise ValueError("Insufficient data")
+                yield hdr, data[name_start : name_start + name_size], data[desc_start : desc_start + desc_size]
+                offset = desc_start + -(-desc_size // align) * align
+
 
 class Elf32(Elf):
     """32-bit Elf Executable Handler."""
 
-    def __init__(self, elf_data: bytes | bytearray = bytearray(b"")) -> None:
+    _pentry_cls = PEntry32
+    _sentry_cls = SEntry32
+    _sym_cls = SymEntry32
+    _dyn_cls = DynEntry32
+    _rel_cls = RelEntry32
+    _rela_cls = RelAEntry32
+    _note_cls = NoteHdr32
+    _r_sym_shift = 8
+    _r_type_mask = 0xFF
+
+    def __init__(self, elf_data: bytes | bytearray | memoryview = bytearray(b"")) -> None:
         """Initialize 32-bit Elf Handler instance."""
         super().__init__(ElfHdr32, elf_data)
 
-    @cached_property
-    def pogram_table(self) -> list[PEntry32]:
-        """Returns Elf32 Program Table."""
-        table: list[PEntry32] = []
-        start = self.hdr.e_phoff.value
-        entry_size = self.hdr.e_phentsize.value
-        for _ in range(self.hdr.e_phnum):
-            p_entry = PEntry32(self.data[start : start + entry_size])
-            table.append(p_entry)
-            start += entry_size
-        return table
-
-    @cached_property
-    def section_table(self) -> list[SEntry32]:
-        """Returns Elf32 Section Table."""
-        table: list[SEntry32] = []
-        start = self.hdr.e_shoff.value
-        entry_size = self.hdr.e_shentsize.value
-        for _ in range(self.hdr.e_shnum):
-            s_hdr = SEntry32(self.data[start : start + entry_size])
-            table.append(s_hdr)
-            start += entry_size
-        return table
+    @property
+    def pogram_table(self) -> _EntryTable[PEntry32 | PEntry64]:
+        """Return Elf32 Program Table, kept for backwards compatibility."""
+        return self.program_table
 
 
 class Elf64(Elf):
     """64-bit Elf Executable Handler."""
 
-    def __init__(self, elf_data: bytes | bytearray = bytearray(b"")) -> None:
+    _pentry_cls = PEntry64
+    _sentry_cls = SEntry64
+    _sym_cls = SymEntry64
+    _dyn_cls = DynEntry64
+    _rel_cls = RelEntry64
+    _rela_cls = RelAEntry64
+    _note_cls = NoteHdr64
+    _r_sym_shift = 32
+    _r_type_mask = 0xFFFFFFFF
+
+    def __init__(self, elf_data: bytes | bytearray | memoryview = bytearray(b"")) -> None:
         """Initialize 64-bit Elf Handler instance."""
         super().__init__(ElfHdr64, elf_data)
-
-    @cached_property
-    def program_table(self) -> list[PEntry64]:
-        """Returns Elf64 Program Table."""
-        table: list[PEntry64] = []
-        start = self.hdr.e_phoff.value
-        entry_size = self.hdr.e_phentsize.value
-        for _ in range(self.hdr.e_phnum):
-            p_entry = PEntry64(self.data[start : start + entry_size])
-            table.append(p_entry)
-            start += entry_size
-        return table
-
-    @cached_property
-    def section_table(self) -> list[SEntry64]:
-        """Returns Elf64 Section Table."""
-        table: list[SEntry64] = []
-        start = self.hdr.e_shoff.value
-        entry_size = self.hdr.e_shentsize.value
-        for _ in range(self.hdr.e_shnum):
-            s_hdr = SEntry64(self.data[start : start + entry_size])
-            table.append(s_hdr)
-            start += entry_size
-        return table
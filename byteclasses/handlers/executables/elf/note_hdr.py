@@ -8,7 +8,7 @@ from enum import IntEnum
 
 from ....types.collections import member, structure
 from ....types.primitives.byte_enum import ByteEnum
-from ....types.primitives.integers import UInt32, UInt64
+from ....types.primitives.integers import UInt32
 
 __all__ = [
     "NoteHdr32",
@@ -28,11 +28,14 @@ class NoteHdr32:
 
 @structure
 class NoteHdr64:
-    """64-bit Elf Note Header."""
+    """64-bit Elf Note Header.
 
-    n_namesz: UInt64
-    n_descsz: UInt64
-    n_type: ByteEnum = member(factory=lambda byte_order: ByteEnum(NoteType, UInt64, byte_order=byte_order))
+    Elf64 note header fields are 32-bit words, matching the 32-bit header.
+    """
+
+    n_namesz: UInt32
+    n_descsz: UInt32
+    n_type: ByteEnum = member(factory=lambda byte_order: ByteEnum(NoteType, UInt32, byte_order=byte_order))
 
 
 class NoteType(IntEnum):
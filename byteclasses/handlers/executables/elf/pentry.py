@@ -12,13 +12,12 @@ __all__ = [
 class PEntry(_DataHandler):
     """Elf Program Table Entry Handler."""
 
-    def __init__(self, hdr_cls: type[PHdr32 | PHdr64], data: bytes | bytearray = bytearray(b"")) -> None:
+    def __init__(self, hdr_cls: type[PHdr32 | PHdr64], data: bytes | bytearray | memoryview = bytearray(b"")) -> None:
         """Initialize PEntry Handler instance."""
         super().__init__(data)
-        self._hdr = hdr_cls()
         try:
-            self._hdr.attach(memoryview(self._data))  # type: ignore
-        except AttributeError as err:
+            self._hdr: PHdr32 | PHdr64 = hdr_cls.from_buffer(self._data)  # type: ignore
+        except ValueError as err:
             raise ValueError("Insufficient data") from err
 
     def __str__(self) -> str:
@@ -71,7 +70,7 @@ class PEntry(_DataHandler):
 class PEntry32(PEntry):
     """32-bit PEntry Handler."""
 
-    def __init__(self, data: bytes | bytearray = bytearray(b"")) -> None:
+    def __init__(self, data: bytes | bytearray | memoryview = bytearray(b"")) -> None:
         """Initialize 32-bit PEntry Handler instance."""
         super().__init__(PHdr32, data)
 
@@ -79,6 +78,6 @@ class PEntry32(PEntry):
 class PEntry64(PEntry):
     """64-bit PEntry Handler."""
 
-    def __init__(self, data: bytes | bytearray = bytearray(b"")) -> None:
+    def __init__(self, data: bytes | bytearray | memoryview = bytearray(b"")) -> None:
         """Initialize 64-bit PEntry Handler instance."""
         super().__init__(PHdr64, data)
@@ -25,7 +25,7 @@ class PBitField32(BitField32):
     read = BitPos(2)  # 0x4
 
 
-@structure
+@structure(lazy=True)
 class PHdr32:
     """32-bit Elf Program Header."""
 
@@ -39,7 +39,7 @@ class PHdr32:
     p_align: UInt32
 
 
-@structure
+@structure(lazy=True)
 class PHdr64:
     """64-bit Elf Program Header."""
 
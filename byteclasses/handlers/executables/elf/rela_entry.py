@@ -5,7 +5,7 @@
 """
 
 from ....types.collections import structure
-from ....types.primitives.integers import UInt32, UInt64
+from ....types.primitives.integers import Int32, Int64, UInt32, UInt64
 
 __all__ = [
     "RelAEntry32",
@@ -19,7 +19,7 @@ class RelAEntry32:
 
     r_offset: UInt32
     r_info: UInt32
-    r_addend: UInt32
+    r_addend: Int32
 
 
 @structure
@@ -28,4 +28,4 @@ class RelAEntry64:
 
     r_offset: UInt64
     r_info: UInt64
-    r_addend: UInt32
+    r_addend: Int64
@@ -12,13 +12,12 @@ __all__ = [
 class SEntry(_DataHandler):
     """Elf Section Table Entry Handler."""
 
-    def __init__(self, hdr_cls: type[SHdr32 | SHdr64], data: bytes | bytearray = bytearray(b"")) -> None:
+    def __init__(self, hdr_cls: type[SHdr32 | SHdr64], data: bytes | bytearray | memoryview = bytearray(b"")) -> None:
         """Initialize SEntry Handler instance."""
         super().__init__(data)
-        self._hdr = hdr_cls()
         try:
-            self._hdr.attach(memoryview(self._data))  # type: ignore
-        except AttributeError as err:
+            self._hdr: SHdr32 | SHdr64 = hdr_cls.from_buffer(self._data)  # type: ignore
+        except ValueError as err:
             raise ValueError("Insufficient data") from err
 
     def __str__(self) -> str:
@@ -92,7 +91,7 @@ class SEntry(_DataHandler):
 class SEntry32(SEntry):
     """32-bit SEntry Handler."""
 
-    def __init__(self, data: bytes | bytearray = bytearray(b"")) -> None:
+    def __init__(self, data: bytes | bytearray | memoryview = bytearray(b"")) -> None:
         """Initialize 32-bit SEntry Handler instance."""
         super().__init__(SHdr32, data)
 
@@ -100,6 +99,6 @@ class SEntry32(SEntry):
 class SEntry64(SEntry):
     """64-bit SEntry Handler."""
 
-    def __init__(self, data: bytes | bytearray = bytearray(b"")) -> None:
+    def __init__(self, data: bytes | bytearray | memoryview = bytearray(b"")) -> None:
         """Initialize 64-bit SEntry Handler instance."""
         super().__init__(SHdr64, data)
@@ -37,7 +37,7 @@ class SBitField64(SBitField32):
     byte_length = 8
 
 
-@structure
+@structure(lazy=True)
 class SHdr32:
     """32-bit Elf Section Header."""
 
@@ -53,7 +53,7 @@ class SHdr32:
     sh_entsize: UInt32
 
 
-@structure
+@structure(lazy=True)
 class SHdr64:
     """64-bit Elf Section Header."""
 
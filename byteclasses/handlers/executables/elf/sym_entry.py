@@ -14,7 +14,7 @@ __all__ = [
 ]
 
 
-@structure
+@structure(lazy=True)
 class SymEntry32:
     """32-bit Elf Symbol Entry."""
 
@@ -26,7 +26,7 @@ class SymEntry32:
     st_shndx: UInt16
 
 
-@structure
+@structure(lazy=True)
 class SymEntry64:
     """64-bit Elf Symbol."""
 
@@ -0,0 +1,104 @@
+"""Elf Symbol Table.
+
+[ELF Specification](https://www.man7.org/linux/man-pages/man5/elf.5.html)
+"""
+
+from bisect import bisect_right
+
+from ....types.collections._collection import members
+from ..._entry_table import _EntryTable
+from .sym_entry import SymEntry32, SymEntry64
+
+__all__ = [
+    "SymbolTable",
+]
+
+
+def _cstring(table: bytes, offset: int) -> str:
+    """Return the null terminated string at offset in a string table."""
+    if not 0 <= offset < len(table):
+        return ""
+    end = table.find(b"\x00", offset)
+    if end < 0:
+        end = len(table)
+    return table[offset:end].decode("utf-8", "replace")
+
+
+class SymbolTable(_EntryTable[SymEntry32 | SymEntry64]):
+    """Elf Symbol Table.
+
+    Symbols are SymEntry32/SymEntry64 views over the Elf data. The name and address
+    indexes are built on first lookup by decoding every symbol with the compiled
+    structure format.
+    """
+
+    def __init__(
+        self,
+        sym_cls: type[SymEntry32 | SymEntry64],
+        data: memoryview,
+        offset: int,
+        entry_size: int,
+        count: int,
+        strtab: bytes,
+    ) -> None:
+        """Initialize symbol table instance."""
+        super().__init__(sym_cls.from_buffer, data, offset, entry_size, count)  # type: ignore[union-attr]
+        self._sym_cls = sym_cls
+        self._strtab = strtab
+        self._names: tuple[str, ...] | None = None
+        self._name_index: dict[str, int] | None = None
+        self._address_index: tuple[list[int], list[tuple[int, int, int]], list[int]] | None = None
+
+    def _decode(self) -> list[tuple]:
+        """Return the decoded member values of every symbol."""
+        unpack_from = self._sym_cls.unpack_from  # type: ignore[union-attr]
+        return [unpack_from(self._data, self._offset + idx * self._entry_size) for idx in range(len(self))]
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Return the names of all symbols."""
+        if self._names is None:
+            name_pos = [member_.name for member_ in members(self._sym_cls)].index("st_name")
+            self._names = tuple(_cstring(self._strtab, fields[name_pos]) for fields in self._decode())
+        return self._names
+
+    def name(self, idx: int) -> str:
+        """Return the name of the symbol at idx."""
+        return self.names[idx]
+
+    def by_name(self, name: str) -> SymEntry32 | SymEntry64:
+        """Return the first symbol named name."""
+        if self._name_index is None:
+            index: dict[str, int] = {}
+            for idx, sym_name in enumerate(self.names):
+                if sym_name:
+                    index.setdefault(sym_name, idx)
+            self._name_index = index
+        return self[self._name_index[name]]
+
+    def by_address(self, address: int) -> SymEntry32 | SymEntry64 | None:
+        """Return the closest preceding symbol containing address, if any.
+
+        Symbols without a size only match their exact address.
+        """
+        if self._address_index is None:
+            field_names = [member_.name for member_ in members(self._sym_cls)]
+            value_pos, size_pos = field_names.index("st_value"), field_names.index("st_size")
+            symbols = sorted(
+                (fields[value_pos], fields[value_pos] + max(fields[size_pos], 1), idx)
+                for idx, fields in enumerate(self._decode())
+                if fields[value_pos]
+            )
+            # Running maximum of symbol end addresses, bounds the backwards search
+            max_ends: list[int] = []
+            for _, end, _ in symbols:
+                max_ends.append(max(end, max_ends[-1]) if max_ends else end)
+            self._address_index = ([start for start, _, _ in symbols], symbols, max_ends)
+        starts, symbols, max_ends = self._address_index
+        pos = bisect_right(starts, address) - 1
+        while pos >= 0 and max_ends[pos] > address:
+            _, end, idx = symbols[pos]
+            if address < end:
+                return self[idx]
+            pos -= 1
+        return None
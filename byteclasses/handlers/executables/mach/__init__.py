@@ -1,5 +1,27 @@
 """MacOS Executable Handler Module."""
 
-from .mach import Mach32, Mach64, MachHdr32, MachHdr64
+from .fat import Fat, FatArch32, FatArch64, FatHdr
+from .load_command import LoadCmdType, LoadCommand
+from .mach import Mach32, Mach64, MachHdr32, MachHdr64, Segment
+from .section import Section32, Section64
+from .seg_cmd import SegCmd32, SegCmd64
+from .uuid_cmd import UUIDCmd
 
-__all__ = ["Mach32", "MachHdr32", "Mach64", "MachHdr64"]
+__all__ = [
+    "Fat",
+    "FatArch32",
+    "FatArch64",
+    "FatHdr",
+    "LoadCmdType",
+    "LoadCommand",
+    "Mach32",
+    "MachHdr32",
+    "Mach64",
+    "MachHdr64",
+    "Section32",
+    "Section64",
+    "SegCmd32",
+    "SegCmd64",
+    "Segment",
+    "UUIDCmd",
+]
@@ -0,0 +1,158 @@
+"""Mach-O Fat (Universal) Binary Handler Class.
+
+[OS X ABI Mach-O File Format Reference](https://github.com/aidansteele/osx-abi-macho-file-format-reference)
+"""
+
+from collections.abc import Iterator
+from functools import cached_property
+
+from ...._enums import ByteOrder
+from ....constants import _PARAMS
+from ....types.collections import structure
+from ....types.primitives.generics import DWord
+from ....types.primitives.integers import Int32, UInt32, UInt64
+from ..._data_handler import _DataHandler
+from ..._entry_table import _EntryTable
+from .mach import Mach32, Mach64
+from .mach_hdr import MH_MAGIC32, MH_MAGIC64, CPUType
+
+__all__ = [
+    "Fat",
+    "FatArch32",
+    "FatArch64",
+    "FatHdr",
+    "FAT_MAGIC32",
+    "FAT_MAGIC64",
+]
+
+FAT_MAGIC32 = b"\xca\xfe\xba\xbe"  # 0xCAFEBABE
+FAT_MAGIC64 = b"\xca\xfe\xba\xbf"  # 0xCAFEBABF
+
+
+@structure(byte_order=ByteOrder.BE, packed=True)
+class FatHdr:
+    """Mach-O Fat Header."""
+
+    magic: DWord
+    nfat_arch: UInt32
+
+
+@structure(byte_order=ByteOrder.BE, packed=True, lazy=True)
+class FatArch32:
+    """Mach-O Fat Architecture."""
+
+    cputype: Int32
+    cpusubtype: Int32
+    fileoff: UInt32
+    size: UInt32
+    align: UInt32
+
+
+@structure(byte_order=ByteOrder.BE, packed=True, lazy=True)
+class FatArch64:
+    """Mach-O 64-bit Fat Architecture."""
+
+    cputype: Int32
+    cpusubtype: Int32
+    fileoff: UInt64
+    size: UInt64
+    align: UInt32
+    reserved: UInt32
+
+
+class Fat(_DataHandler):
+    """Mach-O Fat Binary Handler.
+
+    Architecture slices are views over the fat binary data, the Mach-O handler of a
+    slice is created on first access.
+    """
+
+    def __init__(self, data: bytes | bytearray | memoryview = bytearray(b"")) -> None:
+        """Initialize Fat Binary Handler instance."""
+        super().__init__(data)
+        try:
+            self._hdr: FatHdr = FatHdr.from_buffer(self._data)  # type: ignore[attr-defined]
+        except ValueError as err:
+            raise ValueError("Insufficient data") from err
+        magic = self._hdr.magic.data
+        if magic == FAT_MAGIC32:
+            self._arch_cls: type[FatArch32 | FatArch64] = FatArch32
+        elif magic == FAT_MAGIC64:
+            self._arch_cls = FatArch64
+        else:
+            raise ValueError(f"Invalid fat binary magic ({magic!r})")
+        self._archs: list[Mach32 | Mach64 | None] = [None] * self._hdr.nfat_arch.value
+
+    def __str__(self) -> str:
+        """Return Fat Binary string."""
+        return f"{self.__class__.__name__}(magic={self.magic}, archs={len(self.arch_table)})"
+
+    @property
+    def hdr(self) -> FatHdr:
+        """Return fat header."""
+        return self._hdr
+
+    @property
+    def magic(self) -> str:
+        """Return fat binary Magic property."""
+        return str(self.hdr.magic.data)
+
+    @cached_property
+    def arch_table(self) -> _EntryTable[FatArch32 | FatArch64]:
+        """Return fat binary architecture table."""
+        return _EntryTable(
+            self._arch_cls.from_buffer,  # type: ignore[union-attr]
+            self._data,
+            getattr(FatHdr, _PARAMS).get_layout().length,
+            getattr(self._arch_cls, _PARAMS).get_layout().length,
+            len(self._archs),
+        )
+
+    @property
+    def cpu_types(self) -> list[str]:
+        """Return the CPU type of every architecture slice."""
+        types = []
+        for arch in self.arch_table:
+            try:
+                types.append(CPUType(arch.cputype.value).name)
+            except ValueError:
+                types.append(hex(arch.cputype.value))
+        return types
+
+    def arch_data(self, idx: int) -> memoryview:
+        """Return a view of the architecture slice at idx."""
+        arch = self.arch_table[idx]
+        offset = arch.fileoff.value
+        size = arch.size.value
+        if offset + size > len(self._data):
+            raise ValueError("Insufficient data")
+        return self._data[offset : offset + size]
+
+    def arch(self, idx: int) -> Mach32 | Mach64:
+        """Return the Mach-O handler of the architecture slice at idx."""
+        if idx < 0:
+            idx += len(self._archs)
+        handler = self._archs[idx]
+        if handler is None:
+            data = self.arch_data(idx)
+            magic = bytes(data[:4])
+            if magic == MH_MAGIC64:
+                handler = Mach64(data)
+            elif magic == MH_MAGIC32:
+                handler = Mach32(data)
+            else:
+                raise ValueError(f"Unsupported Mach-O magic ({magic!r}) in slice {idx}")
+            self._archs[idx] = handler
+        return handler
+
+    def arch_for(self, cpu_type: CPUType | int) -> Mach32 | Mach64:
+        """Return the Mach-O handler of the first architecture slice for cpu_type."""
+        for idx, arch in enumerate(self.arch_table):
+            if arch.cputype.value == cpu_type:
+                return self.arch(idx)
+        raise KeyError(cpu_type)
+
+    def iter_archs(self) -> Iterator[Mach32 | Mach64]:
+        """Yield the Mach-O handler of every architecture slice."""
+        for idx in range(len(self._archs)):
+            yield self.arch(idx)
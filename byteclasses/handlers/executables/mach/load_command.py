@@ -1,12 +1,64 @@
-"""Mach-O Load Command Module."""
+"""Mach-O Load Command Module.
+
+[llvm::MachO Namespace Reference](https://llvm.org/doxygen/namespacellvm_1_1MachO.html)
+"""
+
+from enum import IntEnum
 
 from ....types.collections import structure
 from ....types.primitives.integers import UInt32
 
-__all__ = ["LoadCommand"]
+__all__ = ["LoadCommand", "LoadCmdType"]
+
+LC_REQ_DYLD = 0x80000000
+
+
+class LoadCmdType(IntEnum):
+    """Mach-O Load Command Types."""
+
+    SEGMENT = 0x1
+    SYMTAB = 0x2
+    SYMSEG = 0x3
+    THREAD = 0x4
+    UNIXTHREAD = 0x5
+    DYSYMTAB = 0xB
+    LOAD_DYLIB = 0xC
+    ID_DYLIB = 0xD
+    LOAD_DYLINKER = 0xE
+    ID_DYLINKER = 0xF
+    ROUTINES = 0x11
+    SUB_FRAMEWORK = 0x12
+    TWOLEVEL_HINTS = 0x16
+    LOAD_WEAK_DYLIB = 0x18 | LC_REQ_DYLD
+    SEGMENT_64 = 0x19
+    ROUTINES_64 = 0x1A
+    UUID = 0x1B
+    RPATH = 0x1C | LC_REQ_DYLD
+    CODE_SIGNATURE = 0x1D
+    SEGMENT_SPLIT_INFO = 0x1E
+    REEXPORT_DYLIB = 0x1F | LC_REQ_DYLD
+    ENCRYPTION_INFO = 0x21
+    DYLD_INFO = 0x22
+    DYLD_INFO_ONLY = 0x22 | LC_REQ_DYLD
+    VERSION_MIN_MACOSX = 0x24
+    VERSION_MIN_IPHONEOS = 0x25
+    FUNCTION_STARTS = 0x26
+    DYLD_ENVIRONMENT = 0x27
+    MAIN = 0x28 | LC_REQ_DYLD
+    DATA_IN_CODE = 0x29
+    SOURCE_VERSION = 0x2A
+    DYLIB_CODE_SIGN_DRS = 0x2B
+    ENCRYPTION_INFO_64 = 0x2C
+    LINKER_OPTION = 0x2D
+    VERSION_MIN_TVOS = 0x2F
+    VERSION_MIN_WATCHOS = 0x30
+    NOTE = 0x31
+    BUILD_VERSION = 0x32
+    DYLD_EXPORTS_TRIE = 0x33 | LC_REQ_DYLD
+    DYLD_CHAINED_FIXUPS = 0x34 | LC_REQ_DYLD
 
 
-@structure
+@structure(packed=True, lazy=True)
 class LoadCommand:
     """Mach-O Load Command."""
 
@@ -1,27 +1,60 @@
 """Pre-defined MacOS Executable Handler Class."""
 
+from collections.abc import Iterator
+from functools import cached_property
+from typing import Any, NamedTuple
+from uuid import UUID
+
+from ....constants import _PARAMS
 from ..._data_handler import _DataHandler
+from ..._entry_table import _EntryTable
+from .load_command import LoadCmdType, LoadCommand
 from .mach_hdr import CPU_MAP, CPUType, MachHdr32, MachHdr64
+from .section import Section32, Section64
+from .seg_cmd import SegCmd32, SegCmd64
+from .uuid_cmd import UUIDCmd
 
 __all__ = [
     "Mach32",
     "Mach64",
+    "Segment",
 ]
 
+_LOAD_CMD_LENGTH = 8
+
+# Load command structures by command type, other commands are returned as a LoadCommand
+_CMD_TYPES: dict[int, Any] = {
+    LoadCmdType.SEGMENT: SegCmd32,
+    LoadCmdType.SEGMENT_64: SegCmd64,
+    LoadCmdType.UUID: UUIDCmd,
+}
+
+
+class Segment(NamedTuple):
+    """Mach-O segment command and its section table."""
+
+    cmd: SegCmd32 | SegCmd64
+    sections: _EntryTable[Section32 | Section64]
+
 
 class Mach(_DataHandler):
     """Mach-O Executable Handler.
 
-    Handles 32-bit and 64-bit Mach-Os.
+    Handles 32-bit and 64-bit Mach-Os. Load commands are walked in place, segment and
+    section tables are views over the Mach-O data.
     """
 
-    def __init__(self, hdr_cls: type[MachHdr32 | MachHdr64], data: bytes | bytearray = bytearray(b"")) -> None:
+    _seg_cmd: LoadCmdType
+    _sect_cls: type[Section32 | Section64]
+
+    def __init__(
+        self, hdr_cls: type[MachHdr32 | MachHdr64], data: bytes | bytearray | memoryview = bytearray(b"")
+    ) -> None:
         """Initialize Mach-O Handler instance."""
         super().__init__(data)
-        self._hdr = hdr_cls()
         try:
-            self._hdr.attach(memoryview(self._data))  # type: ignore
-        except AttributeError as err:
+            self._hdr: MachHdr32 | MachHdr64 = hdr_cls.from_buffer(self._data)  # type: ignore
+        except ValueError as err:
             raise ValueError("Insufficient data") from err
 
     def __str__(self) -> str:
@@ -75,18 +108,106 @@ class Mach(_DataHandler):
         """Return Mach-O flags property."""
         return self.hdr.flags.flags
 
+    def _iter_cmd_offsets(self) -> Iterator[tuple[int, int, int]]:
+        """Yield the offset, type and size of every load command.
+
+        A single load command header is re-attached to every command.
+        """
+        offset = getattr(type(self.hdr), _PARAMS).get_layout().length
+        end = offset + self.hdr.sizeofcmds.value
+        if end > len(self._data):
+            raise ValueError("Insufficient data")
+        lcmd = None
+        for _ in range(self.hdr.ncmds.value):
+            if offset + _LOAD_CMD_LENGTH > end:
+                raise ValueError("Load commands exceed sizeofcmds")
+            if lcmd is None:
+                lcmd = LoadCommand.from_buffer(self._data, offset)  # type: ignore[attr-defined]
+            else:
+                lcmd.rebase(self._data, offset)
+            cmdsize = lcmd.cmdsize.value
+            if cmdsize < _LOAD_CMD_LENGTH or offset + cmdsize > end:
+                raise ValueError(f"Invalid load command size ({cmdsize}) at offset {offset}")
+            yield offset, lcmd.cmd.value, cmdsize
+            offset += cmdsize
+
+    def iter_load_commands(self) -> Iterator[Any]:
+        """Yield every load command as its command structure.
+
+        Segment and UUID commands are returned as SegCmd32, SegCmd64 or UUIDCmd, any other
+        command as a LoadCommand header. A single instance of each structure is
+        re-attached to every command, so a command is only valid until the next one is
+        requested.
+        """
+        cmds: dict[int, Any] = {}
+        for offset, cmd_type, cmdsize in self._iter_cmd_offsets():
+            cmd_cls = _CMD_TYPES.get(cmd_type, LoadCommand)
+            cmd = cmds.get(cmd_type)
+            if cmd is not None:
+                cmd.rebase(self._data, offset)
+            elif getattr(cmd_cls, _PARAMS).get_layout().length > cmdsize:
+                raise ValueError(f"Invalid load command size ({cmdsize}) at offset {offset}")
+            else:
+                cmd = cmds[cmd_type] = cmd_cls.from_buffer(self._data, offset)
+            yield cmd
+
+    @cached_property
+    def segments(self) -> tuple[Segment, ...]:
+        """Return the segment commands and their section tables."""
+        seg_cls = _CMD_TYPES[self._seg_cmd]
+        seg_length = getattr(seg_cls, _PARAMS).get_layout().length
+        sect_length = getattr(self._sect_cls, _PARAMS).get_layout().length
+        segments = []
+        for offset, cmd_type, cmdsize in self._iter_cmd_offsets():
+            if cmd_type != self._seg_cmd:
+                continue
+            if seg_length > cmdsize:
+                raise ValueError(f"Invalid load command size ({cmdsize}) at offset {offset}")
+            seg = seg_cls.from_buffer(self._data, offset)
+            nsects = seg.nsects.value
+            if seg_length + nsects * sect_length > cmdsize:
+                raise ValueError(f"Segment sections exceed load command size at offset {offset}")
+            sections = _EntryTable(
+                self._sect_cls.from_buffer, self._data, offset + seg_length, sect_length, nsects  # type: ignore
+            )
+            segments.append(Segment(seg, sections))
+        return tuple(segments)
+
+    def segment_by_name(self, name: str) -> Segment:
+        """Return the segment named name."""
+        for segment in self.segments:
+            if segment.cmd.segname.value == name:
+                return segment
+        raise KeyError(name)
+
+    @cached_property
+    def uuid(self) -> UUID | None:
+        """Return the UUID of the Mach-O, if any."""
+        for offset, cmd_type, cmdsize in self._iter_cmd_offsets():
+            if cmd_type == LoadCmdType.UUID:
+                if cmdsize < 24:
+                    raise ValueError(f"Invalid load command size ({cmdsize}) at offset {offset}")
+                return UUID(bytes=bytes(self._data[offset + 8 : offset + 24]))
+        return None
+
 
 class Mach32(Mach):
     """32-bit Mach-O Executable Handler."""
 
-    def __init__(self, data: bytes | bytearray = bytearray(b"")) -> None:
+    _seg_cmd = LoadCmdType.SEGMENT
+    _sect_cls = Section32
+
+    def __init__(self, data: bytes | bytearray | memoryview = bytearray(b"")) -> None:
         """Initialize 32-bit Mach-O Handler instance."""
         super().__init__(MachHdr32, data)
 
 
 class Mach64(Mach):
-    """64-bit Elf Executable Handler."""
+    """64-bit Mach-O Executable Handler."""
+
+    _seg_cmd = LoadCmdType.SEGMENT_64
+    _sect_cls = Section64
 
-    def __init__(self, data: bytes | bytearray = bytearray(b"")) -> None:
+    def __init__(self, data: bytes | bytearray | memoryview = bytearray(b"")) -> None:
         """Initialize 64-bit Mach-O Handler instance."""
         super().__init__(MachHdr64, data)
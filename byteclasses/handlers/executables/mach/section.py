@@ -17,7 +17,7 @@ class SecFlags32(BitField32):
     """Mach-O Section Flags 32-bit BitField."""
 
 
-@structure
+@structure(packed=True, lazy=True)
 class Section32:
     """Mach-O 32-bit Section.
 
@@ -28,7 +28,7 @@ class Section32:
     segname: String = member(factory=lambda byte_order: String(16))  # type: ignore
     addr: Ptr32
     size: UInt32
-    offset: Ptr32
+    fileoff: Ptr32
     align: UInt32
     reloff: UInt32
     nreloc: UInt32
@@ -37,7 +37,7 @@ class Section32:
     reserved2: UInt32
 
 
-@structure
+@structure(packed=True, lazy=True)
 class Section64:
     """Mach-O 64-bit Section.
 
@@ -48,7 +48,7 @@ class Section64:
     segname: String = member(factory=lambda byte_order: String(16))  # type: ignore
     addr: Ptr64
     size: UInt64
-    offset: Ptr32
+    fileoff: Ptr32
     align: UInt32
     reloff: UInt32
     nreloc: UInt32
@@ -14,7 +14,7 @@ class SegFlags32(BitField32):
     """Mach-O Segment Flags 32-bit BitField."""
 
 
-@structure
+@structure(packed=True, lazy=True)
 class SegCmd32:
     """Mach-O 32-bit Segment Command."""
 
@@ -31,7 +31,7 @@ class SegCmd32:
     flags: SegFlags32
 
 
-@structure
+@structure(packed=True, lazy=True)
 class SegCmd64:
     """Mach-O 64-bit Segment Command."""
 
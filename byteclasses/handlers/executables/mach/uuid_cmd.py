@@ -5,15 +5,15 @@
 """
 
 from ....types.collections import ByteArray, member, structure
-from ....types.primitives.integers import Ptr32, UInt32
+from ....types.primitives.integers import UInt32
 
 __all__ = ["UUIDCmd"]
 
 
-@structure
+@structure(packed=True, lazy=True)
 class UUIDCmd:
     """Mach-O UUID Command."""
 
-    cmd: Ptr32
+    cmd: UInt32
     cmdsize: UInt32
     uuid: ByteArray = member(factory=lambda byte_order: ByteArray(16))  # type: ignore
@@ -3,13 +3,32 @@
 [PE Formats](https://github.com/hasherezade/bearparser/blob/master/parser/include/bearparser/pe/pe_formats.h)
 """
 
-from .data_dir import DataDir
+from .data_dir import DataDir, DirEntry
 from .dos_hdr import DOSHdr
+from .export_dir import ExportDir
 from .file_hdr import FileHdr
+from .import_desc import ImportDesc
 from .nt_hdr32 import NTHdr32
 from .nt_hdr64 import NTHdr64
 from .opt_hdr32 import OptHdr32
 from .opt_hdr64 import OptHdr64
-from .pe import PE32
+from .pe import PE32, PE64, Export, Import
+from .section_hdr import SectionHdr
 
-__all__ = ["DataDir", "DOSHdr", "FileHdr", "NTHdr32", "NTHdr64", "OptHdr32", "OptHdr64", "PE32"]
+__all__ = [
+    "DataDir",
+    "DirEntry",
+    "DOSHdr",
+    "Export",
+    "ExportDir",
+    "FileHdr",
+    "Import",
+    "ImportDesc",
+    "NTHdr32",
+    "NTHdr64",
+    "OptHdr32",
+    "OptHdr64",
+    "PE32",
+    "PE64",
+    "SectionHdr",
+]
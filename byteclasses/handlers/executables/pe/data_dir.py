@@ -1,13 +1,36 @@
 """PE Data Directory Class."""
 
+from enum import IntEnum
+
 from ....types.collections import structure
 from ....types.primitives.integers import Ptr32, UInt32
 
 __all__ = [
     "DataDir",
+    "DirEntry",
 ]
 
 
+class DirEntry(IntEnum):
+    """PE Data Directory Entries."""
+
+    EXPORT = 0
+    IMPORT = 1
+    RESOURCE = 2
+    EXCEPTION = 3
+    SECURITY = 4
+    BASERELOC = 5
+    DEBUG = 6
+    ARCHITECTURE = 7
+    GLOBALPTR = 8
+    TLS = 9
+    LOAD_CONFIG = 10
+    BOUND_IMPORT = 11
+    IAT = 12
+    DELAY_IMPORT = 13
+    COM_DESCRIPTOR = 14
+
+
 @structure
 class DataDir:
     """PE Data Directory Class."""
@@ -0,0 +1,42 @@
+"""PE Export Directory Class.
+
+length: 40 bytes
+
+typedef struct _IMAGE_EXPORT_DIRECTORY {
+    DWORD   Characteristics;
+    DWORD   TimeDateStamp;
+    WORD    MajorVersion;
+    WORD    MinorVersion;
+    DWORD   Name;
+    DWORD   Base;
+    DWORD   NumberOfFunctions;
+    DWORD   NumberOfNames;
+    DWORD   AddressOfFunctions;
+    DWORD   AddressOfNames;
+    DWORD   AddressOfNameOrdinals;
+} IMAGE_EXPORT_DIRECTORY, *PIMAGE_EXPORT_DIRECTORY;
+"""
+
+from ....types.collections import structure
+from ....types.primitives.integers import Ptr32, UInt16, UInt32
+
+__all__ = [
+    "ExportDir",
+]
+
+
+@structure(packed=True)
+class ExportDir:
+    """PE Export Directory Class."""
+
+    characteristics: UInt32
+    time_datestamp: UInt32
+    major_ver: UInt16
+    minor_ver: UInt16
+    name: Ptr32
+    base: UInt32
+    num_of_funcs: UInt32
+    num_of_names: UInt32
+    addr_of_funcs: Ptr32
+    addr_of_names: Ptr32
+    addr_of_name_ordinals: Ptr32
@@ -0,0 +1,33 @@
+"""PE Import Descriptor Class.
+
+length: 20 bytes
+
+typedef struct _IMAGE_IMPORT_DESCRIPTOR {
+    union {
+        DWORD   Characteristics;
+        DWORD   OriginalFirstThunk;
+    } DUMMYUNIONNAME;
+    DWORD   TimeDateStamp;
+    DWORD   ForwarderChain;
+    DWORD   Name;
+    DWORD   FirstThunk;
+} IMAGE_IMPORT_DESCRIPTOR;
+"""
+
+from ....types.collections import structure
+from ....types.primitives.integers import Ptr32, UInt32
+
+__all__ = [
+    "ImportDesc",
+]
+
+
+@structure(packed=True)
+class ImportDesc:
+    """PE Import Descriptor Class."""
+
+    original_first_thunk: Ptr32
+    time_datestamp: UInt32
+    forwarder_chain: UInt32
+    name: Ptr32
+    first_thunk: Ptr32
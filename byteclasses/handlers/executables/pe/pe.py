@@ -1,32 +1,75 @@
 """Pre-defined Windows Executable Handler Class."""
 
+from bisect import bisect_right
+from collections.abc import Iterator
+from functools import cached_property, lru_cache
+from typing import NamedTuple, cast
+
 from ..._data_handler import _DataHandler
+from ..._entry_table import _EntryTable
+from .data_dir import DataDir, DirEntry
 from .dos_hdr import DOSHdr
+from .export_dir import ExportDir
+from .import_desc import ImportDesc
 from .nt_hdr32 import NTHdr32
 from .nt_hdr64 import NTHdr64
+from .section_hdr import SectionHdr
 
 __all__ = [
     "PE32",
     "PE64",
+    "Export",
+    "Import",
 ]
 
+RVA_CACHE_SIZE = 4096
+
+# Signature and file header preceding the optional header
+_OPT_HDR_OFFSET = 24
+_SECTION_HDR_SIZE = 40
+_IMPORT_DESC_SIZE = 20
+_CSTRING_CHUNK = 256
+
+
+class Import(NamedTuple):
+    """PE imported symbol, imported by name or by ordinal."""
+
+    dll: str
+    name: str | None
+    ordinal: int | None
+    hint: int | None
+    iat_rva: int
+
+
+class Export(NamedTuple):
+    """PE exported symbol, forwarded exports have a forwarder instead of an address."""
+
+    name: str | None
+    ordinal: int
+    rva: int
+    forwarder: str | None
+
 
 class PE(_DataHandler):
     """Windows Executable Handler.
 
-    Handles 32-bit and 64-bit PEs.
+    Handles 32-bit and 64-bit PEs. The section table is a lazily indexed table of views
+    over the PE data. RVAs are translated to file offsets through a sorted index of the
+    section ranges with an LRU cache, imports and exports are parsed incrementally.
     """
 
-    def __init__(self, hdr_cls: type[NTHdr32 | NTHdr64], data: bytes | bytearray = bytearray(b"")) -> None:
+    _thunk_size: int
+    _ordinal_flag: int
+
+    def __init__(self, hdr_cls: type[NTHdr32 | NTHdr64], data: bytes | bytearray | memoryview = bytearray(b"")) -> None:
         """Initialize PE Handler instance."""
         super().__init__(data)
-        self._dos_hdr = DOSHdr()
-        self._hdr = hdr_cls()
         try:
-            self._dos_hdr.attach(memoryview(self._data))  # type: ignore
-            self._hdr.attach(memoryview(self._data[self._dos_hdr.e_lfanew.value :]))  # type: ignore
-        except AttributeError as err:
+            self._dos_hdr: DOSHdr = DOSHdr.from_buffer(self._data)  # type: ignore
+            self._hdr: NTHdr32 | NTHdr64 = hdr_cls.from_buffer(self._data, self._dos_hdr.e_lfanew.value)  # type: ignore
+        except ValueError as err:
             raise ValueError("Insufficient data") from err
+        self._rva_lookup = lru_cache(maxsize=RVA_CACHE_SIZE)(self._rva_to_offset)
 
     def __str__(self) -> str:
         """Return PE Executable string."""
@@ -47,11 +90,170 @@ class PE(_DataHandler):
         """Return PE Magic property."""
         return str(self.dos_hdr.e_magic)
 
+    @cached_property
+    def section_table(self) -> _EntryTable[SectionHdr]:
+        """Return PE Section Table."""
+        file_hdr = self.hdr.file_hdr
+        offset = self.dos_hdr.e_lfanew.value + _OPT_HDR_OFFSET + file_hdr.size_of_opt_hdr.value
+        return _EntryTable(
+            SectionHdr.from_buffer,  # type: ignore[attr-defined]
+            self._data,
+            offset,
+            _SECTION_HDR_SIZE,
+            file_hdr.number_of_sections.value,
+        )
+
+    @cached_property
+    def _section_ranges(self) -> tuple[list[int], list[tuple[int, int, int]]]:
+        """Return the section start RVAs and (end RVA, raw data offset, raw data size) sorted by RVA."""
+        ranges = []
+        for section in self.section_table:
+            start = section.vaddr.value
+            raw_size = section.size_of_raw_data.value
+            end = start + max(section.virtual_size.value, raw_size)
+            ranges.append((start, end, section.ptr_to_raw_data.value, raw_size))
+        ranges.sort()
+        return [start for start, _, _, _ in ranges], [(end, raw, size) for _, end, raw, size in ranges]
+
+    def data_directory(self, entry: DirEntry | int) -> DataDir:
+        """Return a data directory entry."""
+        if entry >= self.hdr.opt_hdr.num_of_rva_and_sizes.value:
+            raise IndexError(f"Data directory entry {entry} not present")
+        return cast(DataDir, self.hdr.opt_hdr.data_directory[int(entry)])
+
+    def rva_to_offset(self, rva: int) -> int:
+        """Return the file offset of a relative virtual address."""
+        return self._rva_lookup(rva)
+
+    def _rva_to_offset(self, rva: int) -> int:
+        """Translate an RVA through the section index."""
+        starts, ranges = self._section_ranges
+        pos = bisect_right(starts, rva) - 1
+        if pos >= 0:
+            end, raw_offset, raw_size = ranges[pos]
+            if rva < end:
+                delta = rva - starts[pos]
+                if delta >= raw_size:
+                    raise ValueError(f"RVA 0x{rva:x} is not backed by file data")
+                return raw_offset + delta
+        if rva < self.hdr.opt_hdr.size_of_hdrs.value:
+            return rva
+        raise ValueError(f"RVA 0x{rva:x} is not mapped by any section")
+
+    def rva_data(self, rva: int, size: int) -> memoryview:
+        """Return a view of size bytes at a relative virtual address."""
+        offset = self.rva_to_offset(rva)
+        if offset + size > len(self._data):
+            raise ValueError("Insufficient data")
+        return self._data[offset : offset + size]
+
+    def _cstring(self, rva: int) -> str:
+        """Return the null terminated string at a relative virtual address."""
+        start = offset = self.rva_to_offset(rva)
+        while offset < len(self._data):
+            chunk = bytes(self._data[offset : offset + _CSTRING_CHUNK])
+            end = chunk.find(b"\x00")
+            if end >= 0:
+                return bytes(self._data[start : offset + end]).decode("utf-8", "replace")
+            offset += len(chunk)
+        raise ValueError("Unterminated string")
+
+    def _thunk(self, rva: int) -> int:
+        """Return the thunk value at a relative virtual address."""
+        return int.from_bytes(self.rva_data(rva, self._thunk_size), "little")
+
+    def iter_import_descriptors(self) -> Iterator[ImportDesc]:
+        """Yield the import descriptors preceding the terminating null descriptor."""
+        import_dir = self.data_directory(DirEntry.IMPORT)
+        rva = import_dir.vaddr.value
+        if not rva:
+            return
+        while True:
+            desc = ImportDesc.from_buffer(self.rva_data(rva, _IMPORT_DESC_SIZE))  # type: ignore[attr-defined]
+            if not any(desc.data):
+                return
+            yield desc
+            rva += _IMPORT_DESC_SIZE
+
+    def iter_imports(self) -> Iterator[Import]:
+        """Yield every imported symbol, reading thunks only as they are requested."""
+        for desc in self.iter_import_descriptors():
+            dll = self._cstring(desc.name.value)
+            lookup_rva = desc.original_first_thunk.value or desc.first_thunk.value
+            iat_rva = desc.first_thunk.value
+            while thunk := self._thunk(lookup_rva):
+                if thunk & self._ordinal_flag:
+                    yield Import(dll, None, thunk & 0xFFFF, None, iat_rva)
+                else:
+                    hint = int.from_bytes(self.rva_data(thunk & 0x7FFFFFFF, 2), "little")
+                    yield Import(dll, self._cstring((thunk & 0x7FFFFFFF) + 2), None, hint, iat_rva)
+                lookup_rva += self._thunk_size
+                iat_rva += self._thunk_size
+
+    @cached_property
+    def export_dir(self) -> ExportDir | None:
+        """Return the export directory, if any."""
+        export_dir = self.data_directory(DirEntry.EXPORT)
+        if not export_dir.vaddr.value:
+            return None
+        export = ExportDir.from_buffer(self.rva_data(export_dir.vaddr.value, 40))  # type: ignore[attr-defined]
+        return cast(ExportDir, export)
+
+    def _export(self, name: str | None, idx: int) -> Export:
+        """Return the export at function table index idx."""
+        export_dir = self.export_dir
+        if export_dir is None:
+            raise ValueError("PE has no export directory")
+        rva = int.from_bytes(self.rva_data(export_dir.addr_of_funcs.value + idx * 4, 4), "little")
+        directory = self.data_directory(DirEntry.EXPORT)
+        start = directory.vaddr.value
+        if start <= rva < start + directory.size.value:
+            return Export(name, export_dir.base.value + idx, rva, self._cstring(rva))
+        return Export(name, export_dir.base.value + idx, rva, None)
+
+    def _export_name(self, name_idx: int) -> tuple[str, int]:
+        """Return the name and function table index of the export name at name_idx."""
+        export_dir = self.export_dir
+        if export_dir is None:
+            raise ValueError("PE has no export directory")
+        name_rva = int.from_bytes(self.rva_data(export_dir.addr_of_names.value + name_idx * 4, 4), "little")
+        func_idx = int.from_bytes(self.rva_data(export_dir.addr_of_name_ordinals.value + name_idx * 2, 2), "little")
+        return self._cstring(name_rva), func_idx
+
+    def iter_exports(self) -> Iterator[Export]:
+        """Yield every named export in name order, reading the tables as they are requested."""
+        if self.export_dir is None:
+            return
+        for name_idx in range(self.export_dir.num_of_names.value):
+            yield self._export(*self._export_name(name_idx))
+
+    def export_by_name(self, name: str) -> Export:
+        """Return the export named name.
+
+        The export name table is sorted, so only the names visited by a binary search
+        are read.
+        """
+        if self.export_dir is not None:
+            low, high = 0, self.export_dir.num_of_names.value
+            while low < high:
+                mid = (low + high) // 2
+                mid_name, func_idx = self._export_name(mid)
+                if mid_name == name:
+                    return self._export(name, func_idx)
+                if mid_name.encode() < name.encode():
+                    low = mid + 1
+                else:
+                    high = mid
+        raise KeyError(name)
+
 
 class PE32(PE):
     """Windows 32-bit Executable Data Handler."""
 
-    def __init__(self, pe_data: bytes | bytearray = bytearray(b"")) -> None:
+    _thunk_size = 4
+    _ordinal_flag = 1 << 31
+
+    def __init__(self, pe_data: bytes | bytearray | memoryview = bytearray(b"")) -> None:
         """Initialize 32-bit PE Handler instance."""
         super().__init__(NTHdr32, pe_data)
 
@@ -59,6 +261,9 @@ class PE32(PE):
 class PE64(PE):
     """Windows 64-bit Executable Data Handler."""
 
-    def __init__(self, pe_data: bytes | bytearray = bytearray(b"")) -> None:
+    _thunk_size = 8
+    _ordinal_flag = 1 << 63
+
+    def __init__(self, pe_data: bytes | bytearray | memoryview = bytearray(b"")) -> None:
         """Initialize 64-bit PE Handler instance."""
         super().__init__(NTHdr64, pe_data)
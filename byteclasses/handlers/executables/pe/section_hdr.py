@@ -0,0 +1,43 @@
+"""PE Section Header Class.
+
+length: 40 bytes
+
+typedef struct _IMAGE_SECTION_HEADER {
+    BYTE    Name[IMAGE_SIZEOF_SHORT_NAME];
+    union {
+        DWORD   PhysicalAddress;
+        DWORD   VirtualSize;
+    } Misc;
+    DWORD   VirtualAddress;
+    DWORD   SizeOfRawData;
+    DWORD   PointerToRawData;
+    DWORD   PointerToRelocations;
+    DWORD   PointerToLinenumbers;
+    WORD    NumberOfRelocations;
+    WORD    NumberOfLinenumbers;
+    DWORD   Characteristics;
+} IMAGE_SECTION_HEADER, *PIMAGE_SECTION_HEADER;
+"""
+
+from ....types.collections import String, member, structure
+from ....types.primitives.integers import Ptr32, UInt16, UInt32
+
+__all__ = [
+    "SectionHdr",
+]
+
+
+@structure(packed=True, lazy=True)
+class SectionHdr:
+    """PE Section Header Class."""
+
+    name: String = member(factory=lambda byte_order: String(8, null_terminated=False))  # type: ignore
+    virtual_size: UInt32
+    vaddr: Ptr32
+    size_of_raw_data: UInt32
+    ptr_to_raw_data: Ptr32
+    ptr_to_relocs: Ptr32
+    ptr_to_line_nums: Ptr32
+    num_of_relocs: UInt16
+    num_of_line_nums: UInt16
+    characteristics: UInt32
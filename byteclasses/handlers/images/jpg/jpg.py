@@ -15,8 +15,8 @@ class JPG(_DataHandler):
         super().__init__(data)
         segments = []
         offset = 0
-        while offset < len(data):
-            seg = Seg(data[offset:])
+        while offset < len(self.data):
+            seg = Seg(self.data[offset:])
             segments.append(seg)
             offset += len(seg)
         self._segments = tuple(segments)
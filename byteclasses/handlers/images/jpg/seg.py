@@ -210,8 +210,7 @@ def parse_app0(mv: memoryview) -> App0Jfif | dict[str, Any]:
     identifier = String(identifier_len)
     identifier.attach(mv[:identifier_len])
     if identifier.value == App0Ident.JFIF.value:
-        hdr: App0Jfif = App0Jfif()
-        hdr.attach(mv)  # type: ignore
+        hdr: App0Jfif = App0Jfif.from_buffer(mv)  # type: ignore
         return hdr
     attr: dict[str, Any] = {"identifier": identifier}
     return attr
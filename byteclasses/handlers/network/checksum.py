@@ -0,0 +1,261 @@
+"""Internet Checksum Functions.
+
+[RFC 1071](https://www.rfc-editor.org/rfc/rfc1071)
+[RFC 1624](https://www.rfc-editor.org/rfc/rfc1624)
+
+One's complement sums are computed without a per word loop. A buffer read as a single big
+endian integer is congruent to the sum of its 16-bit words modulo 0xFFFF, batch sums are
+NumPy reductions over a big endian 16-bit view of the joined buffers.
+"""
+
+from collections.abc import Sequence
+from struct import Struct
+from typing import TYPE_CHECKING, Any, cast
+
+from ...constants import _PARAMS
+from ...numpy import _import_numpy
+from ...types.collections._collection import members
+from .packet import IPProto, Packet
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+__all__ = [
+    "checksum",
+    "checksums",
+    "ipv4_checksum",
+    "ipv4_checksums",
+    "tcp_checksum",
+    "tcp_checksums",
+    "udp_checksum",
+    "udp_checksums",
+    "update_checksum",
+    "update_field",
+    "verify_ipv4_checksum",
+]
+
+_Buffer = bytes | bytearray | memoryview
+
+_IPV4_CHECKSUM_OFFSET = 10
+_TCP_CHECKSUM_OFFSET = 16
+_UDP_CHECKSUM_OFFSET = 6
+_IPV4_PSEUDO = Struct("!4s4sxBH")
+_IPV6_PSEUDO = Struct("!16s16sI3xB")
+# Source and destination address bounds within the IP headers
+_IP_ADDRESSES = {"ipv4": (12, 20), "ipv6": (8, 40)}
+
+
+def _buffer(data: Any) -> _Buffer:
+    """Return the data of a byteclass header or a buffer."""
+    return data if isinstance(data, (bytes, bytearray, memoryview)) else bytes(data)
+
+
+def _sum(data: _Buffer) -> int:
+    """Return the folded 16-bit one's complement sum of data."""
+    if len(data) % 2:
+        data = bytes(data) + b"\x00"
+    value = int.from_bytes(data, "big")
+    if not value:
+        return 0
+    return value % 0xFFFF or 0xFFFF
+
+
+def checksum(data: _Buffer, initial: int = 0) -> int:
+    """Return the Internet checksum of data, odd length data is padded with a zero byte.
+
+    initial is added to the sum of data, e.g. the sum of a pseudo header.
+    """
+    total = _sum(data) + initial
+    total = (total & 0xFFFF) + (total >> 16)
+    total = (total & 0xFFFF) + (total >> 16)
+    return ~total & 0xFFFF
+
+
+def _ipv4_header(hdr: Any) -> _Buffer:
+    """Return the IPv4 header bytes, options included, of a header structure or buffer."""
+    data = _buffer(hdr)
+    hdr_length = (data[0] & 0xF) * 4
+    if hdr_length < 20 or hdr_length > len(data):
+        raise ValueError(f"Invalid IPv4 header length ({hdr_length})")
+    return data[:hdr_length]
+
+
+def ipv4_checksum(hdr: Any) -> int:
+    """Return the header checksum of an IPv4 header structure or header buffer.
+
+    The checksum field is ignored, header options are only included for buffers.
+    """
+    data = _ipv4_header(hdr)
+    return checksum(bytes(data[:_IPV4_CHECKSUM_OFFSET]) + bytes(data[_IPV4_CHECKSUM_OFFSET + 2 :]))
+
+
+def verify_ipv4_checksum(hdr: Any) -> bool:
+    """Return whether the header checksum of an IPv4 header is valid."""
+    return checksum(_ipv4_header(hdr)) == 0
+
+
+def _pseudo_header(ip: Any, protocol: int, length: int) -> bytes:
+    """Return the IPv4 or IPv6 pseudo header of a transport segment."""
+    data = _buffer(ip)
+    version = data[0] >> 4
+    if version == 4:
+        return _IPV4_PSEUDO.pack(bytes(data[12:16]), bytes(data[16:20]), protocol, length)
+    if version == 6:
+        return _IPV6_PSEUDO.pack(bytes(data[8:24]), bytes(data[24:40]), length, protocol)
+    raise ValueError(f"Invalid IP version ({version})")
+
+
+def _transport_checksum(ip: Any, hdr: Any, payload: _Buffer, protocol: int, checksum_offset: int) -> int:
+    """Return the checksum of a transport header and payload, ignoring the checksum field."""
+    hdr_data = bytes(_buffer(hdr))
+    segment = hdr_data[:checksum_offset] + b"\x00\x00" + hdr_data[checksum_offset + 2 :] + bytes(payload)
+    return checksum(_pseudo_header(ip, protocol, len(segment)) + segment)
+
+
+def tcp_checksum(ip: Any, tcp: Any, payload: _Buffer = b"") -> int:
+    """Return the TCP checksum of a segment.
+
+    ip is an IPv4 or IPv6 header, tcp the TCP header including options, each given as a
+    header structure or buffer. The checksum field is ignored.
+    """
+    return _transport_checksum(ip, tcp, payload, IPProto.TCP, _TCP_CHECKSUM_OFFSET)
+
+
+def udp_checksum(ip: Any, udp: Any, payload: _Buffer = b"") -> int:
+    """Return the UDP checksum of a datagram, a zero checksum is transmitted as 0xFFFF.
+
+    See tcp_checksum for the arguments.
+    """
+    return _transport_checksum(ip, udp, payload, IPProto.UDP, _UDP_CHECKSUM_OFFSET) or 0xFFFF
+
+
+def update_checksum(csum: int, old: _Buffer | int, new: _Buffer | int) -> int:
+    """Return a checksum updated for 16-bit aligned data changed from old to new (RFC 1624).
+
+    old and new are either single 16-bit words or buffers of equal, even length.
+    """
+    if isinstance(old, int):
+        old_words = [old]
+        new_words = [new]
+    else:
+        if len(old) != len(new) or len(old) % 2:  # type: ignore[arg-type]
+            raise ValueError("Changed data must be of equal and even length")
+        old_words = [int.from_bytes(old[idx : idx + 2], "big") for idx in range(0, len(old), 2)]
+        new_words = [int.from_bytes(new[idx : idx + 2], "big") for idx in range(0, len(new), 2)]  # type: ignore
+    # HC' = ~(~HC + ~m + m')
+    total = ~csum & 0xFFFF
+    for old_word, new_word in zip(old_words, new_words):
+        total += (~old_word & 0xFFFF) + new_word  # type: ignore[operator]
+    while total >> 16:
+        total = (total & 0xFFFF) + (total >> 16)
+    return ~total & 0xFFFF
+
+
+def update_field(hdr: Any, name: str, value: int, checksum_member: str = "header_checksum") -> None:
+    """Set a header member value and update the header checksum incrementally (RFC 1624).
+
+    e.g. update_field(ipv4_hdr, "time_to_live", 63) or update_field(tcp_hdr, "dst_port",
+    8080, "checksum")
+    """
+    layout = getattr(type(hdr), _PARAMS).get_layout()
+    for idx, member_ in enumerate(members(type(hdr))):
+        if member_.name == name:
+            start = layout.offsets[idx] & ~1
+            end = layout.offsets[idx] + layout.lengths[idx]
+            end += end % 2
+            break
+    else:
+        raise AttributeError(f"{type(hdr).__name__} has no member {name!r}")
+    data = hdr.data
+    old = bytes(data[start:end])
+    getattr(hdr, name).value = value
+    checksum_var = getattr(hdr, checksum_member)
+    checksum_var.value = update_checksum(checksum_var.value, old, bytes(hdr.data[start:end]))
+
+
+def _sums(buffers: Sequence[_Buffer]) -> tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Return the unfolded 16-bit word sums and first word indexes of buffers, and all words."""
+    np = _import_numpy()
+    padded = [bytes(data) + b"\x00" if len(data) % 2 else data for data in buffers]
+    word_counts = np.fromiter((len(data) // 2 for data in padded), dtype=np.int64, count=len(padded))
+    starts = np.zeros(len(padded), dtype=np.int64)
+    np.cumsum(word_counts[:-1], out=starts[1:])
+    words = np.frombuffer(b"".join(padded), dtype=">u2")
+    sums = np.zeros(len(padded), dtype=np.uint64)
+    nonempty = word_counts > 0
+    if words.size:
+        sums[nonempty] = np.add.reduceat(words, starts[nonempty], dtype=np.uint64)
+    return sums, starts, words
+
+
+def _fold(sums: "np.ndarray") -> "np.ndarray":
+    """Return the checksums of unfolded 16-bit word sums."""
+    np = _import_numpy()
+    for _ in range(4):
+        sums = (sums & 0xFFFF) + (sums >> 16)
+    return (~sums & 0xFFFF).astype(np.uint16)
+
+
+def checksums(buffers: Sequence[_Buffer]) -> "np.ndarray":
+    """Return the Internet checksum of every buffer as a NumPy array."""
+    return _fold(_sums(buffers)[0])
+
+
+def ipv4_checksums(headers: Sequence[Any]) -> "np.ndarray":
+    """Return the header checksum of every IPv4 header, ignoring the checksum fields.
+
+    See ipv4_checksum for the headers.
+    """
+    sums, starts, words = _sums([_ipv4_header(hdr) for hdr in headers])
+    if words.size:
+        sums -= words[starts + _IPV4_CHECKSUM_OFFSET // 2]
+    return _fold(sums)
+
+
+def _transport_checksums(packets: Sequence[Packet], name: str, protocol: int, checksum_offset: int) -> "np.ndarray":
+    """Return the checksum of the name transport layer of every packet, ignoring the checksum fields.
+
+    No pseudo headers are built, the sums of the segments and of the addresses of the
+    outermost IP layers are computed separately and the protocol and segment lengths
+    are added to them.
+    """
+    np = _import_numpy()
+    segments = []
+    addresses = []
+    for packet in packets:
+        data = packet.data
+        address = None
+        for layer_name, offset, _, end in packet.bounds:
+            if layer_name == name:
+                break
+            if address is None and layer_name in _IP_ADDRESSES:
+                start, stop = _IP_ADDRESSES[layer_name]
+                address = data[offset + start : offset + stop]
+        else:
+            raise KeyError(name)
+        if address is None:
+            raise ValueError(f"Packet has no ipv4 or ipv6 layer before its {name} layer")
+        segments.append(data[offset:end])
+        addresses.append(address)
+    sums, starts, words = _sums(segments)
+    if words.size:
+        sums -= words[starts + checksum_offset // 2]
+    sums += _sums(addresses)[0] + np.uint64(protocol)
+    sums += np.fromiter((len(segment) for segment in segments), dtype=np.uint64, count=len(segments))
+    return _fold(sums)
+
+
+def tcp_checksums(packets: Sequence[Packet]) -> "np.ndarray":
+    """Return the TCP checksum of every decoded packet, ignoring the checksum fields."""
+    return _transport_checksums(packets, "tcp", IPProto.TCP, _TCP_CHECKSUM_OFFSET)
+
+
+def udp_checksums(packets: Sequence[Packet]) -> "np.ndarray":
+    """Return the UDP checksum of every decoded packet, ignoring the checksum fields.
+
+    Zero checksums are returned as 0xFFFF.
+    """
+    np = _import_numpy()
+    result = _transport_checksums(packets, "udp", IPProto.UDP, _UDP_CHECKSUM_OFFSET)
+    return cast("NDArray[Any]", np.where(result == 0, np.uint16(0xFFFF), result))
@@ -6,10 +6,14 @@
 from collections.abc import ByteString
 from enum import IntEnum
 from functools import cached_property
+from typing import TYPE_CHECKING
 
 from .._data_handler import _DataHandler
 from .eth_hdr import EthHdr
 
+if TYPE_CHECKING:
+    from .packet import Packet
+
 
 class EtherType(IntEnum):
     """Ethernet Frame Types."""
@@ -43,13 +47,12 @@ class EtherType(IntEnum):
 class EthFrame(_DataHandler):
     """Ethernet Frame Data Handler Class."""
 
-    def __init__(self, data: bytes | bytearray = bytearray(b"")) -> None:
+    def __init__(self, data: bytes | bytearray | memoryview = bytearray(b"")) -> None:
         """Initialize Ethernet Frame instance."""
         super().__init__(data)
-        self._hdr = EthHdr()
         try:
-            self._hdr.attach(memoryview(self._data))  # type: ignore
-        except AttributeError as err:
+            self._hdr: EthHdr = EthHdr.from_buffer(self._data)  # type: ignore
+        except ValueError as err:
             raise ValueError("Insufficient data") from err
 
     def __str__(self) -> str:
@@ -82,7 +85,11 @@ class EthFrame(_DataHandler):
     @cached_property
     def payload(self) -> _DataHandler | ByteString:
         """Return frame payload."""
-        payload_data = self._data[len(self.hdr) :]  # type: ignore
-        # if self.type == EtherType.IPV4:
-        #     return IPv4Packet(data=payload_data)
-        return payload_data
+        return self._data[len(self.hdr) :]  # type: ignore
+
+    @cached_property
+    def packet(self) -> "Packet":
+        """Return the frame decoded into layers."""
+        from .packet import decode  # pylint: disable=C0415
+
+        return decode(self._data)
@@ -11,3 +11,11 @@ class EthHdr:
     dst_mac: ByteArray = member(factory=lambda byte_order: ByteArray(6))  # type: ignore
     src_mac: ByteArray = member(factory=lambda byte_order: ByteArray(6))  # type: ignore
     ether_type: UInt16
+
+
+@structure(byte_order=b"!", packed=True)
+class VLANTag:
+    """IEEE 802.1Q VLAN Tag Class, following the tagged frame ether type."""
+
+    tci: UInt16
+    ether_type: UInt16
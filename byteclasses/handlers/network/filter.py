@@ -0,0 +1,584 @@
+"""Compiled Packet Filters.
+
+Filter expressions compare header fields of decoded layers, e.g.
+
+    (F.ipv4.protocol == 6) & F.tcp.dst_port.in_({80, 443})
+
+Comparisons bind looser than & and |, so compared fields must be parenthesized. Field
+offsets and byte orders are taken from the header structure layouts. A compiled filter
+either matches decoded packets with generated code that unpacks the compared fields at
+fixed offsets within their layers, or masks a whole capture with NumPy, in both cases
+without creating header structures.
+"""
+
+import operator
+import sys
+from collections.abc import Callable, Iterable, Iterator
+from struct import Struct
+from typing import TYPE_CHECKING, Any, cast
+
+from ..._enums import ByteOrder
+from ...constants import _PARAMS
+from ...numpy import _import_numpy
+from ...types.collections._collection import members
+from ...types.collections._methods import _create_method
+from ...types.primitives.bitfield import BitField, BitPos
+from .eth_hdr import EthHdr, VLANTag
+from .ipv4_hdr import IPv4Hdr
+from .ipv6_hdr import FragmentExtHdr, IPv6Hdr
+from .packet import IPProto, LinkType, Packet, _builtin_decoders, _decoders
+from .tcp_hdr import TCPHdr
+from .udp_hdr import UDPHdr
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+__all__ = [
+    "Expr",
+    "F",
+    "Field",
+    "Filter",
+    "register_layer",
+]
+
+_Buffer = bytes | bytearray | memoryview
+
+_LAYERS: dict[str, type] = {
+    "eth": EthHdr,
+    "vlan": VLANTag,
+    "ipv4": IPv4Hdr,
+    "ipv6": IPv6Hdr,
+    "ipv6_frag": FragmentExtHdr,
+    "tcp": TCPHdr,
+    "udp": UDPHdr,
+}
+# Layers decoded by the NumPy capture masks
+_MASK_LAYERS = frozenset(("eth", "vlan", "ipv4", "ipv6", "tcp", "udp"))
+_EXT_PROTOCOLS = (IPProto.HOPOPT, IPProto.IPV6_ROUTE, IPProto.IPV6_FRAG, IPProto.IPV6_OPTS)
+_OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+_INT_FORMATS = {1: "B", 2: "H", 4: "I", 8: "Q"}
+_unpackers: dict[str, Callable] = {}
+
+
+def register_layer(name: str, hdr_cls: type) -> None:
+    """Register the header structure of a decoded layer name for use in filter expressions."""
+    _LAYERS[name] = hdr_cls
+
+
+class Expr:
+    """A filter expression, combined with &, | and ~."""
+
+    def __and__(self, other: "Expr") -> "Expr":
+        """Return the conjunction of two expressions."""
+        return _And(self, other)
+
+    def __or__(self, other: "Expr") -> "Expr":
+        """Return the disjunction of two expressions."""
+        return _Or(self, other)
+
+    def __invert__(self) -> "Expr":
+        """Return the negation of the expression."""
+        return _Not(self)
+
+    def __bool__(self) -> bool:
+        """Reject implicit truth tests, e.g. by 'and', 'or' and chained comparisons."""
+        raise TypeError("Filter expressions must be combined with &, | and ~")
+
+    def compile(self) -> "Filter":
+        """Return the compiled filter of the expression."""
+        return Filter(self)
+
+    def _layers(self) -> set[str]:
+        """Return the names of the layers referenced by the expression."""
+        raise NotImplementedError
+
+    def _source(self, gen: "_Codegen") -> str:
+        """Return the Python source of the expression."""
+        raise NotImplementedError
+
+    def _mask(self, frame: "_Frame") -> "np.ndarray":
+        """Return the NumPy mask of the expression."""
+        raise NotImplementedError
+
+
+class _Has(Expr):
+    """Layer presence expression."""
+
+    def __init__(self, layer: str) -> None:
+        self.layer = layer
+
+    def __repr__(self) -> str:
+        return f"F.{self.layer}"
+
+    def _layers(self) -> set[str]:
+        return {self.layer}
+
+    def _source(self, gen: "_Codegen") -> str:
+        return f"({gen.offset(self.layer)} is not None)"
+
+    def _mask(self, frame: "_Frame") -> "np.ndarray":
+        return frame.offsets[self.layer] >= 0
+
+
+class _Compare(Expr):
+    """Field comparison expression."""
+
+    def __init__(self, field: "Field", op: str, value: Any) -> None:
+        self.field = field
+        self.op = op
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f"({self.field!r} {self.op} {self.value!r})"
+
+    def _layers(self) -> set[str]:
+        return {self.field.layer}
+
+    def _source(self, gen: "_Codegen") -> str:
+        value = self.value if isinstance(self.value, int) else gen.constant(self.value)
+        return f"({gen.offset(self.field.layer)} is not None and {self.field._source(gen)} {self.op} {value})"
+
+    def _mask(self, frame: "_Frame") -> "np.ndarray":
+        present, values = self.field._values(frame)
+        if self.field.kind == "bytes":
+            np = _import_numpy()
+            equal = (values == np.frombuffer(self.value, dtype=np.uint8)).all(axis=1)
+            return cast("NDArray[Any]", present & (equal if self.op == "==" else ~equal))
+        return cast("NDArray[Any]", present & _OPERATORS[self.op](values, self.value))
+
+
+class _In(Expr):
+    """Field membership expression."""
+
+    def __init__(self, field: "Field", values: frozenset) -> None:
+        self.field = field
+        self.values = values
+
+    def __repr__(self) -> str:
+        return f"{self.field!r}.in_({set(self.values)!r})"
+
+    def _layers(self) -> set[str]:
+        return {self.field.layer}
+
+    def _source(self, gen: "_Codegen") -> str:
+        values = gen.constant(self.values)
+        return f"({gen.offset(self.field.layer)} is not None and {self.field._source(gen)} in {values})"
+
+    def _mask(self, frame: "_Frame") -> "np.ndarray":
+        np = _import_numpy()
+        present, values = self.field._values(frame)
+        if self.field.kind == "bytes":
+            matched = np.zeros(len(present), dtype=bool)
+            for value in self.values:
+                matched |= (values == np.frombuffer(value, dtype=np.uint8)).all(axis=1)
+            return cast("NDArray[Any]", present & matched)
+        return cast("NDArray[Any]", present & np.isin(values, np.array(sorted(self.values), dtype=np.uint64)))
+
+
+class _And(Expr):
+    """Conjunction expression."""
+
+    def __init__(self, left: Expr, right: Expr) -> None:
+        self.left = left
+        self.right = right
+
+    def __repr__(self) -> str:
+        return f"({self.left!r} & {self.right!r})"
+
+    def _layers(self) -> set[str]:
+        return self.left._layers() | self.right._layers()
+
+    def _source(self, gen: "_Codegen") -> str:
+        return f"({self.left._source(gen)} and {self.right._source(gen)})"
+
+    def _mask(self, frame: "_Frame") -> "np.ndarray":
+        return cast("NDArray[Any]", self.left._mask(frame) & self.right._mask(frame))
+
+
+class _Or(_And):
+    """Disjunction expression."""
+
+    def __repr__(self) -> str:
+        return f"({self.left!r} | {self.right!r})"
+
+    def _source(self, gen: "_Codegen") -> str:
+        return f"({self.left._source(gen)} or {self.right._source(gen)})"
+
+    def _mask(self, frame: "_Frame") -> "np.ndarray":
+        return cast("NDArray[Any]", self.left._mask(frame) | self.right._mask(frame))
+
+
+class _Not(Expr):
+    """Negation expression."""
+
+    def __init__(self, expr: Expr) -> None:
+        self.expr = expr
+
+    def __repr__(self) -> str:
+        return f"~{self.expr!r}"
+
+    def _layers(self) -> set[str]:
+        return self.expr._layers()
+
+    def _source(self, gen: "_Codegen") -> str:
+        return f"(not {self.expr._source(gen)})"
+
+    def _mask(self, frame: "_Frame") -> "np.ndarray":
+        return ~self.expr._mask(frame)
+
+
+class Field:
+    """A header field of a decoded layer.
+
+    Fields of 1, 2, 4 or 8 bytes compare as unsigned integers in the header byte order, other
+    fields, e.g. MAC and IPv6 addresses, compare as bytes for equality only. Bit
+    positions of bitfield members are fields themselves, e.g. F.ipv4.ver_ihl.ihl.
+    """
+
+    __slots__ = ("layer", "name", "offset", "length", "byte_order", "kind", "shift", "mask", "_bitfield")
+
+    def __init__(self, layer: str, name: str) -> None:
+        """Initialize field instance from the layout of the layer header structure."""
+        try:
+            hdr_cls = _LAYERS[layer]
+        except KeyError as err:
+            raise AttributeError(f"Unknown layer ({layer!r}), see register_layer") from err
+        params = getattr(hdr_cls, _PARAMS)
+        layout = params.get_layout()
+        for idx, member_ in enumerate(members(hdr_cls)):
+            if member_.name == name:
+                break
+        else:
+            raise AttributeError(f"{hdr_cls.__name__} has no member {name!r}")
+        self.layer = layer
+        self.name = name
+        self.offset = layout.offsets[idx]
+        self.length = layout.lengths[idx]
+        if params.byte_order is ByteOrder.LE:
+            self.byte_order = "little"
+        elif params.byte_order in (ByteOrder.NATIVE, ByteOrder.NATIVE_STD):
+            self.byte_order = sys.byteorder
+        else:
+            self.byte_order = "big"
+        self.kind = "int" if self.length in _INT_FORMATS else "bytes"
+        self.shift = 0
+        self.mask = (1 << self.length * 8) - 1
+        self._bitfield = member_.type if isinstance(member_.type, type) and issubclass(member_.type, BitField) else None
+
+    def __repr__(self) -> str:
+        """Return field representation."""
+        return f"F.{self.layer}.{self.name}"
+
+    def __getattr__(self, name: str) -> "Field":
+        """Return the field of a bit position of a bitfield member."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        pos = getattr(self._bitfield, name, None) if self._bitfield is not None else None
+        if not isinstance(pos, BitPos):
+            raise AttributeError(f"{self!r} has no bit position {name!r}")
+        field = object.__new__(Field)
+        for slot in Field.__slots__:
+            setattr(field, slot, getattr(self, slot))
+        field.name = f"{self.name}.{name}"
+        field.shift = pos.idx
+        field.mask = (1 << pos.bit_width) - 1
+        field._bitfield = None
+        return field
+
+    def __eq__(self, value: Any) -> Expr:  # type: ignore[override]
+        """Return an equality expression."""
+        return _Compare(self, "==", self._constant(value))
+
+    def __ne__(self, value: Any) -> Expr:  # type: ignore[override]
+        """Return an inequality expression."""
+        return _Compare(self, "!=", self._constant(value))
+
+    def __lt__(self, value: Any) -> Expr:
+        """Return a less than expression."""
+        return _Compare(self, "<", self._int_constant(value))
+
+    def __le__(self, value: Any) -> Expr:
+        """Return a less than or equal expression."""
+        return _Compare(self, "<=", self._int_constant(value))
+
+    def __gt__(self, value: Any) -> Expr:
+        """Return a greater than expression."""
+        return _Compare(self, ">", self._int_constant(value))
+
+    def __ge__(self, value: Any) -> Expr:
+        """Return a greater than or equal expression."""
+        return _Compare(self, ">=", self._int_constant(value))
+
+    __hash__ = object.__hash__
+
+    def in_(self, values: Iterable[Any]) -> Expr:
+        """Return a membership expression."""
+        return _In(self, frozenset(self._constant(value) for value in values))
+
+    def _constant(self, value: Any) -> int | bytes:
+        """Return a comparison value as an integer or bytes of the field length.
+
+        Values may be given as integers, bytes or ipaddress addresses. Integers must be
+        within the range of the unsigned field.
+        """
+        packed = getattr(value, "packed", value)
+        if self.kind == "bytes":
+            if not isinstance(packed, (bytes, bytearray, memoryview)) or len(packed) != self.length:
+                raise ValueError(f"{self!r} compares to {self.length} bytes, not {value!r}")
+            return bytes(packed)
+        if isinstance(packed, (bytes, bytearray, memoryview)):
+            return int.from_bytes(packed, self.byte_order)  # type: ignore[arg-type]
+        int_value = int(value)
+        if not 0 <= int_value <= self.mask:
+            raise ValueError(f"{self!r} compares to integers from 0 to {self.mask}, not {value!r}")
+        return int_value
+
+    def _int_constant(self, value: Any) -> int:
+        """Return an ordering comparison value."""
+        if self.kind == "bytes":
+            raise TypeError(f"{self!r} only supports equality comparisons")
+        return self._constant(value)  # type: ignore[return-value]
+
+    def _source(self, gen: "_Codegen") -> str:
+        """Return the Python source reading the field of the current packet."""
+        offset = gen.offset(self.layer)
+        if self.kind == "bytes":
+            return f"bytes(data[{offset} + {self.offset} : {offset} + {self.offset + self.length}])"
+        fmt = f"{'<' if self.byte_order == 'little' else '>'}{_INT_FORMATS[self.length]}"
+        if fmt not in _unpackers:
+            _unpackers[fmt] = Struct(fmt).unpack_from
+        unpack = gen.constant(_unpackers[fmt])
+        source = f"{unpack}(data, {offset} + {self.offset})[0]"
+        if self.shift:
+            source = f"({source} >> {self.shift})"
+        if self.mask != (1 << self.length * 8) - 1:
+            source = f"({source} & {self.mask})"
+        return source
+
+    def _values(self, frame: "_Frame") -> tuple["np.ndarray", "np.ndarray"]:
+        """Return the layer presence mask and the field values of every packet in a frame."""
+        np = _import_numpy()
+        offsets = frame.offsets[self.layer]
+        present = offsets >= 0
+        raw = frame.read(np.where(present, offsets + self.offset, 0), self.length)
+        if self.kind == "bytes":
+            return present, raw
+        values = raw.view(f"{'<' if self.byte_order == 'little' else '>'}u{self.length}")[:, 0].astype(np.uint64)
+        return present, (values >> np.uint64(self.shift)) & np.uint64(self.mask)
+
+
+class _LayerFields(_Has):
+    """Layer presence expression and namespace of the layer header fields."""
+
+    def __getattr__(self, name: str) -> Field:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return Field(self.layer, name)
+
+
+class _Fields:
+    """Namespace of the filter layers, F.<layer>.<field>."""
+
+    def __getattr__(self, name: str) -> _LayerFields:
+        if name not in _LAYERS:
+            raise AttributeError(f"Unknown layer ({name!r}), see register_layer")
+        return _LayerFields(name)
+
+
+F = _Fields()
+
+
+class _Codegen:
+    """Source generation state, the names of layer offsets and of constants."""
+
+    def __init__(self) -> None:
+        self.layers: dict[str, str] = {}
+        self.locals: dict[str, Any] = {}
+        self._constants: dict[Any, str] = {}
+
+    def offset(self, layer: str) -> str:
+        """Return the name of the offset of a layer."""
+        if layer not in self.layers:
+            self.layers[layer] = f"_o{len(self.layers)}"
+        return self.layers[layer]
+
+    def constant(self, value: Any) -> str:
+        """Return the name of a constant."""
+        key = (type(value), value)
+        if key not in self._constants:
+            self._constants[key] = f"_c{len(self._constants)}"
+            self.locals[self._constants[key]] = value
+        return self._constants[key]
+
+
+class _Frame:
+    """Capture data and the layer offsets of every packet for the NumPy masks, -1 when absent."""
+
+    def __init__(self, data: _Buffer, starts: "np.ndarray", lengths: "np.ndarray", link_type: int) -> None:
+        np = _import_numpy()
+        self.buf = np.frombuffer(data, dtype=np.uint8)
+        self.offsets = _decode_layers(
+            self, np.asarray(starts, dtype=np.int64), np.asarray(lengths, dtype=np.int64), link_type
+        )
+
+    def read(self, positions: "np.ndarray", size: int) -> "np.ndarray":
+        """Return the size bytes at every position as rows of a matrix."""
+        np = _import_numpy()
+        if not len(positions):
+            return cast("NDArray[Any]", np.zeros((0, size), dtype=np.uint8))
+        return cast("NDArray[Any]", np.ascontiguousarray(self.buf[positions[:, None] + np.arange(size)]))
+
+    def uint(self, valid: "np.ndarray", positions: "np.ndarray", size: int) -> "np.ndarray":
+        """Return the big endian unsigned integers at the valid positions, 0 elsewhere."""
+        np = _import_numpy()
+        values = self.read(np.where(valid, positions, 0), size).view(f">u{size}")[:, 0].astype(np.int64)
+        return cast("NDArray[Any]", np.where(valid, values, 0))
+
+
+def _decode_layers(
+    frame: _Frame, starts: "np.ndarray", lengths: "np.ndarray", link_type: int
+) -> dict[str, "np.ndarray"]:
+    """Return the offsets of the eth, vlan, ipv4, ipv6, tcp and udp layers of every packet.
+
+    Mirrors the built-in packet decoders, stacked VLAN tags and IPv6 extension header
+    chains are walked one header per iteration until no packet has one left.
+    """
+    np = _import_numpy()
+    ends = starts + lengths
+    absent = np.full(len(starts), -1, dtype=np.int64)
+    eth = vlan = absent
+    if link_type == LinkType.ETHERNET:
+        has_eth = lengths >= 14
+        ether_type = frame.uint(has_eth, starts + 12, 2)
+        eth = np.where(has_eth, starts, -1)
+        l3 = starts + 14
+        tagged = has_eth & (ether_type == 0x8100) & (ends - l3 >= 4)
+        while tagged.any():
+            vlan = np.where(tagged & (vlan < 0), l3, vlan)
+            ether_type = np.where(tagged, frame.uint(tagged, l3 + 2, 2), ether_type)
+            l3 = np.where(tagged, l3 + 4, l3)
+            tagged &= (ether_type == 0x8100) & (ends - l3 >= 4)
+        ipv4_next = has_eth & (ether_type == 0x0800)
+        ipv6_next = has_eth & (ether_type == 0x86DD)
+    elif link_type in (LinkType.RAW, LinkType.IPV4, LinkType.IPV6):
+        l3 = starts
+        version = frame.uint(lengths > 0, starts, 1) >> 4
+        ipv4_next = (lengths > 0) & (version == 4 if link_type == LinkType.RAW else link_type == LinkType.IPV4)
+        ipv6_next = (lengths > 0) & (version == 6 if link_type == LinkType.RAW else link_type == LinkType.IPV6)
+    else:
+        raise ValueError(f"Unsupported link type ({link_type})")
+    # IPv4, transport headers only follow the first fragment
+    has_ipv4 = ipv4_next & (ends - l3 >= 20)
+    hdr_length = (frame.uint(has_ipv4, l3, 1) & 0xF) * 4
+    total_length = frame.uint(has_ipv4, l3 + 2, 2)
+    has_ipv4 &= (hdr_length >= 20) & (total_length >= hdr_length) & (l3 + total_length <= ends)
+    first = (frame.uint(has_ipv4, l3 + 6, 2) & 0x1FFF) == 0
+    # IPv6, a zero payload length extends to the end of the packet
+    has_ipv6 = ipv6_next & (ends - l3 >= 40)
+    payload_length = frame.uint(has_ipv6, l3 + 4, 2)
+    has_ipv6 &= l3 + 40 + payload_length <= ends
+    l4 = np.where(has_ipv4, l3 + hdr_length, l3 + 40)
+    l4_ends = np.where(has_ipv4, l3 + total_length, np.where(payload_length > 0, l3 + 40 + payload_length, ends))
+    protocol = np.where(has_ipv4 & first, frame.uint(has_ipv4, l3 + 9, 1), -1)
+    protocol = np.where(has_ipv6, frame.uint(has_ipv6, l3 + 6, 1), protocol)
+    # IPv6 extension headers, transport headers only follow the first fragment
+    while True:
+        is_ext = np.isin(protocol, _EXT_PROTOCOLS)
+        if not is_ext.any():
+            break
+        valid = is_ext & (l4_ends - l4 >= 8)
+        is_frag = valid & (protocol == IPProto.IPV6_FRAG)
+        ext_length = np.where(is_frag, 8, (frame.uint(valid, l4 + 1, 1) + 1) * 8)
+        valid &= l4 + ext_length <= l4_ends
+        next_hdr = np.where(is_frag & (frame.uint(is_frag, l4 + 2, 2) & 0xFFF8 != 0), -1, frame.uint(valid, l4, 1))
+        protocol = np.where(valid, next_hdr, np.where(is_ext, -1, protocol))
+        l4 = np.where(valid, l4 + ext_length, l4)
+    has_tcp = (protocol == 6) & (l4_ends - l4 >= 20)
+    tcp_length = (frame.uint(has_tcp, l4 + 12, 1) >> 4) * 4
+    has_tcp &= (tcp_length >= 20) & (l4 + tcp_length <= l4_ends)
+    has_udp = (protocol == 17) & (l4_ends - l4 >= 8)
+    udp_length = frame.uint(has_udp, l4 + 4, 2)
+    has_udp &= (udp_length >= 8) & (l4 + udp_length <= l4_ends)
+    return {
+        "eth": eth,
+        "vlan": vlan,
+        "ipv4": np.where(has_ipv4, l3, -1),
+        "ipv6": np.where(has_ipv6, l3, -1),
+        "tcp": np.where(has_tcp, l4, -1),
+        "udp": np.where(has_udp, l4, -1),
+    }
+
+
+class Filter:
+    """A compiled packet filter.
+
+    Packets match when the expression is true, comparisons of fields of absent layers
+    are false. The generated source of the match function is kept in source.
+    """
+
+    def __init__(self, expr: Expr) -> None:
+        """Initialize filter instance, compiling the match function of expr."""
+        self.expr = expr
+        gen = _Codegen()
+        condition = expr._source(gen)
+        body = ["data = packet.data", "layer_offset = packet.layer_offset"]
+        body.extend(f"{name} = layer_offset({layer!r})" for layer, name in gen.layers.items())
+        body.append(f"return {condition}")
+        self.source = "\n".join(body)
+        self._match: Callable[[Packet], bool] = _create_method(
+            "match", ["packet"], body, globals_={}, locals_=dict(gen.locals)
+        )
+
+    def __repr__(self) -> str:
+        """Return filter representation."""
+        return f"{self.__class__.__name__}({self.expr!r})"
+
+    def __call__(self, packet: Packet) -> bool:
+        """Return whether a decoded packet matches."""
+        return self._match(packet)
+
+    def filter(self, packets: Iterable[Packet]) -> Iterator[Packet]:
+        """Yield the matching decoded packets."""
+        match = self._match
+        return (packet for packet in packets if match(packet))
+
+    def mask(
+        self,
+        data: _Buffer,
+        starts: "np.ndarray",
+        lengths: "np.ndarray",
+        link_type: LinkType | int = LinkType.ETHERNET,
+    ) -> "np.ndarray":
+        """Return the NumPy match mask of the packets at starts and of lengths within data.
+
+        Layers are located with vectorized decoders for Ethernet, stacked VLAN tags,
+        IPv4, IPv6 and its extension headers, TCP and UDP.
+        """
+        unsupported = self.expr._layers() - _MASK_LAYERS
+        if unsupported:
+            raise ValueError(f"Unsupported mask layers ({', '.join(sorted(unsupported))})")
+        return self.expr._mask(_Frame(data, starts, lengths, int(link_type)))
+
+    def indices(self, capture: Any) -> "np.ndarray":
+        """Return the numbers of the matching packets of a Pcap or PcapNG capture.
+
+        Captures are masked with NumPy unless they mix link types, the expression uses
+        layers the masks do not decode or decoders were registered, in which case every
+        packet is decoded and matched.
+        """
+        np = _import_numpy()
+        link_types = {capture.link_type} if hasattr(capture, "link_type") else {i.link_type for i in capture.interfaces}
+        if len(link_types) > 1 or self.expr._layers() - _MASK_LAYERS or _decoders != _builtin_decoders:
+            matched = [idx for idx in range(capture.packet_count) if self._match(capture.packet(idx))]
+            return cast("NDArray[Any]", np.array(matched, dtype=np.int64))
+        starts, lengths = capture.packet_bounds()
+        mask = self.mask(capture.data, starts, lengths, link_types.pop() if link_types else LinkType.ETHERNET)
+        return cast("NDArray[Any]", np.flatnonzero(mask))
@@ -8,23 +8,23 @@ from byteclasses.types.primitives.integers import UInt8, UInt16, UInt32
 class VerIhl(BitField):
     """IPv4 Version and Header Length BitField."""
 
-    version = BitPos(0, bit_width=4)
-    ihl = BitPos(4, bit_width=4)
+    version = BitPos(4, bit_width=4)
+    ihl = BitPos(0, bit_width=4)
 
 
 class DscpEcn(BitField):
     """IPv4 DSCP and ECN BitField."""
 
-    dscp = BitPos(0, bit_width=6)
-    ecn = BitPos(6, bit_width=2)
+    dscp = BitPos(2, bit_width=6)
+    ecn = BitPos(0, bit_width=2)
 
 
 class FlagsOff(BitField):
     """IPv4 Flags BitField."""
 
     byte_length = 2
-    pkt_flags = BitPos(0, bit_width=3)
-    fragment_offset = BitPos(3, bit_width=13)
+    pkt_flags = BitPos(13, bit_width=3)
+    fragment_offset = BitPos(0, bit_width=13)
 
 
 @union(byte_order=b"!")
@@ -9,9 +9,9 @@ class VTF(BitField):
     """IPv6 Version/Traffic/Flow Label BitField."""
 
     byte_length = 4
-    version = BitPos(0, bit_width=4)
-    traffic_class = BitPos(4, bit_width=8)
-    flow_label = BitPos(12, bit_width=20)
+    version = BitPos(28, bit_width=4)
+    traffic_class = BitPos(20, bit_width=8)
+    flow_label = BitPos(0, bit_width=20)
 
 
 @union(byte_order=b"!")
@@ -59,9 +59,9 @@ class FragmentBitField(BitField):
     """IPv6 Fragment Offset and more follows flag bitfield."""
 
     byte_length = 2
-    frag_offset = BitPos(0, bit_width=13)
-    reserved = BitPos(13, bit_width=2)
-    more = BitPos(15)
+    frag_offset = BitPos(3, bit_width=13)
+    reserved = BitPos(1, bit_width=2)
+    more = BitPos(0)
 
 
 @structure(byte_order=b"!", packed=True)
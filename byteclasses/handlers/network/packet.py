@@ -0,0 +1,341 @@
+"""Layered Packet Decoding.
+
+Packets are decoded layer by layer through decoder tables keyed by link type, ether type
+and IP protocol number. Decoders only read the fields needed to find the next layer with
+precompiled structs, headers are created as views over the packet data on first access.
+"""
+
+from collections.abc import Callable, Iterator
+from enum import IntEnum
+from struct import Struct
+from typing import Any
+
+from .eth_frame import EtherType
+from .eth_hdr import EthHdr, VLANTag
+from .ipv4_hdr import IPv4Hdr
+from .ipv6_hdr import FragmentExtHdr, IPv6Hdr
+from .tcp_hdr import TCPHdr
+from .udp_hdr import UDPHdr
+
+__all__ = [
+    "IPProto",
+    "Layer",
+    "LinkType",
+    "Packet",
+    "decode",
+    "register_decoder",
+]
+
+# A decoder is called with the packet data, the layer offset and the end offset of the
+# enclosing layer. It returns None when the data is not a valid layer, otherwise the layer
+# name, header class (None for a raw header view), header length, layer end offset and
+# the decoder table and key of the next layer (None and 0 for the last layer).
+Decoder = Callable[[memoryview, int, int], tuple[str, type | None, int, int, str | None, int] | None]
+
+
+class LinkType(IntEnum):
+    """Capture Link Layer Types."""
+
+    ETHERNET = 1
+    RAW = 101
+    IPV4 = 228
+    IPV6 = 229
+
+
+class IPProto(IntEnum):
+    """IP Protocol Numbers."""
+
+    HOPOPT = 0
+    ICMP = 1
+    IGMP = 2
+    TCP = 6
+    UDP = 17
+    IPV6_ROUTE = 43
+    IPV6_FRAG = 44
+    GRE = 47
+    ESP = 50
+    AH = 51
+    ICMPV6 = 58
+    IPV6_NONXT = 59
+    IPV6_OPTS = 60
+    SCTP = 132
+
+
+class Layer:
+    """A decoded packet layer, the header is created on first access."""
+
+    __slots__ = ("name", "hdr_cls", "data", "offset", "hdr_length", "end", "_hdr")
+
+    def __init__(
+        self, name: str, hdr_cls: type | None, data: memoryview, offset: int, hdr_length: int, end: int
+    ) -> None:
+        """Initialize layer instance."""
+        self.name = name
+        self.hdr_cls = hdr_cls
+        self.data = data
+        self.offset = offset
+        self.hdr_length = hdr_length
+        self.end = end
+        self._hdr: Any = None
+
+    def __repr__(self) -> str:
+        """Return layer representation."""
+        return f"{self.__class__.__name__}({self.name}, offset={self.offset}, hdr_length={self.hdr_length})"
+
+    @property
+    def header(self) -> memoryview:
+        """Return a view of the layer header bytes."""
+        return self.data[self.offset : self.offset + self.hdr_length]
+
+    @property
+    def hdr(self) -> Any:
+        """Return the layer header structure, or the header view when the layer has none."""
+        if self._hdr is None:
+            if self.hdr_cls is None:
+                self._hdr = self.header
+            else:
+                self._hdr = self.hdr_cls.from_buffer(self.data, self.offset)  # type: ignore[attr-defined]
+        return self._hdr
+
+    @property
+    def payload(self) -> memoryview:
+        """Return a view of the layer payload."""
+        return self.data[self.offset + self.hdr_length : self.end]
+
+
+class Packet:
+    """A packet decoded into layers over the packet data.
+
+    Layers are recorded as (name, header class, offset, header length, end) entries,
+    layer objects are only created when the layers are accessed.
+    """
+
+    __slots__ = ("data", "_entries", "_layers")
+
+    def __init__(self, data: memoryview, entries: list[tuple[str, type | None, int, int, int]]) -> None:
+        """Initialize packet instance."""
+        self.data = data
+        self._entries = entries
+        self._layers: list[Layer] | None = None
+
+    def __repr__(self) -> str:
+        """Return packet representation."""
+        return f"{self.__class__.__name__}({'/'.join(self.names)})"
+
+    def __len__(self) -> int:
+        """Return packet length."""
+        return len(self.data)
+
+    def __iter__(self) -> Iterator[Layer]:
+        """Return a layer iterator."""
+        return iter(self.layers)
+
+    def __contains__(self, name: object) -> bool:
+        """Return whether the packet has a layer named name."""
+        return any(entry[0] == name for entry in self._entries)
+
+    def __getitem__(self, name: str) -> Layer:
+        """Return the outermost layer named name."""
+        layer = self.get(name)
+        if layer is None:
+            raise KeyError(name)
+        return layer
+
+    def get(self, name: str) -> Layer | None:
+        """Return the outermost layer named name, if any."""
+        for idx, entry in enumerate(self._entries):
+            if entry[0] == name:
+                return self.layers[idx]
+        return None
+
+    def layer_offset(self, name: str) -> int | None:
+        """Return the offset of the outermost layer named name without creating layers, if any."""
+        for entry in self._entries:
+            if entry[0] == name:
+                return entry[2]
+        return None
+
+    @property
+    def names(self) -> list[str]:
+        """Return the layer names, outermost first."""
+        return [entry[0] for entry in self._entries]
+
+    @property
+    def bounds(self) -> list[tuple[str, int, int, int]]:
+        """Return the name, offset, header length and end of every layer without creating layers, outermost first."""
+        return [(name, offset, hdr_length, end) for name, _, offset, hdr_length, end in self._entries]
+
+    @property
+    def layers(self) -> list[Layer]:
+        """Return the packet layers, outermost first."""
+        if self._layers is None:
+            self._layers = [Layer(name, hdr_cls, self.data, *bounds) for name, hdr_cls, *bounds in self._entries]
+        return self._layers
+
+    @property
+    def payload(self) -> memoryview:
+        """Return a view of the payload of the innermost layer."""
+        if not self._entries:
+            return self.data
+        _, _, offset, hdr_length, end = self._entries[-1]
+        return self.data[offset + hdr_length : end]
+
+
+_decoders: dict[str, dict[int, Decoder]] = {"link": {}, "ether": {}, "ip": {}}
+
+
+def register_decoder(table: str, key: int, decoder: Decoder) -> None:
+    """Register a layer decoder in the link, ether or ip decoder table."""
+    try:
+        _decoders[table][int(key)] = decoder
+    except KeyError as err:
+        raise ValueError(f"Invalid decoder table ({table!r}), must be one of {', '.join(_decoders)}") from err
+
+
+def decode(data: bytes | bytearray | memoryview, link_type: LinkType | int = LinkType.ETHERNET) -> Packet:
+    """Return a packet decoded into layers, starting with the link_type link layer.
+
+    Decoding stops at the first layer without a decoder or with a truncated or invalid
+    header, the remaining data is the payload of the innermost decoded layer.
+    """
+    view = data if isinstance(data, memoryview) else memoryview(data)
+    entries: list[tuple[str, type | None, int, int, int]] = []
+    table: str | None = "link"
+    key = int(link_type)
+    offset = 0
+    end = len(view)
+    while table is not None:
+        decoder = _decoders[table].get(key)
+        if decoder is None:
+            break
+        decoded = decoder(view, offset, end)
+        if decoded is None:
+            break
+        name, hdr_cls, hdr_length, end, table, key = decoded
+        entries.append((name, hdr_cls, offset, hdr_length, end))
+        offset += hdr_length
+    return Packet(view, entries)
+
+
+_ETH = Struct("!12xH")
+_ETH_LENGTH = 14
+_VLAN = Struct("!2xH")
+_IPV4 = Struct("!BxH2xHxB")
+_IPV6 = Struct("!4xHB")
+_IPV6_EXT = Struct("!BB")
+_IPV6_FRAG = Struct("!BxH")
+_TCP = Struct("!12xB")
+_UDP = Struct("!4xH")
+
+
+def _decode_eth(view: memoryview, offset: int, end: int) -> tuple | None:
+    """Decode an Ethernet header."""
+    if end - offset < _ETH_LENGTH:
+        return None
+    return ("eth", EthHdr, _ETH_LENGTH, end, "ether", _ETH.unpack_from(view, offset)[0])
+
+
+def _decode_raw_ip(view: memoryview, offset: int, end: int) -> tuple | None:
+    """Decode an IPv4 or IPv6 header, selected by the IP version."""
+    if end <= offset:
+        return None
+    version = view[offset] >> 4
+    if version == 4:
+        return _decode_ipv4(view, offset, end)
+    if version == 6:
+        return _decode_ipv6(view, offset, end)
+    return None
+
+
+def _decode_vlan(view: memoryview, offset: int, end: int) -> tuple | None:
+    """Decode an 802.1Q VLAN tag."""
+    if end - offset < 4:
+        return None
+    return ("vlan", VLANTag, 4, end, "ether", _VLAN.unpack_from(view, offset)[0])
+
+
+def _decode_ipv4(view: memoryview, offset: int, end: int) -> tuple | None:
+    """Decode an IPv4 header, the layer ends at the IPv4 total length."""
+    if end - offset < 20:
+        return None
+    ver_ihl, total_length, flags_off, protocol = _IPV4.unpack_from(view, offset)
+    hdr_length = (ver_ihl & 0xF) * 4
+    if hdr_length < 20 or total_length < hdr_length or offset + total_length > end:
+        return None
+    # Only the first fragment holds the next layer header
+    if flags_off & 0x1FFF:
+        return ("ipv4", IPv4Hdr, hdr_length, offset + total_length, None, 0)
+    return ("ipv4", IPv4Hdr, hdr_length, offset + total_length, "ip", protocol)
+
+
+def _decode_ipv6(view: memoryview, offset: int, end: int) -> tuple | None:
+    """Decode an IPv6 header, the layer ends at the IPv6 payload length."""
+    if end - offset < 40:
+        return None
+    payload_length, next_hdr = _IPV6.unpack_from(view, offset)
+    if offset + 40 + payload_length > end:
+        return None
+    # Jumbo payloads (payload length 0) extend to the end of the enclosing layer
+    return ("ipv6", IPv6Hdr, 40, offset + 40 + payload_length if payload_length else end, "ip", next_hdr)
+
+
+def _ipv6_ext_decoder(name: str) -> Decoder:
+    """Return a decoder of an IPv6 extension header sized in 8 byte units."""
+
+    def decode_ext(view: memoryview, offset: int, end: int) -> tuple | None:
+        if end - offset < 8:
+            return None
+        next_hdr, ext_length = _IPV6_EXT.unpack_from(view, offset)
+        hdr_length = (ext_length + 1) * 8
+        if offset + hdr_length > end:
+            return None
+        return (name, None, hdr_length, end, "ip", next_hdr)
+
+    return decode_ext
+
+
+def _decode_ipv6_frag(view: memoryview, offset: int, end: int) -> tuple | None:
+    """Decode an IPv6 fragment extension header."""
+    if end - offset < 8:
+        return None
+    next_hdr, frag = _IPV6_FRAG.unpack_from(view, offset)
+    if frag & 0xFFF8:
+        return ("ipv6_frag", FragmentExtHdr, 8, end, None, 0)
+    return ("ipv6_frag", FragmentExtHdr, 8, end, "ip", next_hdr)
+
+
+def _decode_tcp(view: memoryview, offset: int, end: int) -> tuple | None:
+    """Decode a TCP header, including its options."""
+    if end - offset < 20:
+        return None
+    hdr_length = (_TCP.unpack_from(view, offset)[0] >> 4) * 4
+    if hdr_length < 20 or offset + hdr_length > end:
+        return None
+    return ("tcp", TCPHdr, hdr_length, end, None, 0)
+
+
+def _decode_udp(view: memoryview, offset: int, end: int) -> tuple | None:
+    """Decode a UDP header, the layer ends at the UDP length."""
+    if end - offset < 8:
+        return None
+    length = _UDP.unpack_from(view, offset)[0]
+    if length < 8 or offset + length > end:
+        return None
+    return ("udp", UDPHdr, 8, offset + length, None, 0)
+
+
+register_decoder("link", LinkType.ETHERNET, _decode_eth)
+register_decoder("link", LinkType.RAW, _decode_raw_ip)
+register_decoder("link", LinkType.IPV4, _decode_ipv4)
+register_decoder("link", LinkType.IPV6, _decode_ipv6)
+register_decoder("ether", EtherType.VLAN_TAGGED, _decode_vlan)
+register_decoder("ether", EtherType.IPV4, _decode_ipv4)
+register_decoder("ether", EtherType.IPV6, _decode_ipv6)
+register_decoder("ip", IPProto.HOPOPT, _ipv6_ext_decoder("ipv6_hopopt"))
+register_decoder("ip", IPProto.IPV6_ROUTE, _ipv6_ext_decoder("ipv6_route"))
+register_decoder("ip", IPProto.IPV6_OPTS, _ipv6_ext_decoder("ipv6_opts"))
+register_decoder("ip", IPProto.IPV6_FRAG, _decode_ipv6_frag)
+register_decoder("ip", IPProto.TCP, _decode_tcp)
+register_decoder("ip", IPProto.UDP, _decode_udp)
+# Built-in decoders, the NumPy capture masks of Filter mirror these
+_builtin_decoders = {table: dict(decoders) for table, decoders in _decoders.items()}
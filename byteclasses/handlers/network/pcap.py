@@ -0,0 +1,248 @@
+"""Pcap Capture File Handler and Writer Classes.
+
+[Specification](https://www.ietf.org/archive/id/draft-ietf-opsawg-pcap-04.html)
+"""
+
+import builtins
+import os
+import time
+from array import array
+from collections.abc import Iterator
+from functools import cached_property
+from struct import Struct
+from typing import TYPE_CHECKING, Any, BinaryIO, cast
+
+from ...constants import _PARAMS
+from ...numpy import _import_numpy
+from .._data_handler import _DataHandler
+from .packet import LinkType, Packet, decode
+from .pcap_hdr import PCAP_MAGIC, PCAP_MAGIC_NS, PcapHdrBE, PcapHdrLE, PcapRecHdrBE, PcapRecHdrLE
+
+if TYPE_CHECKING:
+    import numpy as np
+
+__all__ = [
+    "Pcap",
+    "PcapWriter",
+]
+
+DEFAULT_BUFFER_SIZE = 1 << 20
+
+_HDR_LENGTH = 24
+_REC_HDR_LENGTH = 16
+
+
+class Pcap(_DataHandler):
+    """Pcap Capture File Data Handler Class.
+
+    Packet records are indexed in a single pass on first access, records are then
+    accessed by packet number as views over the capture data. Use Pcap.open to memory
+    map a capture file.
+    """
+
+    def __init__(self, data: bytes | bytearray | memoryview = bytearray(b"")) -> None:
+        """Initialize Pcap instance."""
+        super().__init__(data)
+        if len(self._data) < _HDR_LENGTH:
+            raise ValueError("Insufficient data")
+        magic = int.from_bytes(self._data[:4], "little")
+        if magic in (PCAP_MAGIC, PCAP_MAGIC_NS):
+            hdr_cls: type[PcapHdrLE] = PcapHdrLE
+            self._rec_hdr_cls: type[PcapRecHdrLE] = PcapRecHdrLE
+        else:
+            magic = int.from_bytes(self._data[:4], "big")
+            if magic not in (PCAP_MAGIC, PCAP_MAGIC_NS):
+                raise ValueError(f"Invalid pcap magic ({bytes(self._data[:4])!r})")
+            hdr_cls = PcapHdrBE
+            self._rec_hdr_cls = PcapRecHdrBE
+        self._hdr: PcapHdrLE = hdr_cls.from_buffer(self._data)  # type: ignore[attr-defined]
+        self._rec_struct: Struct = getattr(self._rec_hdr_cls, _PARAMS).get_struct()
+        # Unpacks only the included length of a record header
+        self._incl_len = Struct(self._rec_struct.format[0] + "8xI")
+        self._ts_scale = 1e-9 if magic == PCAP_MAGIC_NS else 1e-6
+
+    def __str__(self) -> str:
+        """Return Pcap string."""
+        return f"{self.__class__.__name__}(link_type={self.link_type}, packets={self.packet_count})"
+
+    @property
+    def hdr(self) -> PcapHdrLE:
+        """Return pcap file header."""
+        return self._hdr
+
+    @property
+    def link_type(self) -> int:
+        """Return capture link type."""
+        return self.hdr.link_type.value
+
+    @property
+    def nanosecond(self) -> bool:
+        """Return whether timestamps have nanosecond resolution."""
+        return self._ts_scale == 1e-9
+
+    @cached_property
+    def offsets(self) -> array:
+        """Return the offset of every complete packet record.
+
+        A truncated record at the end of the capture is not indexed.
+        """
+        offsets = array("Q")
+        append = offsets.append
+        unpack_from = self._incl_len.unpack_from
+        data = self._data
+        size = len(data)
+        offset = _HDR_LENGTH
+        while offset + _REC_HDR_LENGTH <= size:
+            incl_len = unpack_from(data, offset)[0]
+            if offset + _REC_HDR_LENGTH + incl_len > size:
+                break
+            append(offset)
+            offset += _REC_HDR_LENGTH + incl_len
+        return offsets
+
+    @property
+    def packet_count(self) -> int:
+        """Return the number of packet records."""
+        return len(self.offsets)
+
+    def packet_bounds(self) -> tuple["np.ndarray", "np.ndarray"]:
+        """Return the data offsets and the data lengths of every packet record as NumPy arrays."""
+        np = _import_numpy()
+        offsets = np.frombuffer(self.offsets, dtype=np.uint64).astype(np.int64)
+        data = np.frombuffer(self._data, dtype=np.uint8)
+        byte_order = ">" if self._rec_hdr_cls is PcapRecHdrBE else "<"
+        incl_len = np.ascontiguousarray(data[(offsets + 8)[:, None] + np.arange(4)]).view(f"{byte_order}u4")
+        return offsets + _REC_HDR_LENGTH, incl_len[:, 0].astype(np.int64)
+
+    def record_hdr(self, idx: int) -> PcapRecHdrLE:
+        """Return the header of packet record idx."""
+        hdr = self._rec_hdr_cls.from_buffer(self._data, self.offsets[idx])  # type: ignore[attr-defined]
+        return cast(PcapRecHdrLE, hdr)
+
+    def packet_data(self, idx: int) -> memoryview:
+        """Return a view of the data of packet record idx."""
+        offset = self.offsets[idx]
+        start = offset + _REC_HDR_LENGTH
+        return self._data[start : start + self._incl_len.unpack_from(self._data, offset)[0]]
+
+    def timestamp(self, idx: int) -> float:
+        """Return the timestamp of packet record idx in seconds."""
+        ts_sec, ts_frac, _, _ = self._rec_struct.unpack_from(self._data, self.offsets[idx])
+        return float(ts_sec + ts_frac * self._ts_scale)
+
+    def packet(self, idx: int) -> Packet:
+        """Return packet record idx decoded into layers."""
+        return decode(self.packet_data(idx), self.link_type)
+
+    def iter_records(self) -> Iterator[tuple[PcapRecHdrLE, memoryview]]:
+        """Yield the header and a view of the data of every packet record.
+
+        A single header instance is re-attached to every record, so a header is only
+        valid until the next record is requested.
+        """
+        hdr = None
+        for offset in self.offsets:
+            if hdr is None:
+                hdr = self._rec_hdr_cls.from_buffer(self._data, offset)  # type: ignore[attr-defined]
+            else:
+                hdr.rebase(self._data, offset)
+            start = offset + _REC_HDR_LENGTH
+            yield hdr, self._data[start : start + hdr.incl_len.value]
+
+    def iter_packets(self) -> Iterator[Packet]:
+        """Yield every packet record decoded into layers."""
+        data = self._data
+        unpack_from = self._incl_len.unpack_from
+        link_type = self.link_type
+        for offset in self.offsets:
+            start = offset + _REC_HDR_LENGTH
+            yield decode(data[start : start + unpack_from(data, offset)[0]], link_type)
+
+
+class _CaptureWriter:
+    """A buffered capture file writer.
+
+    Records are appended to an in-memory buffer that is written to the file once it
+    exceeds the buffer size.
+    """
+
+    def __init__(self, file: str | os.PathLike | BinaryIO, buffer_size: int) -> None:
+        """Initialize capture writer instance."""
+        if isinstance(file, (str, os.PathLike)):
+            self._file: BinaryIO = builtins.open(file, "wb")
+            self._owns_file = True
+        else:
+            self._file = file
+            self._owns_file = False
+        self._buffer = bytearray()
+        self._buffer_size = buffer_size
+
+    def __enter__(self) -> Any:
+        """Enter capture writer context."""
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        """Exit capture writer context."""
+        self.close()
+
+    def _append(self, record: bytes | bytearray | memoryview) -> None:
+        """Append a record to the buffer, writing the buffer out once full."""
+        self._buffer += record
+        if len(self._buffer) >= self._buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered records to the file."""
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flush the buffered records and close the file if it was opened by the writer."""
+        if self._file.closed:
+            return
+        self.flush()
+        if self._owns_file:
+            self._file.close()
+
+
+class PcapWriter(_CaptureWriter):
+    """Buffered Little Endian Pcap Capture File Writer Class."""
+
+    def __init__(
+        self,
+        file: str | os.PathLike | BinaryIO,
+        link_type: LinkType | int = LinkType.ETHERNET,
+        *,
+        snaplen: int = 0x40000,
+        nanosecond: bool = False,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> None:
+        """Initialize pcap writer instance and write the file header."""
+        super().__init__(file, buffer_size)
+        self._snaplen = snaplen
+        self._ts_scale = 1_000_000_000 if nanosecond else 1_000_000
+        self._rec_struct: Struct = getattr(PcapRecHdrLE, _PARAMS).get_struct()
+        hdr_struct: Struct = getattr(PcapHdrLE, _PARAMS).get_struct()
+        magic = PCAP_MAGIC_NS if nanosecond else PCAP_MAGIC
+        self._append(hdr_struct.pack(magic, 2, 4, 0, 0, snaplen, int(link_type)))
+
+    def write(
+        self, data: bytes | bytearray | memoryview, timestamp: float | None = None, orig_len: int | None = None
+    ) -> None:
+        """Append a packet record, timestamp defaults to the current time.
+
+        Packets longer than the snapshot length are truncated, orig_len defaults to the
+        packet length.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        ts_sec = int(timestamp)
+        ts_frac = min(round((timestamp - ts_sec) * self._ts_scale), self._ts_scale - 1)
+        if orig_len is None:
+            orig_len = len(data)
+        if len(data) > self._snaplen:
+            data = data[: self._snaplen]
+        self._buffer += self._rec_struct.pack(ts_sec, ts_frac, len(data), orig_len)
+        self._append(data)
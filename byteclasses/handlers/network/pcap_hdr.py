@@ -0,0 +1,53 @@
+"""Pcap Capture File Headers implemented with byteclasses.
+
+[Specification](https://www.ietf.org/archive/id/draft-ietf-opsawg-pcap-04.html)
+"""
+
+from ..._enums import ByteOrder
+from ...types.collections import structure
+from ...types.primitives.integers import Int32, UInt16, UInt32
+
+__all__ = [
+    "PCAP_MAGIC",
+    "PCAP_MAGIC_NS",
+    "PcapHdrBE",
+    "PcapHdrLE",
+    "PcapRecHdrBE",
+    "PcapRecHdrLE",
+]
+
+PCAP_MAGIC = 0xA1B2C3D4  # Microsecond timestamps
+PCAP_MAGIC_NS = 0xA1B23C4D  # Nanosecond timestamps
+
+
+@structure(byte_order=ByteOrder.LE, packed=True)
+class PcapHdrLE:
+    """Little Endian Pcap File Header."""
+
+    magic: UInt32
+    version_major: UInt16
+    version_minor: UInt16
+    thiszone: Int32
+    sigfigs: UInt32
+    snaplen: UInt32
+    link_type: UInt32
+
+
+@structure(byte_order=ByteOrder.BE, packed=True)
+class PcapHdrBE(PcapHdrLE):
+    """Big Endian Pcap File Header."""
+
+
+@structure(byte_order=ByteOrder.LE, packed=True, lazy=True)
+class PcapRecHdrLE:
+    """Little Endian Pcap Packet Record Header."""
+
+    ts_sec: UInt32
+    ts_frac: UInt32
+    incl_len: UInt32
+    orig_len: UInt32
+
+
+@structure(byte_order=ByteOrder.BE, packed=True, lazy=True)
+class PcapRecHdrBE(PcapRecHdrLE):
+    """Big Endian Pcap Packet Record Header."""
@@ -0,0 +1,273 @@
+"""Pcapng Capture File Handler and Writer Classes.
+
+[Specification](https://www.ietf.org/archive/id/draft-ietf-opsawg-pcapng-01.html)
+"""
+
+import os
+import time
+from array import array
+from collections.abc import Iterator
+from functools import cached_property
+from struct import Struct
+from typing import TYPE_CHECKING, Any, BinaryIO, NamedTuple, cast
+
+from ...constants import _PARAMS
+from ...numpy import _import_numpy
+from .._data_handler import _DataHandler
+from .packet import LinkType, Packet, decode
+from .pcap import DEFAULT_BUFFER_SIZE, _CaptureWriter
+from .pcapng_block import (
+    BYTE_ORDER_MAGIC,
+    BlockType,
+    EnhancedPacketBlockBE,
+    EnhancedPacketBlockLE,
+    IfaceDescBlockLE,
+    SectionHdrBlockLE,
+    SimplePacketBlockBE,
+    SimplePacketBlockLE,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+__all__ = [
+    "Interface",
+    "PcapNG",
+    "PcapNGWriter",
+]
+
+_EPB_LENGTH = 28
+# Plain int block types, enum member lookups are slow in the indexing loop
+_SHB_TYPE = int(BlockType.SECTION_HDR)
+_IDB_TYPE = int(BlockType.IFACE_DESC)
+_EPB_TYPE = int(BlockType.ENHANCED_PACKET)
+_SPB_TYPE = int(BlockType.SIMPLE_PACKET)
+_SPB_LENGTH = 12
+_IDB_LENGTH = 16
+_OPT_END = 0
+_OPT_IF_TSRESOL = 9
+_SWAPPED_BYTE_ORDER_MAGIC = int.from_bytes(BYTE_ORDER_MAGIC.to_bytes(4, "little"), "big")
+# Block type, total length and first body word
+_BLOCK = {"<": Struct("<III"), ">": Struct(">III")}
+_OPTION = {"<": Struct("<HH"), ">": Struct(">HH")}
+_EPB = {"<": Struct("<8xIIIII"), ">": Struct(">8xIIIII")}
+_SPB = {"<": Struct("<8xI"), ">": Struct(">8xI")}
+_IDB = {"<": Struct("<8xH2xI"), ">": Struct(">8xH2xI")}
+
+
+class Interface(NamedTuple):
+    """Pcapng capture interface, ts_unit is the timestamp resolution in seconds."""
+
+    link_type: int
+    snaplen: int
+    ts_unit: float
+    byte_order: str
+
+
+class PcapNG(_DataHandler):
+    """Pcapng Capture File Data Handler Class.
+
+    Blocks are indexed in a single pass on first access, packet blocks are then accessed
+    by packet number as views over the capture data. Sections of either byte order are
+    supported. Use PcapNG.open to memory map a capture file.
+    """
+
+    def __init__(self, data: bytes | bytearray | memoryview = bytearray(b"")) -> None:
+        """Initialize PcapNG instance."""
+        super().__init__(data)
+        if len(self._data) < 12:
+            raise ValueError("Insufficient data")
+        if int.from_bytes(self._data[:4], "little") != BlockType.SECTION_HDR:
+            raise ValueError(f"Invalid pcapng magic ({bytes(self._data[:4])!r})")
+        self._interfaces: list[Interface] = []
+
+    def __str__(self) -> str:
+        """Return PcapNG string."""
+        return f"{self.__class__.__name__}(interfaces={len(self.interfaces)}, packets={self.packet_count})"
+
+    @cached_property
+    def _index(self) -> tuple[array, array]:
+        """Return the offset and the interface index of every complete packet block.
+
+        Indexing stops at the first truncated or invalid block.
+        """
+        offsets = array("Q")
+        ifaces = array("I")
+        data = self._data
+        size = len(data)
+        unpack_from = _BLOCK["<"].unpack_from
+        byte_order = "<"
+        iface_base = 0
+        offset = 0
+        while offset + 12 <= size:
+            # The section header block type reads the same in either byte order
+            block_type, block_length, word = unpack_from(data, offset)
+            if block_type == _SHB_TYPE:
+                if word == BYTE_ORDER_MAGIC:
+                    pass
+                elif word == _SWAPPED_BYTE_ORDER_MAGIC:
+                    byte_order = "<" if byte_order == ">" else ">"
+                    unpack_from = _BLOCK[byte_order].unpack_from
+                    block_type, block_length, word = unpack_from(data, offset)
+                else:
+                    break
+                iface_base = len(self._interfaces)
+            if block_length < 12 or block_length % 4 or offset + block_length > size:
+                break
+            if block_type == _EPB_TYPE:
+                offsets.append(offset)
+                ifaces.append(iface_base + word)
+            elif block_type == _SPB_TYPE:
+                offsets.append(offset)
+                ifaces.append(iface_base)
+            elif block_type == _IDB_TYPE:
+                self._interfaces.append(self._interface(offset, block_length, byte_order))
+            offset += block_length
+        return offsets, ifaces
+
+    def _interface(self, offset: int, block_length: int, byte_order: str) -> Interface:
+        """Return the interface described by an interface description block."""
+        link_type, snaplen = _IDB[byte_order].unpack_from(self._data, offset)
+        ts_unit = 1e-6
+        option = offset + _IDB_LENGTH
+        end = offset + block_length - 4
+        while option + 4 <= end:
+            code, length = _OPTION[byte_order].unpack_from(self._data, option)
+            if code == _OPT_END:
+                break
+            if code == _OPT_IF_TSRESOL and length >= 1:
+                tsresol = self._data[option + 4]
+                ts_unit = 2.0 ** -(tsresol & 0x7F) if tsresol & 0x80 else 10.0**-tsresol
+            option += 4 + -(-length // 4) * 4
+        return Interface(link_type, snaplen, ts_unit, byte_order)
+
+    @property
+    def interfaces(self) -> list[Interface]:
+        """Return the capture interfaces of all sections."""
+        _ = self._index
+        return self._interfaces
+
+    @property
+    def offsets(self) -> array:
+        """Return the offset of every packet block."""
+        return self._index[0]
+
+    @property
+    def packet_count(self) -> int:
+        """Return the number of packet blocks."""
+        return len(self._index[0])
+
+    def interface(self, idx: int) -> Interface:
+        """Return the capture interface of packet idx."""
+        iface: int = self._index[1][idx]
+        if iface >= len(self._interfaces):
+            raise ValueError(f"Packet {idx} references an undescribed interface")
+        return self._interfaces[iface]
+
+    def record_hdr(self, idx: int) -> EnhancedPacketBlockLE | SimplePacketBlockLE:
+        """Return the enhanced or simple packet block header of packet idx."""
+        offset = self.offsets[idx]
+        big = self.interface(idx).byte_order == ">"
+        block_cls: Any
+        if _BLOCK[">" if big else "<"].unpack_from(self._data, offset)[0] == BlockType.ENHANCED_PACKET:
+            block_cls = EnhancedPacketBlockBE if big else EnhancedPacketBlockLE
+        else:
+            block_cls = SimplePacketBlockBE if big else SimplePacketBlockLE
+        return cast("EnhancedPacketBlockLE | SimplePacketBlockLE", block_cls.from_buffer(self._data, offset))
+
+    def _packet_bounds(self, idx: int) -> tuple[int, int]:
+        """Return the data offset and the data length of packet idx."""
+        offset = self.offsets[idx]
+        iface = self.interface(idx)
+        block_type, block_length, _ = _BLOCK[iface.byte_order].unpack_from(self._data, offset)
+        if block_type == BlockType.ENHANCED_PACKET:
+            start = offset + _EPB_LENGTH
+            length = _EPB[iface.byte_order].unpack_from(self._data, offset)[3]
+        else:
+            start = offset + _SPB_LENGTH
+            length = _SPB[iface.byte_order].unpack_from(self._data, offset)[0]
+            if iface.snaplen:
+                length = min(length, iface.snaplen)
+        return start, min(length, offset + block_length - 4 - start)
+
+    def packet_bounds(self) -> tuple["np.ndarray", "np.ndarray"]:
+        """Return the data offsets and the data lengths of every packet as NumPy arrays."""
+        np = _import_numpy()
+        bounds = np.array([self._packet_bounds(idx) for idx in range(self.packet_count)], dtype=np.int64)
+        bounds = bounds.reshape(-1, 2)
+        return bounds[:, 0], bounds[:, 1]
+
+    def packet_data(self, idx: int) -> memoryview:
+        """Return a view of the data of packet idx."""
+        start, length = self._packet_bounds(idx)
+        return self._data[start : start + length]
+
+    def timestamp(self, idx: int) -> float | None:
+        """Return the timestamp of packet idx in seconds, simple packet blocks have none."""
+        offset = self.offsets[idx]
+        iface = self.interface(idx)
+        if _BLOCK[iface.byte_order].unpack_from(self._data, offset)[0] != BlockType.ENHANCED_PACKET:
+            return None
+        _, ts_high, ts_low, _, _ = _EPB[iface.byte_order].unpack_from(self._data, offset)
+        return float(((ts_high << 32) | ts_low) * iface.ts_unit)
+
+    def packet(self, idx: int) -> Packet:
+        """Return packet idx decoded into layers."""
+        return decode(self.packet_data(idx), self.interface(idx).link_type)
+
+    def iter_packets(self) -> Iterator[Packet]:
+        """Yield every packet decoded into layers."""
+        for idx in range(self.packet_count):
+            yield self.packet(idx)
+
+
+class PcapNGWriter(_CaptureWriter):
+    """Buffered Little Endian Pcapng Capture File Writer Class.
+
+    Writes a single section with a single interface, packets are written as enhanced
+    packet blocks with microsecond timestamps.
+    """
+
+    def __init__(
+        self,
+        file: str | os.PathLike | BinaryIO,
+        link_type: LinkType | int = LinkType.ETHERNET,
+        *,
+        snaplen: int = 0x40000,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> None:
+        """Initialize pcapng writer instance and write the section and interface blocks."""
+        super().__init__(file, buffer_size)
+        self._snaplen = snaplen
+        self._epb_struct: Struct = getattr(EnhancedPacketBlockLE, _PARAMS).get_struct()
+        shb_struct: Struct = getattr(SectionHdrBlockLE, _PARAMS).get_struct()
+        idb_struct: Struct = getattr(IfaceDescBlockLE, _PARAMS).get_struct()
+        shb_length = shb_struct.size + 4
+        idb_length = idb_struct.size + 4
+        self._append(shb_struct.pack(BlockType.SECTION_HDR, shb_length, BYTE_ORDER_MAGIC, 1, 0, -1))
+        self._append(shb_length.to_bytes(4, "little"))
+        self._append(idb_struct.pack(BlockType.IFACE_DESC, idb_length, int(link_type), 0, snaplen))
+        self._append(idb_length.to_bytes(4, "little"))
+
+    def write(
+        self, data: bytes | bytearray | memoryview, timestamp: float | None = None, orig_len: int | None = None
+    ) -> None:
+        """Append an enhanced packet block, timestamp defaults to the current time.
+
+        Packets longer than the snapshot length are truncated, orig_len defaults to the
+        packet length.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        ts = round(timestamp * 1_000_000)
+        if orig_len is None:
+            orig_len = len(data)
+        if len(data) > self._snaplen:
+            data = data[: self._snaplen]
+        padding = -len(data) % 4
+        block_length = _EPB_LENGTH + len(data) + padding + 4
+        self._buffer += self._epb_struct.pack(
+            BlockType.ENHANCED_PACKET, block_length, 0, ts >> 32, ts & 0xFFFFFFFF, len(data), orig_len
+        )
+        self._buffer += data
+        self._append(bytes(padding) + block_length.to_bytes(4, "little"))
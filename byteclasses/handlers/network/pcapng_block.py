@@ -0,0 +1,120 @@
+"""Pcapng Capture File Blocks implemented with byteclasses.
+
+[Specification](https://www.ietf.org/archive/id/draft-ietf-opsawg-pcapng-01.html)
+"""
+
+from enum import IntEnum
+
+from ..._enums import ByteOrder
+from ...types.collections import structure
+from ...types.primitives.integers import Int64, UInt16, UInt32
+
+__all__ = [
+    "BYTE_ORDER_MAGIC",
+    "BlockHdrBE",
+    "BlockHdrLE",
+    "BlockType",
+    "EnhancedPacketBlockBE",
+    "EnhancedPacketBlockLE",
+    "IfaceDescBlockBE",
+    "IfaceDescBlockLE",
+    "SectionHdrBlockBE",
+    "SectionHdrBlockLE",
+    "SimplePacketBlockBE",
+    "SimplePacketBlockLE",
+]
+
+BYTE_ORDER_MAGIC = 0x1A2B3C4D
+
+
+class BlockType(IntEnum):
+    """Pcapng Block Types."""
+
+    IFACE_DESC = 0x00000001
+    PACKET = 0x00000002
+    SIMPLE_PACKET = 0x00000003
+    NAME_RESOLUTION = 0x00000004
+    IFACE_STATS = 0x00000005
+    ENHANCED_PACKET = 0x00000006
+    DECRYPTION_SECRETS = 0x0000000A
+    CUSTOM = 0x00000BAD
+    CUSTOM_NO_COPY = 0x40000BAD
+    SECTION_HDR = 0x0A0D0D0A
+
+
+@structure(byte_order=ByteOrder.LE, packed=True, lazy=True)
+class BlockHdrLE:
+    """Little Endian Pcapng Generic Block Header."""
+
+    block_type: UInt32
+    block_total_length: UInt32
+
+
+@structure(byte_order=ByteOrder.BE, packed=True, lazy=True)
+class BlockHdrBE(BlockHdrLE):
+    """Big Endian Pcapng Generic Block Header."""
+
+
+@structure(byte_order=ByteOrder.LE, packed=True)
+class SectionHdrBlockLE:
+    """Little Endian Pcapng Section Header Block."""
+
+    block_type: UInt32
+    block_total_length: UInt32
+    byte_order_magic: UInt32
+    major_version: UInt16
+    minor_version: UInt16
+    section_length: Int64
+
+
+@structure(byte_order=ByteOrder.BE, packed=True)
+class SectionHdrBlockBE(SectionHdrBlockLE):
+    """Big Endian Pcapng Section Header Block."""
+
+
+@structure(byte_order=ByteOrder.LE, packed=True)
+class IfaceDescBlockLE:
+    """Little Endian Pcapng Interface Description Block."""
+
+    block_type: UInt32
+    block_total_length: UInt32
+    link_type: UInt16
+    reserved: UInt16
+    snaplen: UInt32
+
+
+@structure(byte_order=ByteOrder.BE, packed=True)
+class IfaceDescBlockBE(IfaceDescBlockLE):
+    """Big Endian Pcapng Interface Description Block."""
+
+
+@structure(byte_order=ByteOrder.LE, packed=True, lazy=True)
+class EnhancedPacketBlockLE:
+    """Little Endian Pcapng Enhanced Packet Block."""
+
+    block_type: UInt32
+    block_total_length: UInt32
+    interface_id: UInt32
+    ts_high: UInt32
+    ts_low: UInt32
+    captured_len: UInt32
+    orig_len: UInt32
+
+
+@structure(byte_order=ByteOrder.BE, packed=True, lazy=True)
+class EnhancedPacketBlockBE(EnhancedPacketBlockLE):
+    """Big Endian Pcapng Enhanced Packet Block."""
+
+
+@structure(byte_order=ByteOrder.LE, packed=True, lazy=True)
+class SimplePacketBlockLE:
+    """Little Endian Pcapng Simple Packet Block."""
+
+    block_type: UInt32
+    block_total_length: UInt32
+    orig_len: UInt32
+
+
+@structure(byte_order=ByteOrder.BE, packed=True, lazy=True)
+class SimplePacketBlockBE(SimplePacketBlockLE):
+    """Big Endian Pcapng Simple Packet Block."""
@@ -0,0 +1,373 @@
+"""TCP Stream Reassembly.
+
+Segments are assigned to flows by their addresses and ports and reassembled per direction
+by sequence number. Sequence numbers are unwrapped relative to the next expected byte, so
+streams may cross the 32-bit sequence number wraparound. Overlapping data is resolved in
+favour of the data received first.
+"""
+
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from struct import Struct
+from typing import Any, NamedTuple
+
+from .packet import Packet
+
+__all__ = [
+    "Flow",
+    "FlowKey",
+    "Stream",
+    "TCPReassembler",
+]
+
+DEFAULT_MAX_FLOWS = 1 << 16
+DEFAULT_MAX_STREAM_BYTES = 1 << 24
+
+_Buffer = bytes | bytearray | memoryview
+
+# Ports, sequence number and data offset/flags
+_TCP = Struct("!HHI4xH")
+_FIN = 0x01
+_SYN = 0x02
+_RST = 0x04
+_SEQ_MASK = 0xFFFFFFFF
+_SEQ_HALF = 1 << 31
+
+
+class FlowKey(NamedTuple):
+    """Flow addresses and ports, src is the endpoint that sent the first segment."""
+
+    src_addr: bytes
+    src_port: int
+    dst_addr: bytes
+    dst_port: int
+
+    def reverse(self) -> "FlowKey":
+        """Return the key of the opposite direction."""
+        return FlowKey(self.dst_addr, self.dst_port, self.src_addr, self.src_port)
+
+
+class Stream:
+    """A reassembled TCP stream of a single flow direction.
+
+    The in-order data is kept as a list of chunks that is only joined when the stream
+    data is requested, segments received ahead of a gap are held until the gap is
+    filled. Held data is never overwritten, only the parts of later segments that are
+    not held yet are kept. Data beyond max_bytes is dropped and the stream is marked
+    truncated.
+    """
+
+    __slots__ = (
+        "max_bytes",
+        "_chunks",
+        "_length",
+        "_next_seq",
+        "_pending",
+        "_pending_offsets",
+        "pending_bytes",
+        "fin",
+        "truncated",
+    )
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_STREAM_BYTES) -> None:
+        """Initialize stream instance."""
+        self.max_bytes = max_bytes
+        self._chunks: list[_Buffer] = []
+        self._length = 0
+        self._next_seq: int | None = None
+        self._pending: dict[int, _Buffer] = {}
+        self._pending_offsets: list[int] = []
+        self.pending_bytes = 0
+        self.fin = False
+        self.truncated = False
+
+    def __repr__(self) -> str:
+        """Return stream representation."""
+        return f"{self.__class__.__name__}(length={self._length}, pending={self.pending_bytes})"
+
+    def __len__(self) -> int:
+        """Return the length of the in-order stream data."""
+        return self._length
+
+    def __bytes__(self) -> bytes:
+        """Return the in-order stream data."""
+        return self.data
+
+    @property
+    def chunks(self) -> list[_Buffer]:
+        """Return the in-order stream data chunks."""
+        return self._chunks
+
+    @property
+    def data(self) -> bytes:
+        """Return the in-order stream data, chunks are joined once and replaced by the result."""
+        if len(self._chunks) != 1 or not isinstance(self._chunks[0], bytes):
+            self._chunks = [b"".join(self._chunks)]
+        return self._chunks[0]  # type: ignore[return-value]
+
+    def readinto(self, buffer: bytearray | memoryview, start: int = 0) -> int:
+        """Copy the stream data from offset start into buffer, return the number of bytes copied."""
+        view = memoryview(buffer).cast("B")
+        copied = 0
+        offset = 0
+        for chunk in self._chunks:
+            if copied == len(view):
+                break
+            end = offset + len(chunk)
+            if end > start:
+                skip = max(start - offset, 0)
+                part = memoryview(chunk)[skip : skip + len(view) - copied]
+                view[copied : copied + len(part)] = part
+                copied += len(part)
+            offset = end
+        return copied
+
+    def _add(self, seq: int, payload: _Buffer, syn: bool) -> None:
+        """Add a segment payload to the stream."""
+        if self._next_seq is None:
+            self._next_seq = (seq + 1) & _SEQ_MASK if syn else seq
+        elif syn:
+            return
+        if not payload:
+            return
+        # Stream offset of the payload, unwrapped around the next expected sequence number
+        offset = self._length + ((seq + syn - self._next_seq + _SEQ_HALF) & _SEQ_MASK) - _SEQ_HALF
+        end = offset + len(payload)
+        if offset >= self.max_bytes:
+            self.truncated = True
+            return
+        if end > self.max_bytes:
+            self.truncated = True
+            end = self.max_bytes
+        if end <= self._length:
+            return
+        if offset < self._length:
+            payload = payload[self._length - offset : end - offset]
+            offset = self._length
+        else:
+            payload = payload[: end - offset]
+        if offset > self._length:
+            self._hold(offset, payload)
+            return
+        offsets = self._pending_offsets
+        if offsets and offsets[0] < end:
+            # Held data was received first, only the data before it is appended
+            self._hold(offsets[0], payload[offsets[0] - offset :])
+            payload = payload[: offsets[0] - offset]
+        self._append(payload)
+        self._drain()
+
+    def _append(self, payload: _Buffer) -> None:
+        """Append in-order data to the stream."""
+        self._chunks.append(payload)
+        self._length += len(payload)
+        self._next_seq = (self._next_seq + len(payload)) & _SEQ_MASK  # type: ignore[operator]
+
+    def _hold(self, offset: int, payload: _Buffer) -> None:
+        """Hold the parts of a segment received ahead of a gap that are not held yet."""
+        offsets = self._pending_offsets
+        end = offset + len(payload)
+        idx = bisect_left(offsets, offset)
+        if idx and offsets[idx - 1] + len(self._pending[offsets[idx - 1]]) > offset:
+            idx -= 1
+        parts = []
+        start = offset
+        while start < end:
+            if idx < len(offsets) and offsets[idx] < end:
+                held = offsets[idx]
+                if held > start:
+                    parts.append((start, held))
+                start = max(start, held + len(self._pending[held]))
+                idx += 1
+            else:
+                parts.append((start, end))
+                break
+        for start, stop in parts:
+            if self._length + self.pending_bytes + stop - start > self.max_bytes:
+                self.truncated = True
+                return
+            insort(offsets, start)
+            self._pending[start] = payload[start - offset : stop - offset]
+            self.pending_bytes += stop - start
+
+    def _drain(self) -> None:
+        """Append held segments that are no longer preceded by a gap."""
+        offsets = self._pending_offsets
+        count = 0
+        while count < len(offsets) and offsets[count] <= self._length:
+            offset = offsets[count]
+            count += 1
+            payload = self._pending.pop(offset)
+            self.pending_bytes -= len(payload)
+            if offset + len(payload) > self._length:
+                self._append(payload[self._length - offset :])
+        del offsets[:count]
+
+
+class Flow:
+    """A TCP flow, client is the direction of the first segment seen."""
+
+    __slots__ = ("key", "client", "server", "first_seen", "last_seen", "reset")
+
+    def __init__(self, key: FlowKey, max_stream_bytes: int, timestamp: float) -> None:
+        """Initialize flow instance."""
+        self.key = key
+        self.client = Stream(max_stream_bytes)
+        self.server = Stream(max_stream_bytes)
+        self.first_seen = timestamp
+        self.last_seen = timestamp
+        self.reset = False
+
+    def __repr__(self) -> str:
+        """Return flow representation."""
+        return f"{self.__class__.__name__}({self.key}, client={self.client!r}, server={self.server!r})"
+
+    @property
+    def closed(self) -> bool:
+        """Return whether the flow was reset or both directions were finished."""
+        return self.reset or (self.client.fin and self.server.fin)
+
+
+class TCPReassembler:
+    """TCP Flow Table and Stream Reassembler.
+
+    Flows are kept in least recently used order. Once max_flows flows are active the
+    least recently used flow is evicted, flows are also released when closed or expired.
+    on_release is called with every released flow. Stream data is capped at
+    max_stream_bytes per direction.
+
+    Closed flows are remembered, up to max_flows of them, until they expire. Late
+    segments of a closed flow, such as the final ACK, return the closed flow instead of
+    opening a new one, only a SYN opens a new flow for the same addresses and ports.
+
+    Payloads are copied by default. With copy=False streams hold views over the packet
+    data, which must stay valid, e.g. an open memory mapped capture, while the streams
+    are in use.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_flows: int = DEFAULT_MAX_FLOWS,
+        max_stream_bytes: int = DEFAULT_MAX_STREAM_BYTES,
+        on_release: Callable[[Flow], Any] | None = None,
+        copy: bool = True,
+    ) -> None:
+        """Initialize TCP reassembler instance."""
+        if max_flows < 1:
+            raise ValueError(f"Invalid maximum number of flows ({max_flows})")
+        self.max_flows = max_flows
+        self.max_stream_bytes = max_stream_bytes
+        self.on_release = on_release
+        self.copy = copy
+        self._flows: OrderedDict[FlowKey, Flow] = OrderedDict()
+        self._closed: OrderedDict[FlowKey, Flow] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of active flows."""
+        return len(self._flows)
+
+    def __iter__(self) -> Iterator[Flow]:
+        """Return an active flow iterator, least recently used first."""
+        return iter(list(self._flows.values()))
+
+    def get(self, key: FlowKey) -> Flow | None:
+        """Return the active flow of key in either direction, if any."""
+        return self._flows.get(key) or self._flows.get(key.reverse())
+
+    def add_segment(self, ip: Any, tcp: Any, payload: _Buffer = b"", timestamp: float = 0.0) -> Flow:
+        """Add a TCP segment and return its flow.
+
+        ip is an IPv4 or IPv6 header and tcp a TCP header, each given as a header
+        structure or buffer.
+        """
+        ip_data = ip if isinstance(ip, (bytes, bytearray, memoryview)) else bytes(ip)
+        tcp_data = tcp if isinstance(tcp, (bytes, bytearray, memoryview)) else bytes(tcp)
+        if ip_data[0] >> 4 == 4:
+            src_addr, dst_addr = bytes(ip_data[12:16]), bytes(ip_data[16:20])
+        else:
+            src_addr, dst_addr = bytes(ip_data[8:24]), bytes(ip_data[24:40])
+        src_port, dst_port, seq, off_flag = _TCP.unpack_from(tcp_data)
+        key = FlowKey(src_addr, src_port, dst_addr, dst_port)
+        flow = self._flows.get(key)
+        if flow is not None:
+            stream = flow.client
+        else:
+            flow = self._flows.get(key.reverse())
+            if flow is not None:
+                stream = flow.server
+            else:
+                closed = self._closed.get(key) or self._closed.get(key.reverse())
+                if closed is not None:
+                    if not off_flag & _SYN:
+                        self._closed.move_to_end(closed.key)
+                        closed.last_seen = timestamp
+                        return closed
+                    del self._closed[closed.key]
+                flow = self._new_flow(key, timestamp)
+                stream = flow.client
+        self._flows.move_to_end(flow.key)
+        flow.last_seen = timestamp
+        if self.copy and payload:
+            payload = bytes(payload)
+        stream._add(seq, payload, bool(off_flag & _SYN))  # pylint: disable=W0212
+        if off_flag & _RST:
+            flow.reset = True
+        elif off_flag & _FIN:
+            stream.fin = True
+        if flow.closed:
+            self._release(flow.key)
+            self._closed[flow.key] = flow
+            if len(self._closed) > self.max_flows:
+                self._closed.popitem(last=False)
+        return flow
+
+    def add(self, packet: Packet, timestamp: float = 0.0) -> Flow | None:
+        """Add the TCP segment of a decoded packet, return its flow or None when the packet has none."""
+        tcp = packet.get("tcp")
+        if tcp is None:
+            return None
+        ip = packet.get("ipv4") or packet["ipv6"]
+        return self.add_segment(ip.header, tcp.header, tcp.payload, timestamp)
+
+    def add_many(self, packets: Iterable[Packet]) -> None:
+        """Add the TCP segments of decoded packets."""
+        for packet in packets:
+            self.add(packet)
+
+    def expire(self, before: float) -> int:
+        """Release the flows last seen before timestamp before, return the number released.
+
+        Closed flows last seen before timestamp before are forgotten.
+        """
+        while self._closed and next(iter(self._closed.values())).last_seen < before:
+            self._closed.popitem(last=False)
+        count = 0
+        while self._flows:
+            flow = next(iter(self._flows.values()))
+            if flow.last_seen >= before:
+                break
+            self._release(flow.key)
+            count += 1
+        return count
+
+    def flush(self) -> None:
+        """Release every active flow and forget the closed flows."""
+        self._closed.clear()
+        while self._flows:
+            self._release(next(iter(self._flows)))
+
+    def _new_flow(self, key: FlowKey, timestamp: float) -> Flow:
+        """Return a new active flow, evicting the least recently used flow when the table is full."""
+        if len(self._flows) >= self.max_flows:
+            self._release(next(iter(self._flows)))
+        flow = Flow(key, self.max_stream_bytes, timestamp)
+        self._flows[key] = flow
+        return flow
+
+    def _release(self, key: FlowKey) -> None:
+        """Remove a flow from the table and pass it to on_release."""
+        flow = self._flows.pop(key)
+        if self.on_release is not None:
+            self.on_release(flow)
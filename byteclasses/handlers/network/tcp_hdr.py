@@ -9,8 +9,8 @@ class OffFlag(BitField):
     """Offset and Flag BitField."""
 
     byte_length = 2
-    data_offset = BitPos(0, bit_width=4)
-    flags = BitPos(4, bit_width=12)
+    data_offset = BitPos(12, bit_width=4)
+    flags = BitPos(0, bit_width=12)
 
 
 @structure(byte_order=b"!", packed=True)
@@ -0,0 +1,204 @@
+"""Byteclasses NumPy Module.
+
+Bridges byteclass layouts to NumPy structured dtypes. NumPy is an optional dependency,
+it is only imported when one of these functions is called.
+"""
+
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, cast
+
+from ._enums import ByteOrder
+from .constants import _PARAMS
+from .types.collections._collection import members
+from .types.collections._layout import _make_member, _std_type_char
+from .types.collections.byte_array import ByteArray
+from .types.collections.factory import make_fixed_collection
+from .types.collections.member import member
+from .types.collections.string import String
+from .types.primitives._primitive import _Primitive
+from .types.primitives._primitive_number import _PrimitiveNumber
+from .types.primitives.bitfield import BitField
+from .types.primitives.byte_enum import ByteEnum
+from .types.primitives.floats import Float16, Float32, Float64
+from .types.primitives.generics import Byte
+from .types.primitives.integers import Int8, Int16, Int32, Int64, UInt8, UInt16, UInt32, UInt64
+from .util import is_byteclass_collection, is_byteclass_collection_instance
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy import dtype as DType
+
+__all__ = ["from_dtype", "to_dtype"]
+
+_DTYPE_BYTE_ORDER = {
+    ByteOrder.NATIVE: "=",
+    ByteOrder.NATIVE_STD: "=",
+    ByteOrder.LE: "<",
+    ByteOrder.BE: ">",
+    ByteOrder.NET: ">",
+}
+
+# NumPy reports explicit native byte order as "=", map it to the concrete byte order.
+_BYTE_ORDER_DTYPE = {
+    "=": ByteOrder.LE if sys.byteorder == "little" else ByteOrder.BE,
+    "<": ByteOrder.LE,
+    ">": ByteOrder.BE,
+}
+
+_PRIMITIVE_DTYPE: dict[tuple[str, int], type[_Primitive]] = {
+    ("i", 1): Int8,
+    ("i", 2): Int16,
+    ("i", 4): Int32,
+    ("i", 8): Int64,
+    ("u", 1): UInt8,
+    ("u", 2): UInt16,
+    ("u", 4): UInt32,
+    ("u", 8): UInt64,
+    ("b", 1): UInt8,
+    ("f", 2): Float16,
+    ("f", 4): Float32,
+    ("f", 8): Float64,
+}
+
+
+def _import_numpy() -> ModuleType:
+    """Return the numpy module."""
+    try:
+        import numpy  # pylint: disable=C0415,E0401
+    except ImportError as err:
+        raise ImportError("NumPy is required for byteclass dtype support.") from err
+    return numpy
+
+
+def _member_dtype(instance: Any) -> "np.dtype":
+    """Return the dtype of a single collection member instance."""
+    np = _import_numpy()
+    if isinstance(instance, ByteEnum):
+        instance = instance._var  # pylint: disable=W0212
+    if is_byteclass_collection_instance(instance) and not isinstance(instance, ByteArray):
+        return to_dtype(type(instance))
+    spec: Any
+    if isinstance(instance, String):
+        spec = f"S{len(instance)}"
+    elif isinstance(instance, ByteArray):
+        spec = (_member_dtype(instance.items[0]), (instance.item_count,))
+    elif isinstance(instance, _PrimitiveNumber):
+        spec = _DTYPE_BYTE_ORDER[instance.byte_order] + _std_type_char(instance.type_char).decode()
+    elif isinstance(instance, BitField) and len(instance) in (1, 2, 4, 8):
+        dtype_byte_order = "<" if instance.legacy_bit_numbering else _DTYPE_BYTE_ORDER[instance.byte_order]
+        spec = f"{dtype_byte_order}u{len(instance)}"
+    else:
+        spec = f"V{len(instance)}"
+    return cast("DType[Any]", np.dtype(spec))
+
+
+def to_dtype(cls: type) -> "np.dtype":
+    """Return a NumPy structured dtype matching the layout of a byteclass collection.
+
+    Member offsets, including alignment padding, and byte order are taken from the
+    collection, so the dtype can be used to view collection data directly. Nested
+    collections become nested dtypes, ByteArray members become subarrays and String
+    members become byte strings.
+    """
+    if not is_byteclass_collection(cls) or not isinstance(cls, type) or issubclass(cls, ByteArray):
+        raise TypeError(f"{cls!r} is not a byteclass collection class.")
+    np = _import_numpy()
+    params = getattr(cls, _PARAMS)
+    layout = params.get_layout()
+    names: list[str] = []
+    formats: list[DType[Any]] = []
+    for member_ in members(cls):
+        names.append(member_.name)
+        formats.append(_member_dtype(_make_member(member_, params.byte_order)))
+    spec = {"names": names, "formats": formats, "offsets": list(layout.offsets), "itemsize": layout.length}
+    return cast("DType[Any]", np.dtype(spec))
+
+
+def _dtype_byte_order(dtype: "np.dtype") -> ByteOrder | None:
+    """Return the common byte order of all fields in a dtype."""
+    byte_orders: set[ByteOrder] = set()
+    stack = [dtype]
+    while stack:
+        current = stack.pop()
+        if current.fields is not None:
+            stack.extend(field[0] for field in current.fields.values())
+        elif current.subdtype is not None:
+            stack.append(current.subdtype[0])
+        elif current.byteorder != "|":
+            byte_orders.add(_BYTE_ORDER_DTYPE[current.byteorder])
+    if len(byte_orders) > 1:
+        raise ValueError(f"Mixed byte orders ({', '.join(sorted(bo.name for bo in byte_orders))}) are not supported.")
+    return byte_orders.pop() if byte_orders else None
+
+
+def _field_member(name: str, dtype: "np.dtype") -> tuple[str, type, Any]:
+    """Return a member definition for a dtype field."""
+    if dtype.fields is not None:
+        collection = from_dtype(dtype, name)
+        return (name, collection, member(factory=collection))
+    if dtype.subdtype is not None:
+        base, shape = dtype.subdtype
+        count = 1
+        for dim in shape:
+            count *= dim
+        item_type = _PRIMITIVE_DTYPE.get((base.kind, base.itemsize))
+        if item_type is None or count < 2:
+            raise TypeError(f"Unsupported subarray dtype for field {name!r} ({dtype}).")
+        return (
+            name,
+            ByteArray,
+            member(factory=lambda byte_order: ByteArray(count, item_type, byte_order=byte_order)),
+        )
+    if dtype.kind == "S":
+        length = dtype.itemsize
+        return (name, String, member(factory=lambda byte_order: String(length, null_terminated=False)))
+    if dtype.kind == "V":
+        return _pad_member(name, dtype.itemsize)
+    primitive = _PRIMITIVE_DTYPE.get((dtype.kind, dtype.itemsize))
+    if primitive is None:
+        raise TypeError(f"Unsupported dtype for field {name!r} ({dtype}).")
+    return (name, primitive, member(factory=primitive))
+
+
+def _pad_member(name: str, length: int) -> tuple[str, type, Any]:
+    """Return a raw byte member definition."""
+    if length == 1:
+        return (name, Byte, member(factory=Byte))
+    return (name, ByteArray, member(factory=lambda byte_order: ByteArray(length, byte_order=byte_order)))
+
+
+def from_dtype(dtype: Any, name: str, *, byte_order: bytes | ByteOrder | None = None) -> type:
+    """Return a new byteclass collection class matching a NumPy structured dtype.
+
+    Fields sharing offset 0 produce a union, otherwise a structure is created with
+    explicit pad members for any gaps between fields. All fields must share a single
+    byte order, byte_order is only used when the dtype does not specify one.
+    """
+    np = _import_numpy()
+    dtype = np.dtype(dtype)
+    if dtype.fields is None:
+        raise TypeError(f"{dtype} is not a structured dtype.")
+    dtype_byte_order = _dtype_byte_order(dtype)
+    if dtype_byte_order is not None:
+        byte_order = dtype_byte_order
+    elif byte_order is None:
+        byte_order = ByteOrder.NATIVE
+    fields = sorted(
+        ((field[1], field_name, field[0]) for field_name, field in dtype.fields.items()), key=lambda x: x[0]
+    )
+    if len(fields) > 1 and all(offset == 0 for offset, _, _ in fields):
+        members_ = [_field_member(field_name, field_dtype) for _, field_name, field_dtype in fields]
+        return cast(type, make_fixed_collection("union", name, members_, byte_order=byte_order))
+    members_ = []
+    offset = 0
+    for field_offset, field_name, field_dtype in fields:
+        if field_offset < offset:
+            raise ValueError(f"Field {field_name!r} overlaps a previous field.")
+        if field_offset > offset:
+            members_.append(_pad_member(f"_pad{offset}", field_offset - offset))
+        members_.append(_field_member(field_name, field_dtype))
+        offset = field_offset + field_dtype.itemsize
+    if dtype.itemsize > offset:
+        members_.append(_pad_member(f"_pad{offset}", dtype.itemsize - offset))
+    return cast(type, make_fixed_collection("structure", name, members_, byte_order=byte_order, packed=True))
@@ -10,6 +10,7 @@ from rich.table import Table  # pylint: disable=E0401
 from rich.text import Text  # pylint: disable=E0401
 
 from .constants import _MEMBERS, _PARAMS
+from .types.collections._collection import members
 from .types.collections.byte_array import ByteArray
 from .types.primitives._primitive import _Primitive
 from .util import is_byteclass_collection_instance, is_byteclass_instance, is_byteclass_primitive_instance
@@ -198,7 +199,7 @@ def byteclass_inspect(
         print_table_func = _print_byteclass_primitive_panel
     print_table_func(obj, byte_width=byte_width, console=console)
     if legend:
-        byteclass_table(obj, show_data=False, title="Legend")
+        byteclass_table(obj, show_data=False, title="Legend", console=console)
 
 
 def _print_byteclass_structure_panel(obj, *, byte_width: int, console):
@@ -282,20 +283,16 @@ def _generate_structure_lines(obj, v_offset_width: int, byte_width: int) -> list
     curr_offset = 0
     line_offset = 0
     data_str = ""
-    for member_name in getattr(obj, _MEMBERS):
-        member = getattr(obj, member_name)
-        if not is_byteclass_instance(member):
-            continue
+    layout = getattr(obj, _PARAMS).get_layout()
+    for member_, mbr_offset, mbr_len in zip(members(obj), layout.offsets, layout.lengths):
+        member = getattr(obj, member_.name)
         color = next(member_colors)
-        mbr_len = len(member)
         # Insert padding
-        if curr_offset != member.offset:
-            padding_len = member.offset - curr_offset
+        if curr_offset != mbr_offset:
+            padding_len = mbr_offset - curr_offset
             if line_offset + padding_len < byte_width:
                 data_str += (
-                    f"[{FILL_COLOR}]|"
-                    + _data_str(obj.data[curr_offset : member.offset], FILL_COLOR)
-                    + f"[/{FILL_COLOR}]"
+                    f"[{FILL_COLOR}]|" + _data_str(obj.data[curr_offset:mbr_offset], FILL_COLOR) + f"[/{FILL_COLOR}]"
                 )
                 curr_offset += padding_len
                 line_offset += padding_len
@@ -310,7 +307,7 @@ def _generate_structure_lines(obj, v_offset_width: int, byte_width: int) -> list
                 lines.append(_generate_data_line(data_str, (curr_offset // byte_width) * byte_width, v_offset_width))
                 data_str = (
                     f"[{FILL_COLOR}]|"
-                    + _data_str(obj.data[curr_offset + part1_len : member.offset], color)
+                    + _data_str(obj.data[curr_offset + part1_len : mbr_offset], color)
                     + f"[/{FILL_COLOR}]"
                 )
                 curr_offset += padding_len
@@ -0,0 +1,90 @@
+"""Record streaming over buffers and binary streams."""
+
+from collections.abc import Callable, Iterator
+from typing import Any
+
+__all__: list[str] = []
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+def _iter_records(
+    source: Any,
+    record_length: int,
+    new_record: Callable[[memoryview], Any],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    reuse: bool = True,
+) -> Iterator[Any]:
+    """Yield consecutive fixed length records from a buffer or a binary stream.
+
+    Buffers are iterated in place. Streams are read in chunks with readinto (or recv_into
+    for sockets), records straddling a chunk boundary are carried over to the next chunk.
+
+    With reuse set, a single record instance is re-attached to every record and the
+    chunk buffer is recycled, so a yielded record is only valid until the next one is
+    requested. Otherwise every record is a new instance over a buffer that is never
+    overwritten.
+    """
+    if record_length < 1:
+        raise ValueError(f"Invalid record length ({record_length})")
+    if chunk_size < 1:
+        raise ValueError(f"Invalid chunk size ({chunk_size})")
+    try:
+        view = memoryview(source)
+    except TypeError:
+        view = None
+    if view is not None:
+        if view.ndim != 1 or view.format != "B":
+            view = view.cast("B")
+        yield from _iter_view(view, record_length, new_record, reuse)
+        if len(view) % record_length:
+            raise ValueError(f"Trailing partial record ({len(view) % record_length} bytes)")
+        return
+
+    read_into = getattr(source, "readinto", None) or getattr(source, "recv_into", None)
+    if read_into is None:
+        raise TypeError(f"Unsupported record source ({type(source)})")
+    # Always fit at least one whole record and never split a chunk mid record
+    buffer_size = max(chunk_size - chunk_size % record_length, record_length)
+    buffer = bytearray(buffer_size)
+    filled = 0
+    record = None
+    while True:
+        count = read_into(memoryview(buffer)[filled:])
+        if not count:
+            break
+        filled += count
+        complete = filled - filled % record_length
+        if not complete:
+            continue
+        chunk = memoryview(buffer)[:complete]
+        for record in _iter_view(chunk, record_length, new_record, reuse, record):
+            yield record
+        remainder = buffer[complete:filled]
+        if not reuse:
+            # Records handed out keep referencing the old buffer, so never overwrite it
+            buffer = bytearray(buffer_size)
+        buffer[: len(remainder)] = remainder
+        filled = len(remainder)
+    if filled:
+        raise ValueError(f"Trailing partial record ({filled} bytes)")
+
+
+def _iter_view(
+    view: memoryview,
+    record_length: int,
+    new_record: Callable[[memoryview], Any],
+    reuse: bool,
+    record: Any = None,
+) -> Iterator[Any]:
+    """Yield every whole record in view."""
+    for offset in range(0, len(view) - record_length + 1, record_length):
+        if not reuse:
+            yield new_record(view[offset : offset + record_length])
+        elif record is None:
+            record = new_record(view[offset : offset + record_length])
+            yield record
+        else:
+            record.rebase(view, offset)
+            yield record
@@ -4,8 +4,18 @@ from .byte_array import ByteArray
 from .byteclass_collection_protocol import ByteclassCollection
 from .factory import make_fixed_collection
 from .member import member
+from .record_array import RecordArray
 from .string import String
 from .structure import structure
 from .union import union
 
-__all__ = ["ByteArray", "ByteclassCollection", "String", "make_fixed_collection", "structure", "union", "member"]
+__all__ = [
+    "ByteArray",
+    "ByteclassCollection",
+    "RecordArray",
+    "String",
+    "make_fixed_collection",
+    "structure",
+    "union",
+    "member",
+]
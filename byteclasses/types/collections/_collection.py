@@ -3,7 +3,7 @@
 import inspect
 import sys
 from abc import update_abstractmethods
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from copy import deepcopy
 from typing import Any, cast
 
@@ -14,13 +14,19 @@ from ._collection_class_spec import _CollectionClassSpec
 from ._methods import (
     _build_attach_members_method,
     _build_attach_method,
+    _build_bytes_eq_method,
+    _build_bytes_hash_method,
     _build_bytes_method,
     _build_cmp_method,
     _build_data_property,
     _build_delattr_method,
+    _build_from_buffer_method,
+    _build_getattr_method,
     _build_getitem_method,
     _build_hash_method,
+    _build_iter_from_method,
     _build_len_method,
+    _build_rebase_method,
     _build_repr_method,
     _build_setattr_method,
     _build_setitem_method,
@@ -29,6 +35,7 @@ from ._methods import (
 )
 from ._params import _Params
 from ._util import _set_new_attribute, _set_qualname, _tuple_str
+from ._values import _ValuesAttribute
 from .byteclass_collection_protocol import ByteclassCollection, ByteclassCollectionError
 from .member import _MEMBER, _SUPPORTED_MBR_TYPES, MISSING, Member, _get_member, _MissingType
 
@@ -42,6 +49,9 @@ __all__ = [
     "ByteclassCollection",
 ]
 
+# Equality and hash modes, comparing member values or the raw collection bytes.
+_CMP_MODES = ("members", "bytes")
+
 
 def create_collection(
     cls: type | None,
@@ -50,9 +60,17 @@ def create_collection(
     packed: bool,
     methods: dict[str, Callable],
     allowed_types: tuple[type, ...] | None = None,
+    lazy: bool = False,
+    eq: str = "members",
+    hash: str = "members",  # pylint: disable=W0622
+    order: Iterable[str] | None = None,
 ) -> ByteclassCollection | Callable[[type], ByteclassCollection]:
     """Create custom collection class."""
     byte_order = ByteOrder(byte_order)
+    for name, mode in (("eq", eq), ("hash", hash)):
+        if mode not in _CMP_MODES:
+            raise ValueError(f"Invalid {name} mode ({mode!r}), must be one of {', '.join(map(repr, _CMP_MODES))}")
+    order_keys = None if order is None else tuple(order)
 
     def outer_wrapper(cls: type) -> ByteclassCollection:
         spec = _CollectionClassSpec(
@@ -61,6 +79,10 @@ def create_collection(
             byte_order=ByteOrder(byte_order),
             packed=packed,
             methods=methods,
+            lazy=lazy,
+            eq=eq,
+            hash=hash,
+            order=order_keys,
         )
         if allowed_types:
             spec.allowed_types = allowed_types
@@ -263,6 +285,8 @@ def _add_methods(spec: _CollectionClassSpec, globals_: dict[str, Any]):
     has_explicit_hash = not (class_hash is MISSING or (class_hash is None and "__eq__" in spec.base_cls.__dict__))
     if has_explicit_hash:
         build_hash_method_: Callable = _raise_hash_exception
+    elif spec.hash == "bytes":
+        build_hash_method_ = _build_bytes_hash_method
     else:
         build_hash_method_ = _build_hash_method
 
@@ -279,26 +303,41 @@ def _add_methods(spec: _CollectionClassSpec, globals_: dict[str, Any]):
         "__setattr__": _build_setattr_method,  # Restrict the class attributes
         "attach": _build_attach_method,
         "_attach_members": _build_attach_members_method,
+        "from_buffer": _build_from_buffer_method,
+        "iter_from": _build_iter_from_method,
+        "rebase": _build_rebase_method,
     }
+    if spec.lazy:
+        methods["__getattr__"] = _build_getattr_method
     methods.update(spec.methods)
     for method_name, func_constructor in methods.items():
         if func_constructor:
             method = _set_qualname(spec.base_cls, func_constructor(spec, globals_))
             setattr(spec.base_cls, method_name, method)
+    if spec.lazy and all(member_.name != "values" for member_ in spec.members):
+        # Member values decoded straight from the collection data, see _values
+        setattr(spec.base_cls, "values", _ValuesAttribute(spec))
 
     # Create __eq__ method.  There's no need for a __ne__ method,
     # since python will call __eq__ and negate it.
-    self_tuple = _tuple_str(spec.self_name, spec.members)
-    other_tuple = _tuple_str("other", spec.members)
-    _set_new_attribute(
-        spec.base_cls,
-        "__eq__",
-        _build_cmp_method(spec, "__eq__", "==", self_tuple, other_tuple, globals_=globals_),
-    )
-
-    # Create and set the ordering methods.
-    self_tuple = _tuple_str(spec.self_name, spec.members)
-    other_tuple = _tuple_str("other", spec.members)
+    if spec.eq == "bytes":
+        eq_method = _build_bytes_eq_method(spec, globals_)
+    else:
+        self_tuple = _tuple_str(spec.self_name, spec.members)
+        other_tuple = _tuple_str("other", spec.members)
+        eq_method = _build_cmp_method(spec, "__eq__", "==", self_tuple, other_tuple, globals_=globals_)
+    _set_new_attribute(spec.base_cls, "__eq__", eq_method)
+
+    # Create and set the ordering methods, ordering by the selected key members if any.
+    order_members = spec.members
+    if spec.order is not None:
+        member_map = {member_.name: member_ for member_ in spec.members}
+        unknown = [name for name in spec.order if name not in member_map]
+        if unknown or not spec.order:
+            raise ValueError(f"Invalid order keys {unknown or list(spec.order)} for {spec.base_cls.__name__}")
+        order_members = [member_map[name] for name in spec.order]
+    self_tuple = _tuple_str(spec.self_name, order_members)
+    other_tuple = _tuple_str("other", order_members)
     for name, operation in [
         ("__lt__", "<"),
         ("__le__", "<="),
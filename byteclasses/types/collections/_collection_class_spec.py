@@ -28,3 +28,7 @@ class _CollectionClassSpec:  # pylint: disable=R0902
     attributes: list[str] = field(default_factory=list)
     self_name: str = "self"
     length: int = 0
+    lazy: bool = False
+    eq: str = "members"
+    hash: str = "members"
+    order: tuple[str, ...] | None = None
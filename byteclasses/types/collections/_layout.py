@@ -0,0 +1,114 @@
+"""Collection layout compilation."""
+
+from collections.abc import Callable
+from struct import Struct, calcsize
+from typing import Any, NamedTuple, cast
+
+from ..._enums import ByteOrder
+from ...types.primitives._primitive_number import _PrimitiveNumber
+from ...types.primitives.byte_enum import ByteEnum
+from ._collection_class_spec import _CollectionClassSpec
+from .member import MISSING, Member
+
+__all__: list[str] = []
+
+# Native sized type characters and their standard sized equivalents.
+_NATIVE_SIZED = {b"l": (b"i", b"q"), b"L": (b"I", b"Q"), b"n": (b"i", b"q"), b"N": (b"I", b"Q")}
+
+
+def _struct_prefix(byte_order: ByteOrder) -> str:
+    """Return a struct format prefix for byte_order.
+
+    Native byte order is mapped to native endianness with standard sizing and no
+    alignment, padding is always emitted explicitly by the layout.
+    """
+    if byte_order is ByteOrder.NATIVE:
+        return ByteOrder.NATIVE_STD.value.decode()
+    return cast(bytes, byte_order.value).decode()
+
+
+def _std_type_char(type_char: bytes) -> bytes:
+    """Return a standard sized type character equivalent to a native type character."""
+    if type_char in _NATIVE_SIZED:
+        return _NATIVE_SIZED[type_char][calcsize(type_char) == 8]
+    return type_char
+
+
+def _make_member(member_: Member, byte_order: ByteOrder) -> Any:
+    """Return a new member instance using the member factory or type."""
+    factory = cast(Callable[..., Any], member_.type if member_.factory is MISSING else member_.factory)
+    instance = factory(byte_order=byte_order)
+    try:
+        instance.byte_order = byte_order
+    except AttributeError:
+        pass
+    return instance
+
+
+def _member_code(instance: Any) -> str:
+    """Return the struct format code used to decode a member instance.
+
+    Numeric primitives (and enums backed by numeric primitives) decode to their value, every
+    other member decodes to its raw bytes.
+    """
+    if isinstance(instance, ByteEnum):
+        instance = instance._var  # pylint: disable=W0212
+    if isinstance(instance, _PrimitiveNumber):
+        return _std_type_char(instance.type_char).decode()
+    return f"{len(instance)}s"
+
+
+class _Layout(NamedTuple):
+    """Member offsets and lengths of a fixed size collection."""
+
+    offsets: tuple[int, ...]
+    lengths: tuple[int, ...]
+    slices: tuple[slice, ...]
+    length: int
+    defaults: bytes
+
+
+def _compute_layout(spec: _CollectionClassSpec) -> _Layout:
+    """Return the member layout of a collection specification.
+
+    Structure members are placed sequentially and size aligned unless packed, union
+    members all start at offset 0.
+    """
+    offsets: list[int] = []
+    lengths: list[int] = []
+    values: list[bytes] = []
+    offset = 0
+    for member_ in spec.members:
+        instance = _make_member(member_, spec.byte_order)
+        mbr_len = len(instance)
+        if spec.collection_type == "union":
+            offset = 0
+        elif not spec.packed and offset % mbr_len != 0:
+            offset += mbr_len - (offset % mbr_len)
+        offsets.append(offset)
+        lengths.append(mbr_len)
+        values.append(bytes(instance))
+        offset += mbr_len
+    length = max(offset + mbr_len for offset, mbr_len in zip(offsets, lengths))
+    slices = tuple(slice(offset, offset + mbr_len) for offset, mbr_len in zip(offsets, lengths))
+    defaults = bytearray(length)
+    for slice_, value in zip(slices, values):
+        defaults[slice_] = value
+    return _Layout(tuple(offsets), tuple(lengths), slices, length, bytes(defaults))
+
+
+def _compile_struct(spec: _CollectionClassSpec, layout: _Layout) -> Struct:
+    """Return a single struct.Struct decoding all members of a structure specification.
+
+    Padding between members is emitted as explicit pad bytes, so the compiled format
+    mirrors the collection byte for byte.
+    """
+    codes: list[str] = []
+    offset = 0
+    for member_, mbr_offset in zip(spec.members, layout.offsets):
+        if mbr_offset != offset:
+            codes.append(f"{mbr_offset - offset}x")
+        instance = _make_member(member_, spec.byte_order)
+        codes.append(_member_code(instance))
+        offset = mbr_offset + len(instance)
+    return Struct(_struct_prefix(spec.byte_order) + "".join(codes))
@@ -7,10 +7,15 @@ from reprlib import recursive_repr
 from typing import Any, cast
 
 from ..._enums import ByteOrder
+from ...constants import _PARAMS
+from .._stream import DEFAULT_CHUNK_SIZE, _iter_records
+from ..primitives._primitive import _Primitive
+from ..primitives.byte_enum import ByteEnum
 from ._collection_class_spec import _CollectionClassSpec
-from ._util import _tuple_str
+from ._layout import _make_member
+from ._util import _buffer_view, _tuple_str
 from .byteclass_collection_protocol import ByteclassCollectionError
-from .member import MISSING, _member_assign
+from .member import MISSING, _init_members, _member_assign
 
 
 def _create_method(
@@ -52,18 +57,43 @@ def _build_init_method(
 ) -> Callable:
     """Create structure init function."""
     locals_: dict[str, Any] = {f"_type_{member_.name}": member_.type for member_ in spec.members}
-    locals_.update({"MISSING": MISSING, "ByteString": ByteString, "ByteOrder": ByteOrder})
+    locals_.update(
+        {
+            "MISSING": MISSING,
+            "ByteString": ByteString,
+            "ByteOrder": ByteOrder,
+            "_params": getattr(spec.base_cls, _PARAMS),
+        }
+    )
     init_body = [
         _member_assign("byte_order", "byte_order", spec.self_name),
         _member_assign("offset", "0", spec.self_name),
     ]
+    if not spec.lazy:
+        init_body.extend(_init_members(spec, locals_))
     init_body.extend(body)
+    # Member offsets and collection length are read from the cached class layout
+    init_body.append("layout = _params.layout or _params.get_layout()")
+    init_body.append(_member_assign("_length", "layout.length", spec.self_name))
+    if spec.lazy:
+        # Members are materialized on first access, start from the default member values
+        init_body.append(
+            _member_assign("_data", "memoryview(bytearray(layout.defaults))", spec.self_name),
+        )
+    else:
+        init_body.append("offsets = layout.offsets")
+        for idx, member_ in enumerate(spec.members):
+            init_body.append(f"{spec.self_name}.{member_.name}.offset = offsets[{idx}]")
+        init_body.extend(
+            [
+                # Initialize _data
+                _member_assign("_data", f"memoryview(bytearray({spec.self_name}._length))", spec.self_name),
+                # Attach members to slices of _data memoryview
+                f"{spec.self_name}._attach_members(retain_value=True)",
+            ]
+        )
     init_body.extend(
         [
-            # Initialize _data
-            _member_assign("_data", f"memoryview(bytearray({spec.self_name}._length))", spec.self_name),
-            # Attach members to slices of _data memoryview
-            f"{spec.self_name}._attach_members(retain_value=True)",
             "if data is not None:",
             f"  {spec.self_name}.data = data",
         ]
@@ -196,6 +226,37 @@ def _build_hash_method(
     return _create_method("__hash__", (spec.self_name,), [f"return hash({self_tuple})"], globals_=globals_)
 
 
+def _build_bytes_eq_method(
+    spec: _CollectionClassSpec,
+    globals_: dict[str, Any],
+) -> Callable:
+    """Create an equality function comparing the raw collection bytes.
+
+    Padding bytes are part of the compared data, instances with equal member values but
+    different padding bytes are not equal.
+    """
+    return _create_method(
+        "__eq__",
+        (spec.self_name, "other"),
+        [
+            f"if other.__class__ is {spec.self_name}.__class__:",
+            f" return {spec.self_name}._data == other._data",
+            "return NotImplemented",
+        ],
+        globals_=globals_,
+    )
+
+
+def _build_bytes_hash_method(
+    spec: _CollectionClassSpec,
+    globals_: dict[str, Any],
+) -> Callable:
+    """Create a hash function hashing the raw collection bytes, including padding bytes."""
+    return _create_method(
+        "__hash__", (spec.self_name,), [f"return hash(BUILTINS.bytes({spec.self_name}._data))"], globals_=globals_
+    )
+
+
 # Decide if/how we're going to create a hash function.  Key is
 # (unsafe_hash, eq, frozen, does-hash-exist).  Value is the action to
 # take.  The common case is to do nothing, so instead of providing a
@@ -254,19 +315,31 @@ def _build_attach_members_method(
 ) -> Callable:
     """Generate a private _attach_members method for the class.
 
-    Attaches members to internal _data attribute.
+    Attaches members to internal _data attribute. Lazy collections only attach members
+    that have already been materialized.
     """
     locals_ = {
         "cls": spec.base_cls,
+        "_params": getattr(spec.base_cls, _PARAMS),
     }
-    lengths_str = "[" + ",".join(f"len(self.{member_.name})" for member_ in spec.members) + "]"
-    body: list[str] = [f"member_lengths = {lengths_str}"]
-    for member_ in spec.members:
-        body.append(
-            f"{spec.self_name}.{member_.name}.attach("
-            f"{spec.self_name}._data[{spec.self_name}.{member_.name}.offset:"
-            f"{spec.self_name}.{member_.name}.offset + len({spec.self_name}.{member_.name})], retain_value)"
-        )
+    body: list[str] = [
+        "slices = (_params.layout or _params.get_layout()).slices",
+        f"data = {spec.self_name}._data",
+    ]
+    for idx, member_ in enumerate(spec.members):
+        if spec.lazy:
+            body.extend(
+                [
+                    "try:",
+                    f"  member = BUILTINS.object.__getattribute__({spec.self_name}, {member_.name!r})",
+                    "except AttributeError:",
+                    "  pass",
+                    "else:",
+                    f"  member.attach(data[slices[{idx}]], retain_value)",
+                ]
+            )
+        else:
+            body.append(f"{spec.self_name}.{member_.name}.attach(data[slices[{idx}]], retain_value)")
 
     return _create_method(
         "attach",
@@ -278,6 +351,42 @@ def _build_attach_members_method(
     )
 
 
+def _build_getattr_method(
+    spec: _CollectionClassSpec,
+    globals_: dict[str, Any],
+) -> Callable:
+    """Generate a __getattr__ method for a lazy collection class.
+
+    Members are only created and attached to their slice of _data on first access.
+    """
+    locals_ = {
+        "cls": spec.base_cls,
+        "_params": getattr(spec.base_cls, _PARAMS),
+        "_members": {member_.name: (idx, member_) for idx, member_ in enumerate(spec.members)},
+        "_make_member": _make_member,
+        "_byte_order": spec.byte_order,
+    }
+    body = [
+        "try:",
+        "  idx, member_ = _members[name]",
+        "except KeyError:",
+        "  raise AttributeError(f'{cls.__name__!r} object has no attribute {name!r}') from None",
+        "layout = _params.layout or _params.get_layout()",
+        "member = _make_member(member_, _byte_order)",
+        "member.offset = layout.offsets[idx]",
+        f"member.attach({spec.self_name}._data[layout.slices[idx]], False)",
+        f"BUILTINS.object.__setattr__({spec.self_name}, name, member)",
+        "return member",
+    ]
+    return _create_method(
+        "__getattr__",
+        (spec.self_name, "name"),
+        body,
+        locals_=locals_,
+        globals_=globals_,
+    )
+
+
 def _build_bytes_method(
     spec: _CollectionClassSpec,
     globals_: dict[str, Any],
@@ -299,6 +408,190 @@ def _build_bytes_method(
     )
 
 
+def _build_unpack_from_method(
+    spec: _CollectionClassSpec,
+    globals_: dict[str, Any],
+) -> Callable:
+    """Generate an unpack_from classmethod for the class.
+
+    Decodes every member of the collection from a buffer with a single compiled struct call.
+    """
+    locals_ = {
+        "_params": getattr(spec.base_cls, _PARAMS),
+        "ByteString": ByteString,
+    }
+    body = ["return (_params.struct or _params.get_struct()).unpack_from(buffer, offset)"]
+    return _create_method(
+        "unpack_from",
+        ("cls", "buffer: ByteString", "offset: int = 0"),
+        body,
+        decorators=["classmethod"],
+        locals_=locals_,
+        globals_=globals_,
+        return_type=tuple,
+    )
+
+
+def _build_pack_into_method(
+    spec: _CollectionClassSpec,
+    globals_: dict[str, Any],
+) -> Callable:
+    """Generate a pack_into method for the class.
+
+    The instance data is already encoded, so packing is a single buffer copy.
+    """
+    locals_ = {
+        "ByteString": ByteString,
+    }
+    body = [
+        f"end = offset + len({spec.self_name})",
+        f"BUILTINS.memoryview(buffer)[offset:end] = {spec.self_name}._data",
+    ]
+    return _create_method(
+        "pack_into",
+        (spec.self_name, "buffer: ByteString", "offset: int = 0"),
+        body,
+        locals_=locals_,
+        globals_=globals_,
+        return_type=None,
+    )
+
+
+def _build_as_tuple_fast_method(
+    spec: _CollectionClassSpec,
+    globals_: dict[str, Any],
+) -> Callable:
+    """Generate an as_tuple_fast method for the class.
+
+    Returns all member values decoded with a single compiled struct call.
+    """
+    locals_ = {
+        "_params": getattr(spec.base_cls, _PARAMS),
+    }
+    body = [f"return (_params.struct or _params.get_struct()).unpack_from({spec.self_name}._data)"]
+    return _create_method(
+        "as_tuple_fast",
+        (spec.self_name,),
+        body,
+        locals_=locals_,
+        globals_=globals_,
+        return_type=tuple,
+    )
+
+
+def _build_from_buffer_method(
+    spec: _CollectionClassSpec,
+    globals_: dict[str, Any],
+) -> Callable:
+    """Generate a from_buffer classmethod for the class.
+
+    Builds an instance directly over a slice of an external buffer, no backing data is
+    allocated and no bytes are copied.
+    """
+    locals_: dict[str, Any] = {
+        "_params": getattr(spec.base_cls, _PARAMS),
+        "_buffer_view": _buffer_view,
+        "_byte_order": spec.byte_order,
+        "ByteOrder": ByteOrder,
+    }
+    self_name = spec.self_name
+    body = [
+        "layout = _params.layout or _params.get_layout()",
+        f"{self_name} = cls.__new__(cls)",
+        _member_assign("byte_order", "_byte_order", self_name),
+        _member_assign("offset", "0", self_name),
+        _member_assign("_length", "layout.length", self_name),
+        _member_assign("_data", "_buffer_view(buffer, offset, layout.length, readonly_ok)", self_name),
+    ]
+    if not spec.lazy:
+        body.extend(_init_members(spec, locals_))
+        body.append("offsets = layout.offsets")
+        for idx, member_ in enumerate(spec.members):
+            body.append(f"{self_name}.{member_.name}.offset = offsets[{idx}]")
+        body.append(f"{self_name}._attach_members(retain_value=False)")
+    body.append(f"return {self_name}")
+    return _create_method(
+        "from_buffer",
+        ("cls", "buffer", "offset: int = 0", "readonly_ok: bool = True"),
+        body,
+        decorators=["classmethod"],
+        locals_=locals_,
+        globals_=globals_,
+    )
+
+
+def _build_iter_from_method(
+    spec: _CollectionClassSpec,
+    globals_: dict[str, Any],
+) -> Callable:
+    """Generate an iter_from classmethod for the class.
+
+    Yields consecutive instances from a buffer or binary stream, see _iter_records.
+    """
+    locals_: dict[str, Any] = {
+        "_params": getattr(spec.base_cls, _PARAMS),
+        "_iter_records": _iter_records,
+        "DEFAULT_CHUNK_SIZE": DEFAULT_CHUNK_SIZE,
+    }
+    body = [
+        "layout = _params.layout or _params.get_layout()",
+        "return _iter_records(source, layout.length, cls.from_buffer, chunk_size=chunk_size, reuse=reuse)",
+    ]
+    return _create_method(
+        "iter_from",
+        ("cls", "source", "*", "chunk_size: int = DEFAULT_CHUNK_SIZE", "reuse: bool = True"),
+        body,
+        decorators=["classmethod"],
+        locals_=locals_,
+        globals_=globals_,
+    )
+
+
+def _build_rebase_method(
+    spec: _CollectionClassSpec,
+    globals_: dict[str, Any],
+) -> Callable:
+    """Generate a rebase method for the class.
+
+    Moves the instance and all of its members to a new position in a buffer using the
+    cached layout, without the validation and copying done by attach.
+    """
+    locals_: dict[str, Any] = {
+        "_params": getattr(spec.base_cls, _PARAMS),
+    }
+    self_name = spec.self_name
+    body = [
+        "layout = _params.layout or _params.get_layout()",
+        "mv = buffer if BUILTINS.type(buffer) is BUILTINS.memoryview else BUILTINS.memoryview(buffer)",
+        "if mv.format != 'B':",
+        "  mv = mv.cast('B')",
+        "data = mv[offset : offset + layout.length]",
+        "if BUILTINS.len(data) != layout.length or offset < 0:",
+        "  raise ValueError(f'Buffer too small to rebase at offset {offset}')",
+        _member_assign("_data", "data", self_name),
+    ]
+    if spec.lazy:
+        body.append(f"{self_name}._attach_members(False)")
+    else:
+        body.append("slices = layout.slices")
+        for idx, member_ in enumerate(spec.members):
+            member_type = cast(type, member_.type)
+            if issubclass(member_type, _Primitive):
+                body.append(f"{self_name}.{member_.name}._data = data[slices[{idx}]]")
+            elif issubclass(member_type, ByteEnum):
+                body.append(f"{self_name}.{member_.name}._var._data = data[slices[{idx}]]")
+            else:
+                body.append(f"{self_name}.{member_.name}.rebase(data, slices[{idx}].start)")
+    return _create_method(
+        "rebase",
+        (self_name, "buffer", "offset: int = 0"),
+        body,
+        locals_=locals_,
+        globals_=globals_,
+        return_type=None,
+    )
+
+
 def _build_data_property(
     spec: _CollectionClassSpec,
     globals_: dict[str, Any],
@@ -472,7 +765,7 @@ def _build_setattr_method(
     members_str = "(" + ",".join(repr(member_.name) for member_ in spec.members) + ",)"
     body = (
         f"if name in {members_str}:",
-        f"  item = {spec.self_name}.__getattribute__(name)",
+        f"  item = BUILTINS.getattr({spec.self_name}, name)",
         "  if getattr(item, '_COLLECTION_PARAMS', None) is not None:",
         "    item.data = value",
         "  else:",
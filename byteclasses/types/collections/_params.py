@@ -1,17 +1,41 @@
 """Collection Parameter class."""
 
+from struct import Struct
+
 from ._collection_class_spec import _CollectionClassSpec
+from ._layout import _compile_struct, _compute_layout, _Layout
 
 
 class _Params:
-    """Contains the collection parameters for a fixed size collection."""
+    """Contains the collection parameters for a fixed size collection.
+
+    The member layout and compiled struct are pure functions of the class. Member factories
+    may reference names defined after the class body, so both are computed on first use
+    and cached here for every later instance.
+    """
 
-    __slots__ = ("type",)
+    __slots__ = ("type", "byte_order", "layout", "struct", "_spec")
 
     def __init__(self, spec: _CollectionClassSpec) -> None:
         """Initialize the collection parameters."""
         self.type = spec.collection_type
+        self.byte_order = spec.byte_order
+        self.layout: _Layout | None = None
+        self.struct: Struct | None = None
+        self._spec = spec
 
     def __repr__(self) -> str:
         """Return a repr string for this collection parameters."""
-        return f"_Params(type={self.type=!r})"
+        return f"_Params(type={self.type!r})"
+
+    def get_layout(self) -> _Layout:
+        """Return the cached collection layout."""
+        if self.layout is None:
+            self.layout = _compute_layout(self._spec)
+        return self.layout
+
+    def get_struct(self) -> Struct:
+        """Return the cached compiled struct."""
+        if self.struct is None:
+            self.struct = _compile_struct(self._spec, self.get_layout())
+        return self.struct
@@ -38,3 +38,21 @@ def _set_new_attribute(cls, name: str, value: Any, force: bool = False) -> bool:
     _set_qualname(cls, value)
     setattr(cls, name, value)
     return False
+
+
+def _buffer_view(buffer: Any, offset: int, length: int, readonly_ok: bool = True) -> memoryview:
+    """Return a memoryview of length bytes of buffer starting at offset without copying.
+
+    Raises ValueError if the buffer is too small or is read-only and readonly_ok is not set.
+    """
+    view = memoryview(buffer)
+    if view.readonly and not readonly_ok:
+        raise ValueError("buffer is read-only")
+    if view.ndim != 1 or view.format != "B":
+        view = view.cast("B")
+    if offset < 0:
+        raise ValueError("offset cannot be negative")
+    end = offset + length
+    if end > view.nbytes:
+        raise ValueError(f"Buffer size too small ({view.nbytes} instead of at least {end} bytes)")
+    return view[offset:end]
@@ -0,0 +1,98 @@
+"""Member value views of lazy collections."""
+
+from struct import Struct
+from typing import Any, cast
+
+from ...constants import _PARAMS
+from ...util import is_byteclass_collection_instance
+from ..primitives._primitive_number import _PrimitiveNumber
+from ._collection_class_spec import _CollectionClassSpec
+from ._layout import _make_member, _member_code, _struct_prefix
+
+__all__: list[str] = []
+
+
+class _NumberValue:
+    """Decode a numeric member value straight from the collection data at its offset."""
+
+    __slots__ = ("name", "unpack_from", "offset")
+
+    def __init__(self, name: str, unpack_from: Any, offset: int) -> None:
+        self.name = name
+        self.unpack_from = unpack_from
+        self.offset = offset
+
+    def __get__(self, view: Any, owner: type | None = None) -> Any:
+        if view is None:
+            return self
+        return self.unpack_from(view._owner._data, self.offset)[0]  # pylint: disable=W0212
+
+    def __set__(self, view: Any, value: Any) -> None:
+        setattr(view._owner, self.name, value)  # pylint: disable=W0212
+
+
+class _MemberValue(_NumberValue):
+    """Return the value of a non-numeric member through its member instance.
+
+    Nested collections have no single value, the nested collection itself is returned.
+    """
+
+    def __get__(self, view: Any, owner: type | None = None) -> Any:
+        if view is None:
+            return self
+        member = getattr(view._owner, self.name)  # pylint: disable=W0212
+        return member if is_byteclass_collection_instance(member) else member.value
+
+
+class _MemberValues:
+    """A view of the member values of a collection instance."""
+
+    __slots__ = ("_owner",)
+    _names: tuple[str, ...] = ()
+
+    def __init__(self, owner: Any) -> None:
+        self._owner = owner
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._names)
+        return f"{self.__class__.__name__}({values})"
+
+
+class _ValuesAttribute:
+    """The values attribute of a lazy collection class.
+
+    The view class is built on first use, member factories may reference names defined
+    after the collection class body.
+    """
+
+    def __init__(self, spec: _CollectionClassSpec) -> None:
+        self._spec = spec
+        self._view_cls: type[_MemberValues] | None = None
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        if self._view_cls is None:
+            self._view_cls = _build_values_class(self._spec)
+        return self._view_cls(instance)
+
+
+def _build_values_class(spec: _CollectionClassSpec) -> type[_MemberValues]:
+    """Return the member values view class of a collection specification.
+
+    Numeric members are decoded with a precompiled struct at the cached member offset,
+    no member instance is created. Other members are read through their member instance.
+    Setting a value always goes through the member instance, keeping its value checks.
+    """
+    layout = getattr(spec.base_cls, _PARAMS).get_layout()
+    prefix = _struct_prefix(spec.byte_order)
+    namespace: dict[str, Any] = {"__slots__": (), "_names": tuple(member_.name for member_ in spec.members)}
+    for member_, offset in zip(spec.members, layout.offsets):
+        name = cast(str, member_.name)
+        instance = _make_member(member_, spec.byte_order)
+        if isinstance(instance, _PrimitiveNumber):
+            unpack_from = Struct(prefix + _member_code(instance)).unpack_from
+            namespace[name] = _NumberValue(name, unpack_from, offset)
+        else:
+            namespace[name] = _MemberValue(name, None, offset)
+    return type(f"{spec.base_cls.__name__}Values", (_MemberValues,), namespace)
@@ -2,7 +2,7 @@
 
 from collections.abc import ByteString, Iterator
 from numbers import Number
-from typing import overload
+from typing import Any, overload
 
 from ..._enums import ByteOrder
 from ...constants import _BYTECLASS, _MEMBERS
@@ -10,6 +10,7 @@ from ...types.primitives._primitive import _Primitive
 from ...types.primitives._primitive_number import _PrimitiveNumber
 from ...util import is_byteclass, is_byteclass_collection
 from ..primitives.integers import UInt8
+from ._util import _buffer_view
 
 
 class ByteArray:
@@ -29,6 +30,12 @@ class ByteArray:
             item_count: The number of items in array.
             item_type: The type of the items in the array. Default: UInt8
         """
+        self._init_items(item_count, item_type, byte_order)
+        self._data = memoryview(bytearray(self._length))
+        self._attach_members()
+
+    def _init_items(self, item_count: int, item_type: type[_Primitive], byte_order: bytes | ByteOrder) -> None:
+        """Create the array items and compute the array length."""
         self._byte_order: ByteOrder = ByteOrder(byte_order)
         if item_count < 2:
             raise ValueError(f"Invalid item_count: {item_count}; must be >= 2")
@@ -48,10 +55,7 @@ class ByteArray:
         for item in self._items:
             item.offset = offset
             offset += item_length
-        byte_length = item_length * item_count
-        self._length = byte_length
-        self._data = memoryview(bytearray(byte_length))
-        self._attach_members()
+        self._length = item_length * item_count
 
     def __repr__(self) -> str:
         """Return raw representation of fixed array."""
@@ -150,6 +154,28 @@ class ByteArray:
         """Return array item count."""
         return self._items
 
+    @classmethod
+    def from_buffer(
+        cls,
+        buffer: Any,
+        item_count: int,
+        item_type: type[_Primitive] = UInt8,
+        /,
+        *,
+        offset: int = 0,
+        readonly_ok: bool = True,
+        byte_order: bytes | ByteOrder = ByteOrder.NATIVE,
+    ) -> "ByteArray":
+        """Return an array attached directly to a slice of buffer without copying.
+
+        The array allocates no data of its own, e.g. `ByteArray.from_buffer(buf, 4, UInt32, offset=8)`.
+        """
+        array = cls.__new__(cls)
+        array._init_items(item_count, item_type, byte_order)  # pylint: disable=W0212
+        array._data = _buffer_view(buffer, offset, array._length, readonly_ok)  # pylint: disable=W0212
+        array._attach_members(False)  # pylint: disable=W0212
+        return array
+
     def attach(self, mv: memoryview, retain_value: bool = False) -> None:
         """Attach memoryview to underlying data attribute."""
         if not isinstance(mv, memoryview):
@@ -159,6 +185,17 @@ class ByteArray:
         self._data = mv
         self._attach_members(retain_value)
 
+    def rebase(self, buffer: ByteString, offset: int = 0) -> None:
+        """Move the array and its items to buffer at offset without validation or copying."""
+        mv = buffer if type(buffer) is memoryview else memoryview(buffer)  # pylint: disable=C0123
+        data = mv[offset : offset + self._length]
+        if len(data) != self._length or offset < 0:
+            raise ValueError(f"Buffer too small to rebase at offset {offset}")
+        self._data = data
+        item_length = len(self._items[0])
+        for idx, item in enumerate(self._items):
+            item.rebase(data, idx * item_length)
+
     def _attach_members(self, retain_value: bool = True) -> None:
         """Attach member items to internal data attribute."""
         item_length = len(self._items[0])
@@ -135,11 +135,15 @@ def _member_assign(name: str, value: Any, self_name: str) -> str:
     return f"BUILTINS.object.__setattr__({self_name},{name!r},{value})"
 
 
-def _init_members(spec: "_CollectionClassSpec", globals_: dict[str, Any]) -> list[str]:
-    """Initialize all class members."""
+def _init_members(spec: "_CollectionClassSpec", locals_: dict[str, Any]) -> list[str]:
+    """Initialize all class members.
+
+    Member factories are added to locals_, so classes sharing a module and member
+    names never see each others factories.
+    """
     body: list[str] = []
     for member_ in spec.members:
-        init_line = _init_member(spec, member_, globals_)
+        init_line = _init_member(spec, member_, locals_)
         body.extend(
             [
                 init_line,
@@ -155,17 +159,17 @@ def _init_members(spec: "_CollectionClassSpec", globals_: dict[str, Any]) -> lis
 def _init_member(
     spec: "_CollectionClassSpec",
     member_: Member,
-    globals_: dict[str, Any],
+    locals_: dict[str, Any],
 ) -> str:
     # Return the text of the line in the body of __init__ that will
     # initialize this field.
 
     init_name = f"_init_{member_.name}"
     if member_.factory is not MISSING:
-        globals_[init_name] = member_.factory
+        locals_[init_name] = member_.factory
     else:
         # No factory. Use member type as constructor.
-        globals_[init_name] = member_.type
+        locals_[init_name] = member_.type
     value = f"{init_name}(byte_order={spec.byte_order})"
     if member_.name is None:
         raise ValueError("Member name cannot be None.")
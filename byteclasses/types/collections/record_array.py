@@ -0,0 +1,119 @@
+"""Fixed length record array type for byteclass collections."""
+
+from collections.abc import ByteString, Iterator
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, cast, overload
+
+from ...constants import _PARAMS
+from ...util import is_byteclass_collection
+from ._util import _buffer_view
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+
+class RecordArray:
+    """A fixed length array of byteclass collection records backed by a single buffer.
+
+    Records are only created when an element is accessed, columns are available as
+    zero-copy NumPy views.
+    """
+
+    def __init__(
+        self,
+        record_type: type,
+        record_count: int,
+        /,
+        *,
+        data: ByteString | memoryview | None = None,
+    ) -> None:
+        """Initialize a record array.
+
+        Args:
+            record_type: The byteclass collection type of the records in the array.
+            record_count: The number of records in the array.
+            data: Optional buffer holding the records, used in place without copying.
+        """
+        if not isinstance(record_type, type) or not is_byteclass_collection(record_type):
+            raise TypeError(f"Invalid record_type {record_type!r}: Must be a byteclass collection type.")
+        if record_count < 0:
+            raise ValueError(f"Invalid record_count: {record_count}; must be >= 0")
+        self._record_type = record_type
+        self._record_count = record_count
+        self._record_length: int = getattr(record_type, _PARAMS).get_layout().length
+        self._length: int = self._record_length * record_count
+        if data is None:
+            self._data = memoryview(bytearray(self._length))
+        else:
+            self._data = _buffer_view(data, 0, self._length)
+
+    def __repr__(self) -> str:
+        """Return raw representation of record array."""
+        return f"{self.__class__.__name__}({self._record_type.__name__}, {self._record_count})"
+
+    def __len__(self) -> int:
+        """Return byte length of record array."""
+        return self._length
+
+    def __bytes__(self) -> bytes:
+        """Return record array bytes."""
+        return bytes(self._data)
+
+    def __iter__(self) -> Iterator:
+        """Return a record iterator."""
+        for idx in range(self._record_count):
+            yield self._record_type.from_buffer(self._data, idx * self._record_length)  # type: ignore
+
+    @overload
+    def __getitem__(self, key: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> tuple[Any, ...]: ...
+
+    @overload
+    def __getitem__(self, key: str) -> "np.ndarray": ...
+
+    def __getitem__(self, key: int | slice | str) -> Any:
+        """Return a record, a tuple of records or a member column."""
+        if isinstance(key, str):
+            return self.array[key]
+        if isinstance(key, slice):
+            return tuple(self[idx] for idx in range(*key.indices(self._record_count)))
+        if isinstance(key, int):
+            if key < 0:
+                key += self._record_count
+            if not 0 <= key < self._record_count:
+                raise IndexError(f"index {key} out of range")
+            return self._record_type.from_buffer(self._data, key * self._record_length)  # type: ignore
+        raise TypeError(f"Invalid key type ({type(key)})")
+
+    @property
+    def data(self) -> bytes:
+        """Return record array data."""
+        return bytes(self._data)
+
+    @property
+    def item_count(self) -> int:
+        """Return record array item count."""
+        return self._record_count
+
+    @property
+    def record_type(self) -> type:
+        """Return record array record type."""
+        return self._record_type
+
+    @cached_property
+    def dtype(self) -> "np.dtype":
+        """Return the NumPy structured dtype of the records."""
+        from ...numpy import to_dtype  # pylint: disable=C0415
+
+        return to_dtype(self._record_type)
+
+    @property
+    def array(self) -> "np.ndarray":
+        """Return a zero-copy NumPy structured array view of the records."""
+        from ...numpy import _import_numpy  # pylint: disable=C0415
+
+        np = _import_numpy()
+        return cast("NDArray[Any]", np.frombuffer(self._data, dtype=self.dtype, count=self._record_count))
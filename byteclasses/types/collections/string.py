@@ -1,6 +1,7 @@
 """Fixed Size String Byteclass."""
 
 from collections.abc import ByteString
+from typing import Any, cast
 
 from ..primitives.characters import UChar
 from .byte_array import ByteArray
@@ -25,6 +26,15 @@ class String(ByteArray):
         if value is not None:
             self.value = value
 
+    @classmethod
+    def from_buffer(  # type: ignore[override]
+        cls, buffer: Any, length: int, /, *, offset: int = 0, readonly_ok: bool = True, null_terminated: bool = True
+    ) -> "String":
+        """Return a string attached directly to a slice of buffer without copying."""
+        string = cast("String", super().from_buffer(buffer, length, UChar, offset=offset, readonly_ok=readonly_ok))
+        string._null_terminated = null_terminated  # pylint: disable=W0212
+        return string
+
     def __str__(self) -> str:
         """Return string representation."""
         return self.value
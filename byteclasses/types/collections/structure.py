@@ -1,27 +1,47 @@
 """Fixed length structure type."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import Any, overload
 
 from ..._enums import ByteOrder
 from ._collection import create_collection
 from ._collection_class_spec import _CollectionClassSpec
-from ._methods import _build_init_method
+from ._methods import (
+    _build_as_tuple_fast_method,
+    _build_init_method,
+    _build_pack_into_method,
+    _build_unpack_from_method,
+)
 from .byteclass_collection_protocol import ByteclassCollection
-from .member import _init_members, _member_assign
 
 __all__ = ["structure"]
 
 
 @overload
 def structure(
-    cls: None = None, /, *, byte_order: bytes | ByteOrder = ByteOrder.NATIVE, packed: bool = False
+    cls: None = None,
+    /,
+    *,
+    byte_order: bytes | ByteOrder = ByteOrder.NATIVE,
+    packed: bool = False,
+    lazy: bool = False,
+    eq: str = "members",
+    hash: str = "members",  # pylint: disable=W0622
+    order: Iterable[str] | None = None,
 ) -> Callable[[type], ByteclassCollection]: ...
 
 
 @overload
 def structure(
-    cls: type, /, *, byte_order: bytes | ByteOrder = ByteOrder.NATIVE, packed: bool = False
+    cls: type,
+    /,
+    *,
+    byte_order: bytes | ByteOrder = ByteOrder.NATIVE,
+    packed: bool = False,
+    lazy: bool = False,
+    eq: str = "members",
+    hash: str = "members",  # pylint: disable=W0622
+    order: Iterable[str] | None = None,
 ) -> ByteclassCollection: ...
 
 
@@ -31,17 +51,34 @@ def structure(  # type: ignore
     *,
     byte_order: bytes | ByteOrder = ByteOrder.NATIVE,
     packed: bool = False,
+    lazy: bool = False,
+    eq: str = "members",
+    hash: str = "members",  # pylint: disable=W0622
+    order: Iterable[str] | None = None,
 ) -> ByteclassCollection | Callable[[type], ByteclassCollection]:
     """Return the same class as was passed in.
 
     Fixed length structure methods are added to the class.
 
+    When lazy is set, members are only created and attached to the structure data
+    on first access. The values attribute of a lazy structure decodes member values
+    straight from the structure data without creating members.
+
+    Setting eq or hash to "bytes" compares or hashes the raw structure bytes, including
+    padding bytes, instead of the member values. Ordering compares all members unless
+    order selects the key members.
+
     Implemented similar to the dataclasses.dataclass decorator.
     """
     methods: dict[str, Callable] = {
         "__init__": _build_structure_init_method,
+        "unpack_from": _build_unpack_from_method,
+        "pack_into": _build_pack_into_method,
+        "as_tuple_fast": _build_as_tuple_fast_method,
     }
-    structure_cls = create_collection(cls, "structure", byte_order, packed, methods)
+    structure_cls = create_collection(
+        cls, "structure", byte_order, packed, methods, lazy=lazy, eq=eq, hash=hash, order=order
+    )
     return structure_cls
 
 
@@ -49,28 +86,9 @@ def _build_structure_init_method(
     spec: _CollectionClassSpec,
     globals_: dict[str, Any],
 ) -> Callable:
-    """Create structure init function."""
-    body: list[str] = []
-    body.extend(_init_members(spec, globals_))
-
-    # Calculate structure member offsets
-    body.append("collection_length = 0")
-    for member_ in spec.members:
-        body.append(f"mbr_len = len({spec.self_name}.{member_.name})")
-        if not spec.packed:  # Insert padding to keep members aligned if not packed
-            body.extend(
-                [
-                    "if collection_length % mbr_len != 0:",
-                    "  padding = mbr_len - (collection_length % mbr_len)",
-                    "  collection_length += padding",
-                ]
-            )
-        body.extend(
-            [
-                f"{spec.self_name}.{member_.name}.offset = collection_length",
-                "collection_length += mbr_len",
-                _member_assign("_length", "collection_length", spec.self_name),
-            ]
-        )
+    """Create structure init function.
 
+    Member offsets, including alignment padding, are read from the class layout.
+    """
+    body: list[str] = []
     return _build_init_method(spec, body, globals_)
@@ -8,7 +8,6 @@ from ._collection import create_collection
 from ._collection_class_spec import _CollectionClassSpec
 from ._methods import _build_init_method
 from .byteclass_collection_protocol import ByteclassCollection
-from .member import _init_members, _member_assign
 
 __all__ = ["union"]
 
@@ -46,23 +45,9 @@ def _build_union_init_method(
     spec: _CollectionClassSpec,
     globals_: dict[str, Any],
 ) -> Callable:
-    """Create union init function."""
-
-    body = []
-    body.extend(_init_members(spec, globals_))
-
-    # Initialize union member offsets to 0
-    for member_ in spec.members:
-        body.append(f"{spec.self_name}.{member_.name}.offset = 0")
-
-    # Collect union member lengths
-    lengths_str = "[" + ",".join(f"len(self.{member_.name})" for member_ in spec.members) + "]"
-    body.extend(
-        [
-            f"member_lengths = {lengths_str}",
-            "collection_length = max(member_lengths)",
-            _member_assign("_length", "collection_length", spec.self_name),
-        ]
-    )
+    """Create union init function.
 
+    Union members all start at offset 0, as recorded in the class layout.
+    """
+    body: list[str] = []
     return _build_init_method(spec, body, globals_)
@@ -1,11 +1,13 @@
 """Abstract fixed size type."""
 
-from collections.abc import ByteString
+from collections.abc import ByteString, Iterator
 from functools import cached_property
+from struct import Struct
 from typing import Any
 
 from ..._enums import ByteOrder
 from ...constants import _BYTECLASS
+from .._stream import DEFAULT_CHUNK_SIZE, _iter_records
 
 __all__: list[str] = []
 
@@ -17,6 +19,15 @@ class _Primitive:
 
     _length: int = NotImplemented
 
+    # Precompiled struct per byte order, built once for every class defining _type_char
+    _structs: dict[ByteOrder, Struct] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Precompile the class structs."""
+        super().__init_subclass__(**kwargs)
+        if "_type_char" in cls.__dict__ and cls._type_char is not NotImplemented:
+            cls._structs = {byte_order: Struct(byte_order.value + cls._type_char) for byte_order in ByteOrder}
+
     def __init__(
         self,
         value: ByteString | None = None,
@@ -64,6 +75,28 @@ class _Primitive:
         """Return the raw representation of the instance."""
         return f"{self.__class__.__name__}(data={bytes(self)!r}, byte_order={self.byte_order.value!r})"
 
+    @classmethod
+    def iter_from(
+        cls,
+        source: Any,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        reuse: bool = True,
+        byte_order: bytes | ByteOrder = ByteOrder.NATIVE,
+    ) -> Iterator[Any]:
+        """Yield consecutive instances from a buffer or a binary stream.
+
+        With reuse set, a single instance is re-attached to every value and is only valid
+        until the next value is requested.
+        """
+
+        def new_record(data: memoryview) -> Any:
+            record = cls(byte_order=byte_order)
+            record.attach(data, False)
+            return record
+
+        return _iter_records(source, len(cls(byte_order=byte_order)), new_record, chunk_size=chunk_size, reuse=reuse)
+
     @cached_property
     def bit_length(self) -> int:
         """Return bit length."""
@@ -78,6 +111,7 @@ class _Primitive:
     def byte_order(self, value: bytes | ByteOrder) -> None:
         """Set new byte order."""
         self._byte_order = ByteOrder(value)
+        self._struct: Struct | None = self._structs.get(self._byte_order)
 
     @property
     def endianness(self) -> str:
@@ -87,6 +121,8 @@ class _Primitive:
     @property
     def fmt(self) -> bytes:
         """Return the format string for the instance."""
+        if self._struct is not None:
+            return self._struct.format.encode()
         return self.byte_order.value + self.type_char
 
     @property
@@ -136,6 +172,14 @@ class _Primitive:
         if retain_value:
             self._data[:] = temp
 
+    def rebase(self, buffer: ByteString, offset: int = 0) -> None:
+        """Attach the instance to buffer at offset without validation or copying."""
+        mv = buffer if type(buffer) is memoryview else memoryview(buffer)  # pylint: disable=C0123
+        data = mv[offset : offset + self._length]
+        if len(data) != self._length or offset < 0:
+            raise ValueError(f"Buffer too small to rebase at offset {offset}")
+        self._data = data
+
     @property
     def value(self) -> Any:
         """Return the value of the instance.
@@ -11,7 +11,6 @@ import math
 from abc import ABC, abstractmethod
 from collections.abc import ByteString
 from numbers import Integral, Number, Real
-from struct import pack, unpack
 from typing import Any, TypeVar
 
 from ..._enums import ByteOrder
@@ -337,7 +336,7 @@ class _PrimitiveNumber(_Primitive, ABC):
 
     def _get_value(self) -> Any:
         """Return the value of the instance."""
-        return unpack(self.fmt, self._data[: len(self)])[0]
+        return self._struct.unpack_from(self._data)[0]  # type: ignore[union-attr]
 
     def _set_value(self, new_value: Any, val_cls: type) -> None:
         """Set the value of the instance."""
@@ -348,7 +347,7 @@ class _PrimitiveNumber(_Primitive, ABC):
         else:
             raise TypeError(f"Value cannot be {type(new_value)}, must be number or FixedNumericType")
         value_ = self._bound_value(value_)
-        self.data = pack(self.fmt, value_)
+        self._struct.pack_into(self._data, 0, value_)  # type: ignore[union-attr]
 
     @property
     @abstractmethod
@@ -1,14 +1,28 @@
 """BitField Fixed Length Class."""
 
+import sys
 from collections.abc import ByteString, Iterable, Sequence
-from struct import calcsize
-from typing import overload
+from struct import calcsize, iter_unpack
+from typing import TYPE_CHECKING, Any, overload
 
 from ..._enums import ByteOrder, TypeChar
 from ._primitive import _Primitive
 
+if TYPE_CHECKING:
+    import numpy as np
+
 MIN_WIDTH = 1
 
+_INT_BYTE_ORDER = {
+    ByteOrder.NATIVE: sys.byteorder,
+    ByteOrder.NATIVE_STD: sys.byteorder,
+    ByteOrder.LE: "little",
+    ByteOrder.BE: "big",
+    ByteOrder.NET: "big",
+}
+
+_WORD_TYPE_CHAR = {1: "B", 2: "H", 4: "I", 8: "Q"}
+
 
 class BitPos:
     """A member class representing a pit position for use in a BitField class."""
@@ -20,6 +34,10 @@ class BitPos:
         if bit_width < MIN_WIDTH:
             raise ValueError(f"Bit position must have a bit_width greater than one ({MIN_WIDTH}).")
         self._bit_width = bit_width
+        # Precomputed shift and masks used for constant time field access
+        self._end = idx + bit_width
+        self._width_mask = (1 << bit_width) - 1
+        self._mask = self._width_mask << idx
 
     def __get__(self, instance, owner=None):
         """Implement get descriptor."""
@@ -27,25 +45,22 @@ class BitPos:
             return self
         if not isinstance(instance, BitField):
             raise TypeError(f"BitPos only intended for use on BitField classes ({instance=})({owner=}).")
+        if self._end > instance.bit_length:
+            raise IndexError(f"BitPos ({self._idx}, bit_width={self._bit_width}) out of range")
+        value = instance._get_int() >> self._idx & self._width_mask  # pylint: disable=W0212
         if self._bit_width == 1:
-            return instance[self.idx]
-        val = 0
-        for i in instance[self.idx : self.idx + self.bit_width][::-1]:
-            val = val << 1 | int(i)
-        return val
+            return bool(value)
+        return value
 
     def __set__(self, instance, value) -> None:
         """Implement set descriptor."""
         if not isinstance(instance, BitField):
             raise TypeError("BitPos only intended for use on BitField classes.")
-        if self._bit_width == 1:
-            instance[self.idx] = value
-        else:
-            remaining_bits = value
-            for i in range(self.idx, self.idx + self.bit_width):
-                bit = remaining_bits & 1
-                instance[i] = bit
-                remaining_bits = remaining_bits >> 1
+        if self._end > instance.bit_length:
+            raise IndexError(f"BitPos ({self._idx}, bit_width={self._bit_width}) out of range")
+        value = int(bool(value)) if self._bit_width == 1 else int(value) & self._width_mask
+        current = instance._get_int() & ~self._mask  # pylint: disable=W0212
+        instance._set_int(current | value << self._idx)  # pylint: disable=W0212
 
     @property
     def bit_width(self) -> int:
@@ -57,12 +72,39 @@ class BitPos:
         """Return read-only index value."""
         return self._idx
 
+    @property
+    def mask(self) -> int:
+        """Return BitPos integer mask."""
+        return self._mask
+
 
 class BitField(_Primitive):
-    """BitField Fixed Size Class."""
+    """BitField Fixed Size Class.
+
+    The backing bytes are decoded as an unsigned integer in the instance byte order, bit
+    positions count from the least significant bit of that integer. Subclasses setting
+    legacy_bit_numbering count positions from the least significant bit of the first
+    byte instead, as in previous releases, irrespective of the byte order.
+    """
 
     byte_length: int = 1
+    legacy_bit_numbering: bool = False
     _signed: bool = False
+    # Named fields of the class as (name, shift, width mask, single bit) tuples
+    _flag_fields: tuple[tuple[str, int, int, bool], ...] = ()
+    _flag_end: int = 0
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Collect the named bit positions of the class, including inherited ones."""
+        super().__init_subclass__(**kwargs)
+        names: dict[str, None] = {}
+        for klass in reversed(cls.__mro__):
+            names.update(dict.fromkeys(klass.__dict__))
+        bit_positions = [(name, pos) for name in names if isinstance(pos := getattr(cls, name, None), BitPos)]
+        cls._flag_fields = tuple(
+            (name, pos.idx, (1 << pos.bit_width) - 1, pos.bit_width == 1) for name, pos in bit_positions
+        )
+        cls._flag_end = max((pos.idx + pos.bit_width for _, pos in bit_positions), default=0)
 
     def __init__(
         self,
@@ -83,7 +125,7 @@ class BitField(_Primitive):
         """Return bitfield string representation."""
         return (
             f"{self.__class__.__name__}("
-            f"{''.join(bin(i)[2:].rjust(8, '0')[::-1] for i in self._data)}, flags={self.flags})"
+            f"{''.join(bin(i)[2:].rjust(8, '0')[::-1] for i in self._data)}, flags={self._flags_dict()})"
         )
 
     def __repr__(self) -> str:
@@ -108,7 +150,11 @@ class BitField(_Primitive):
                 stop = self.bit_length if step > 0 else -1
             else:
                 stop = key.stop
-            return [self.get_bit(idx) for idx in range(start, stop, step)]
+            indices = range(start, stop, step)
+            if indices and (min(indices) < 0 or max(indices) >= self.bit_length):
+                raise IndexError("Invalid bit index")
+            value = self._get_int()
+            return [bool(value >> idx & 1) for idx in indices]
         raise NotImplementedError
 
     @overload
@@ -128,24 +174,95 @@ class BitField(_Primitive):
         else:
             raise NotImplementedError
 
+    @_Primitive.byte_order.setter  # type: ignore[attr-defined]
+    def byte_order(self, value: bytes | ByteOrder) -> None:
+        """Set new byte order."""
+        _Primitive.byte_order.fset(self, value)  # type: ignore[attr-defined]
+        self._int_byte_order = "little" if self.legacy_bit_numbering else _INT_BYTE_ORDER[self._byte_order]
+
+    def _get_int(self) -> int:
+        """Return the backing bytes as an unsigned integer."""
+        return int.from_bytes(self._data, self._int_byte_order)  # type: ignore[arg-type]
+
+    def _set_int(self, value: int) -> None:
+        """Store an unsigned integer in the backing bytes."""
+        self._data[:] = value.to_bytes(self._length, self._int_byte_order)  # type: ignore[arg-type]
+
     @property
     def flags(self) -> dict[str, bool | int]:
         """Return a dictionary of all named bit positions."""
+        return self._flags_dict()
+
+    def _flags_dict(self) -> dict[str, bool | int]:
+        """Return a dictionary of all named bit positions."""
+        return dict(zip((field[0] for field in self._flag_fields), self.flags_tuple()))
+
+    def flags_int(self) -> int:
+        """Return the bitfield as an unsigned integer in the instance byte order."""
+        return self._get_int()
+
+    def flags_tuple(self) -> tuple[bool | int, ...]:
+        """Return the values of all named bit positions, decoded at once."""
+        if self._flag_end > self.bit_length:
+            raise IndexError(f"{self.__class__.__name__} has bit positions beyond {self.bit_length} bits")
+        value = self._get_int()
+        return tuple(
+            bool(value >> shift & 1) if single else value >> shift & mask
+            for _, shift, mask, single in self._flag_fields
+        )
+
+    @classmethod
+    def decode_flags(
+        cls, buffer: ByteString | memoryview, *, byte_order: bytes | ByteOrder = ByteOrder.NATIVE
+    ) -> dict[str, list[bool | int]]:
+        """Return the named bit positions of consecutive bitfields in buffer.
+
+        Values are returned column wise, one list per named bit position.
+        """
+        length = cls.byte_length
+        view = memoryview(buffer).cast("B")
+        if len(view) % length:
+            raise ValueError(f"Buffer length ({len(view)}) is not a multiple of {length} bytes")
+        int_byte_order = "little" if cls.legacy_bit_numbering else _INT_BYTE_ORDER[ByteOrder(byte_order)]
+        if length in _WORD_TYPE_CHAR:
+            prefix = "<" if int_byte_order == "little" else ">"
+            words = [word for (word,) in iter_unpack(prefix + _WORD_TYPE_CHAR[length], view)]
+        else:
+            words = [int.from_bytes(view[i : i + length], int_byte_order) for i in range(0, len(view), length)]
+        return {
+            name: [bool(word >> shift & 1) for word in words] if single else [word >> shift & mask for word in words]
+            for name, shift, mask, single in cls._flag_fields
+        }
+
+    @classmethod
+    def decode_flags_array(cls, words: "np.ndarray") -> dict[str, "np.ndarray"]:
+        """Return the named bit positions of an array of raw integer words.
+
+        Words must already be decoded to integers, e.g. a RecordArray column. Values are
+        returned column wise, single bit positions as boolean arrays.
+        """
+        from ...numpy import _import_numpy  # pylint: disable=C0415
+
+        np = _import_numpy()
+        words = np.asarray(words)
+        if words.dtype.kind not in "ui":
+            raise TypeError(f"Unsupported word dtype ({words.dtype})")
         return {
-            name: getattr(self, name) for name in type(self).__dict__ if isinstance(getattr(type(self), name), BitPos)
+            name: (words >> shift & 1).astype(bool) if single else words >> shift & mask
+            for name, shift, mask, single in cls._flag_fields
         }
 
     @property
     def value(self) -> tuple[bool | list[bool], ...]:
         """Return a boolean value list for all bits within BitField."""
-        return tuple(self[idx] for idx in range(self.bit_length))
+        value = self._get_int()
+        return tuple(bool(value >> idx & 1) for idx in range(self.bit_length))
 
     @value.setter
     def value(self, new_values: bool | Iterable[bool] | dict[int, bool]):
         """Set BitField values."""
         if isinstance(new_values, bool):
-            for idx in range(self.bit_length):
-                self[idx] = new_values
+            self._set_int((1 << self.bit_length) - 1 if new_values else 0)
         elif isinstance(new_values, dict):
             for idx, val in new_values.items():
                 self[int(idx)] = val
@@ -194,32 +311,23 @@ class BitField(_Primitive):
         """Clear bit in bitfield instance."""
         self.set_bit(idx, 0)
 
-    def get_bit(self, idx: int) -> bool:
-        """Get bit in bitfield instance."""
+    def _check_idx(self, idx: int) -> None:
+        """Raise IndexError for a bit index outside the bitfield."""
         if idx >= self.bit_length or idx < 0:
             raise IndexError("Invalid bit index")
-        byte_idx = idx // 8
-        offset = idx % 8
-        byte_value = self._data[byte_idx]
-        mask = 1 << offset
-        bit_value = byte_value & mask
-        return bool(bit_value)
+
+    def get_bit(self, idx: int) -> bool:
+        """Get bit in bitfield instance."""
+        self._check_idx(idx)
+        return bool(self._get_int() >> idx & 1)
 
     def set_bit(self, idx: int, value: int | bool = 1):
         """Set bit in bitfield instance."""
-        if idx >= self.bit_length or idx < 0:
-            raise IndexError("Invalid bit index")
-        value = int(bool(value))
-        byte_idx = idx // 8
-        offset = idx % 8
-        byte_value = self._data[byte_idx]
+        self._check_idx(idx)
         if value:
-            mask = 1 << offset
-            byte_value |= mask
+            self._set_int(self._get_int() | 1 << idx)
         else:
-            mask = ~(1 << offset)
-            byte_value &= mask
-        self._data[byte_idx] = byte_value
+            self._set_int(self._get_int() & ~(1 << idx))
 
 
 class BitField16(BitField):
@@ -242,10 +350,7 @@ class BitField64(BitField):
 
 def bitpos2mask(bit_pos: BitPos) -> int:
     """Return an integer mask from a BitPos instance."""
-    val = 0
-    for _ in range(bit_pos.bit_width):
-        val = (val << 1) | 1
-    return val << bit_pos.idx
+    return bit_pos.mask
 
 
 def mask2bitpos(mask: int) -> BitPos:
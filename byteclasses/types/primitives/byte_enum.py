@@ -105,5 +105,9 @@ class ByteEnum:
         """
         self._var.attach(new_data, retain_value)
 
+    def rebase(self, buffer: ByteString, offset: int = 0) -> None:
+        """Attach _var to buffer at offset without validation or copying."""
+        self._var.rebase(buffer, offset)
+
 
 setattr(ByteEnum, _BYTECLASS, True)
@@ -253,3 +253,16 @@ def test_byte_array_attach_with_memoryview():
     var.attach(mv[:3])
     var[:] = 5
     assert data == b"\x05\x05\x05\x04"
+
+
+def test_byte_array_from_buffer():
+    """Test ByteArray creation over an external buffer."""
+    buffer = bytearray(range(10))
+    array = ByteArray.from_buffer(buffer, 4, UInt16, offset=2, byte_order=b"<")
+    assert array.item_count == 4
+    assert array[0] == 0x0302
+    array[0] = 0
+    assert buffer[2:4] == b"\x00\x00"
+    assert array._data.obj is buffer  # pylint: disable=W0212
+    with pytest.raises(ValueError):
+        ByteArray.from_buffer(buffer, 6, UInt16)
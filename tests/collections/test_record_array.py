@@ -0,0 +1,55 @@
+"""Test suite for RecordArray."""
+
+import pytest
+
+from byteclasses._enums import ByteOrder
+from byteclasses.types.collections import RecordArray, structure
+from byteclasses.types.primitives.integers import Int16, UInt8, UInt32
+
+
+@structure(byte_order=ByteOrder.LE)
+class Record:  # pylint: disable=R0903
+    """Test record structure."""
+
+    a: UInt8
+    b: Int16
+    c: UInt32
+
+
+def test_record_array_creation():
+    """Test record array creation."""
+    ra = RecordArray(Record, 3)
+    assert len(ra) == 24
+    assert ra.item_count == 3
+    assert ra.data == b"\x00" * 24
+    with pytest.raises(TypeError):
+        RecordArray(UInt8, 3)
+    with pytest.raises(ValueError):
+        RecordArray(Record, 3, data=bytes(23))
+
+
+def test_record_array_records():
+    """Test record array record access."""
+    data = bytearray(b"\x01\x00\xfe\xff\x02\x00\x00\x00" * 2)
+    ra = RecordArray(Record, 2, data=data)
+    assert ra[1].b == -2
+    assert ra[-1].c == 2
+    ra[0].c = 3
+    assert data[4] == 3
+    assert [record.a.value for record in ra] == [1, 1]
+    assert len(ra[0:2]) == 2
+    with pytest.raises(IndexError):
+        _ = ra[2]
+
+
+def test_record_array_columns():
+    """Test record array NumPy columns."""
+    np = pytest.importorskip("numpy")
+    data = bytearray(b"\x01\x00\xfe\xff\x02\x00\x00\x00\x03\x00\x05\x00\x04\x00\x00\x00")
+    ra = RecordArray(Record, 2, data=data)
+    assert ra.dtype.itemsize == 8
+    assert ra.dtype.fields["c"][1] == 4
+    assert ra["b"].tolist() == [-2, 5]
+    ra["c"][:] = np.array([7, 8])
+    assert ra[0].c == 7
+    assert data[12] == 8
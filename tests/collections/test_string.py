@@ -77,3 +77,12 @@ def test_string_repr_method():
     expected_length = 8
     string = String(expected_length, value="test")
     assert repr(string) == "String(8, value='test')"
+
+
+def test_string_from_buffer():
+    """Test String creation over an external buffer."""
+    buffer = bytearray(b"xxtest\x00\x00")
+    string = String.from_buffer(buffer, 6, offset=2)
+    assert string.value == "test"
+    string.value = "ab"
+    assert buffer == b"xxab\x00\x00\x00\x00"
@@ -1,5 +1,7 @@
 """Test suite for Structure Byteclass."""
 
+import io
+
 import pytest
 
 from byteclasses._enums import ByteOrder
@@ -102,3 +104,245 @@ def test_structure_creation_packed():
     assert ps.c.endianness == ByteOrder.NATIVE.name
     assert ps.c.data == b"\x00\x00\x00\x00\x00\x00\x00\x00"
     assert ps.c.value == 0
+
+
+def test_structure_unpack_from():
+    """Test compiled structure unpacking."""
+
+    @structure(byte_order=ByteOrder.LE)
+    class CompiledStruct:  # pylint: disable=R0903
+        """Test structure class."""
+
+        a: UInt8
+        b: Int16
+        c: UInt64
+
+    buffer = b"\xff" + bytes(CompiledStruct(b"\x01\x00\xfe\xff\x00\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00"))
+    assert CompiledStruct.unpack_from(buffer, 1) == (1, -2, 2)
+    assert CompiledStruct(buffer[1:]).as_tuple_fast() == (1, -2, 2)
+
+
+def test_structure_pack_into():
+    """Test compiled structure packing."""
+
+    @structure(byte_order=ByteOrder.BE, packed=True)
+    class CompiledStruct:  # pylint: disable=R0903
+        """Test structure class."""
+
+        a: UInt8
+        b: Int16
+
+    cs = CompiledStruct()
+    cs.a = 1
+    cs.b = -2
+    buffer = bytearray(5)
+    cs.pack_into(buffer, 2)
+    assert buffer == b"\x00\x00\x01\xff\xfe"
+    assert CompiledStruct.unpack_from(buffer, 2) == (1, -2)
+
+
+def test_structure_layout_cache():
+    """Test structure layout is computed once per class."""
+
+    @structure
+    class LayoutStruct:  # pylint: disable=R0903
+        """Test structure class."""
+
+        a: UInt8
+        b: Int16
+        c: UInt64
+
+    params = getattr(LayoutStruct, "__collection_params__")
+    assert params.layout is None
+    ls1 = LayoutStruct()
+    layout = params.layout
+    assert layout.offsets == (0, 2, 8)
+    assert layout.lengths == (1, 2, 8)
+    assert layout.length == len(ls1) == 16
+    ls2 = LayoutStruct()
+    assert params.layout is layout
+    assert (ls2.a.offset, ls2.b.offset, ls2.c.offset) == layout.offsets
+
+
+def test_structure_lazy_members():
+    """Test lazy structure member materialization."""
+
+    @structure(lazy=True)
+    class LazyStruct:  # pylint: disable=R0903
+        """Test structure class."""
+
+        a: UInt8 = member(factory=lambda byte_order: UInt8(8, byte_order=byte_order))
+        b: Int16
+        c: UInt64
+
+    ls = LazyStruct()
+    assert len(ls) == 16
+    assert ls.data == b"\x08" + b"\x00" * 15
+    ls.b = -1
+    assert ls.data[2:4] == b"\xff\xff"
+    assert ls.b.offset == 2
+    ls.data = b"\x01" * 16
+    assert ls.a == 1
+    assert ls.c == 0x0101010101010101
+    with pytest.raises(AttributeError):
+        _ = ls.d
+
+
+def test_structure_lazy_values():
+    """Test lazy structure member values decoding."""
+
+    @structure(lazy=True)
+    class LazyStruct:  # pylint: disable=R0903
+        """Test structure class."""
+
+        a: UInt8 = member(factory=lambda byte_order: UInt8(8, byte_order=byte_order))
+        b: Int16
+        c: UInt64
+
+    ls = LazyStruct.from_buffer(bytearray(b"\x01\x00\xfe\xff" + b"\x00" * 4 + b"\x02" * 8))
+    values = ls.values
+    assert values.a == 1
+    assert values.b == -2
+    assert values.c == 0x0202020202020202
+    with pytest.raises(AttributeError):
+        object.__getattribute__(ls, "b")
+    assert repr(values) == "LazyStructValues(a=1, b=-2, c=144680345676153346)"
+    values.b = 300
+    assert ls.data[2:4] == b"\x2c\x01"
+    assert values.b == ls.b == 300
+    assert LazyStruct().values.a == 8
+
+
+def test_structure_from_buffer():
+    """Test structure creation over an external buffer."""
+
+    @structure(byte_order=ByteOrder.LE, packed=True)
+    class OverlayStruct:  # pylint: disable=R0903
+        """Test structure class."""
+
+        a: UInt8
+        b: Int16
+
+    buffer = bytearray(b"\xff\x01\xfe\xff\xff")
+    os_ = OverlayStruct.from_buffer(buffer, 1)
+    assert os_.a == 1
+    assert os_.b == -2
+    os_.a = 2
+    assert buffer == b"\xff\x02\xfe\xff\xff"
+
+    ro = OverlayStruct.from_buffer(bytes(buffer), 1)
+    assert ro.b == -2
+    with pytest.raises(TypeError):
+        ro.a = 3
+    with pytest.raises(ValueError):
+        OverlayStruct.from_buffer(bytes(buffer), readonly_ok=False)
+    with pytest.raises(ValueError):
+        OverlayStruct.from_buffer(buffer, 3)
+
+
+def test_structure_member_factories_per_class():
+    """Test structures sharing member names use their own member types."""
+
+    @structure
+    class SmallStruct:  # pylint: disable=R0903
+        """Test structure class."""
+
+        a: UInt8
+
+    @structure
+    class LargeStruct:  # pylint: disable=R0903
+        """Test structure class."""
+
+        a: UInt64
+
+    assert len(SmallStruct()) == 1
+    assert len(LargeStruct()) == 8
+    assert isinstance(SmallStruct().a, UInt8)
+
+
+def test_structure_iter_from():
+    """Test iterating structures from a stream."""
+
+    @structure(byte_order=ByteOrder.LE, packed=True)
+    class RecordStruct:  # pylint: disable=R0903
+        """Test structure class."""
+
+        a: UInt8
+        b: Int16
+
+    data = b"".join(bytes([i]) + (-i).to_bytes(2, "little", signed=True) for i in range(50))
+    records = [(int(rs.a), int(rs.b)) for rs in RecordStruct.iter_from(io.BytesIO(data), chunk_size=8)]
+    assert records == [(i, -i) for i in range(50)]
+    records = list(RecordStruct.iter_from(data, reuse=False))
+    assert records[10].b == -10
+
+
+def test_structure_rebase():
+    """Test moving a structure to a new buffer position."""
+
+    @structure(byte_order=ByteOrder.LE, packed=True)
+    class InnerStruct:  # pylint: disable=R0903
+        """Test structure class."""
+
+        a: UInt8
+
+    @structure(byte_order=ByteOrder.LE, packed=True)
+    class OuterStruct:  # pylint: disable=R0903
+        """Test structure class."""
+
+        b: Int16
+        c: InnerStruct
+
+    buffer = bytearray(b"\x01\x00\x02\x03\x00\x04")
+    os_ = OuterStruct()
+    os_.rebase(buffer, 3)
+    assert os_.b == 3
+    assert os_.c.a == 4
+    os_.c.a = 5
+    assert buffer[5] == 5
+    os_.rebase(buffer)
+    assert (os_.b, os_.c.a) == (1, 2)
+    with pytest.raises(ValueError):
+        os_.rebase(buffer, 4)
+
+
+def test_structure_bytes_eq_hash_and_order():
+    """Test raw bytes equality and hashing and key member ordering."""
+
+    @structure(byte_order=b"<", eq="bytes", hash="bytes", order=["b"])
+    class KeyStruct:  # pylint: disable=R0903
+        """Key structure class."""
+
+        a: UInt8
+        b: Int16
+
+    first = KeyStruct.from_buffer(bytearray(b"\x02\x00\x01\x00"))
+    second = KeyStruct.from_buffer(bytearray(b"\x01\x00\x02\x00"))
+    assert first != second
+    assert first < second
+    second.a = 2
+    second.b = 1
+    assert first == second
+    assert hash(first) == hash(second) == hash(bytes(first))
+    assert len({first, second}) == 1
+    assert not first < second
+    first.a = 1
+    assert first <= second and first != second
+    padded = KeyStruct.from_buffer(bytearray(b"\x02\xff\x01\x00"))
+    assert padded.a == second.a and padded.b == second.b
+    assert padded != second
+
+
+def test_structure_invalid_cmp_modes():
+    """Test invalid equality, hash and ordering modes."""
+    with pytest.raises(ValueError):
+        structure(eq="values")
+    with pytest.raises(ValueError):
+        structure(hash="values")
+    with pytest.raises(ValueError):
+
+        @structure(order=["c"])
+        class BadOrderStruct:  # pylint: disable=R0903
+            """Bad order structure class."""
+
+            a: UInt8
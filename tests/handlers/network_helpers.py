@@ -0,0 +1,29 @@
+"""Packet and capture builders shared by the network handler test suites."""
+
+import io
+import struct
+
+ETH = b"\x00\x11\x22\x33\x44\x55\x66\x77\x88\x99\xaa\xbb"
+
+
+def ipv4(protocol, payload, frag=0x4000):
+    """Return an IPv4 packet."""
+    hdr = struct.pack("!BBHHHBBH4s4s", 0x45, 0, 20 + len(payload), 1, frag, 64, protocol, 0, bytes(4), bytes(4))
+    return hdr + payload
+
+
+def ipv6(next_hdr, payload):
+    """Return an IPv6 packet."""
+    return struct.pack("!IHBB16s16s", 0x60000000, len(payload), next_hdr, 64, bytes(16), bytes(16)) + payload
+
+
+def write_capture(writer_cls, packets=(), timestamps=None, **kwargs):
+    """Return the bytes of a capture of packets written with writer_cls.
+
+    Packets are written with a timestamp of 0.0 unless timestamps are given.
+    """
+    file = io.BytesIO()
+    with writer_cls(file, **kwargs) as writer:
+        for idx, data in enumerate(packets):
+            writer.write(data, 0.0 if timestamps is None else timestamps[idx])
+    return file.getvalue()
@@ -0,0 +1,95 @@
+"""Test suite for parallel batch parsing."""
+
+import pytest
+
+from byteclasses.handlers.batch import parse_many, parse_many_records
+from byteclasses.handlers.executables.elf import Elf64
+from byteclasses.types.collections import structure
+from byteclasses.types.primitives.integers import UInt32, UInt64
+
+ELF_PATH = "tests/data/hello_world.elf"
+
+
+@structure
+class EntryRecord:  # pylint: disable=R0903
+    """Extracted entry point record."""
+
+    entry: UInt64
+    sections: UInt32
+
+
+def _entry(handler):
+    """Return the entry point of an ELF handler."""
+    return handler.entry.value
+
+
+def _entry_record(handler):
+    """Return the entry point record values of an ELF handler."""
+    return handler.entry.value, len(handler.section_table)
+
+
+def _missing_section(handler):
+    """Look up a section that does not exist."""
+    return handler.section_by_name(".missing")
+
+
+@pytest.fixture(name="paths")
+def fixture_paths(tmp_path):
+    """Return the paths of an ELF file, a truncated ELF file and a missing file."""
+    truncated = tmp_path / "truncated.elf"
+    with open(ELF_PATH, "rb") as file:
+        truncated.write_bytes(file.read(16))
+    return [ELF_PATH, str(truncated), str(tmp_path / "missing.elf")]
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_parse_many(paths, workers):
+    """Test batch parsing keeps the path order and captures errors."""
+    results = list(parse_many(paths, Elf64, extract=_entry, workers=workers, chunk_size=1))
+    assert [result.path for result in results] == paths
+    assert results[0].value == 0x640
+    assert results[0].error is None
+    assert results[1].value is None
+    assert results[1].error.startswith("ValueError")
+    assert results[2].error.startswith("FileNotFoundError")
+
+
+def test_parse_many_detect(paths, tmp_path):
+    """Test batch parsing with detected handlers."""
+    unknown = tmp_path / "unknown.bin"
+    unknown.write_bytes(bytes(64))
+    paths[1:] = ["tests/data/hello_world.pe", paths[2], str(unknown)]
+    results = list(parse_many(paths, extract=type, workers=0))
+    assert [result.value.__name__ if result.value else None for result in results] == ["Elf64", "PE32", None, None]
+    assert results[3].error == "ValueError: Unrecognized data format ('" + paths[3] + "')"
+
+
+def test_parse_many_extract_error():
+    """Test errors raised by extract are captured with their original type."""
+    results = list(parse_many([ELF_PATH], Elf64, extract=_missing_section, workers=0))
+    assert results[0].error == "KeyError: '.missing'"
+
+
+def test_parse_many_records(paths):
+    """Test batch parsing into a record array."""
+    array, failed = parse_many_records(paths, EntryRecord, Elf64, extract=_entry_record, workers=0, chunk_size=3)
+    assert array.item_count == 3
+    assert (array[0].entry.value, array[0].sections.value) == (0x640, 28)
+    assert array[1].entry.value == 0
+    assert [result.value for result in failed] == [1, 2]
+    assert [result.path for result in failed] == paths[1:]
+
+
+def test_parse_many_records_pack_error():
+    """Test records failing to pack part way are left zero filled."""
+    array, failed = parse_many_records(
+        [ELF_PATH], EntryRecord, Elf64, extract=lambda handler: (handler.entry.value, -1), workers=0
+    )
+    assert (array[0].entry.value, array[0].sections.value) == (0, 0)
+    assert failed[0].error.startswith("error")
+
+
+def test_parse_many_invalid_chunk_size():
+    """Test an invalid chunk size."""
+    with pytest.raises(ValueError):
+        list(parse_many([ELF_PATH], extract=_entry, chunk_size=0))
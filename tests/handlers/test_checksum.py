@@ -0,0 +1,153 @@
+"""Test suite for Internet checksums."""
+
+import random
+import struct
+
+import pytest
+
+from byteclasses.handlers.network.checksum import (
+    checksum,
+    ipv4_checksum,
+    ipv4_checksums,
+    tcp_checksum,
+    tcp_checksums,
+    udp_checksum,
+    udp_checksums,
+    update_checksum,
+    update_field,
+    verify_ipv4_checksum,
+)
+from byteclasses.handlers.network.ipv4_hdr import IPv4Hdr
+from byteclasses.handlers.network.packet import LinkType, Packet, decode
+
+IPV4_HDR = bytes.fromhex("4500 0073 0000 4000 4011 b861 c0a8 0001 c0a8 00c7")
+
+
+def _reference(data):
+    """Return the Internet checksum of data computed word by word (RFC 1071)."""
+    if len(data) % 2:
+        data += b"\x00"
+    total = 0
+    for idx in range(0, len(data), 2):
+        total += (data[idx] << 8) | data[idx + 1]
+        total = (total & 0xFFFF) + (total >> 16)
+    return ~total & 0xFFFF
+
+
+def _segment(rng, ipv6, udp):
+    """Return a random IP packet, its pseudo header and its transport segment."""
+    payload = rng.randbytes(rng.randrange(0, 40))
+    if udp:
+        hdr = struct.pack("!HHHH", rng.randrange(65536), rng.randrange(65536), 8 + len(payload), 0xABCD)
+    else:
+        hdr = struct.pack("!HHIIHHHH", 1, 2, 3, 4, 0x5010, 512, 0xABCD, 0)
+    segment = hdr + payload
+    protocol = 17 if udp else 6
+    src, dst = rng.randbytes(16 if ipv6 else 4), rng.randbytes(16 if ipv6 else 4)
+    if ipv6:
+        ip = struct.pack("!IHBB", 0x60000000, len(segment), protocol, 64) + src + dst
+        pseudo = src + dst + struct.pack("!I3xB", len(segment), protocol)
+    else:
+        ip = struct.pack("!BBHHHBBH", 0x45, 0, 20 + len(segment), 0, 0, 64, protocol, 0) + src + dst
+        pseudo = src + dst + struct.pack("!xBH", protocol, len(segment))
+    zeroed = segment[: 6 if udp else 16] + b"\x00\x00" + segment[8 if udp else 18 :]
+    return ip, hdr, payload, pseudo + zeroed
+
+
+def test_checksum_known_header():
+    """Test the checksum of a known IPv4 header."""
+    assert ipv4_checksum(IPV4_HDR) == 0xB861
+    assert verify_ipv4_checksum(IPV4_HDR)
+    assert not verify_ipv4_checksum(IPV4_HDR[:10] + b"\xb8\x62" + IPV4_HDR[12:])
+    assert checksum(IPV4_HDR) == 0
+    hdr = IPv4Hdr.from_buffer(bytearray(IPV4_HDR))
+    assert ipv4_checksum(hdr) == 0xB861
+    assert list(ipv4_checksums([IPV4_HDR, hdr])) == [0xB861, 0xB861]
+
+
+def test_checksum_invalid_header():
+    """Test an invalid IPv4 header length raises."""
+    with pytest.raises(ValueError):
+        ipv4_checksum(b"\x44" + IPV4_HDR[1:])
+
+
+@pytest.mark.parametrize("length", [0, 1, 2, 3, 17, 64, 1501])
+def test_checksum_reference(length):
+    """Test checksums of even and odd length data against a reference."""
+    data = random.Random(length).randbytes(length)
+    assert checksum(data) == _reference(data)
+
+
+@pytest.mark.parametrize("ipv6", [False, True])
+@pytest.mark.parametrize("udp", [False, True])
+def test_transport_checksum(ipv6, udp):
+    """Test transport checksums against a reference."""
+    rng = random.Random(ipv6 * 2 + udp)
+    for _ in range(20):
+        ip, hdr, payload, data = _segment(rng, ipv6, udp)
+        if udp:
+            assert udp_checksum(ip, hdr, payload) == (_reference(data) or 0xFFFF)
+        else:
+            assert tcp_checksum(ip, hdr, payload) == _reference(data)
+
+
+@pytest.mark.parametrize("ipv6", [False, True])
+@pytest.mark.parametrize("udp", [False, True])
+def test_transport_checksums(ipv6, udp):
+    """Test batch transport checksums match the scalar checksums."""
+    pytest.importorskip("numpy")
+    rng = random.Random(ipv6 * 2 + udp)
+    segments = [_segment(rng, ipv6, udp) for _ in range(20)]
+    packets = [decode(ip + hdr + payload, LinkType.RAW) for ip, hdr, payload, _ in segments]
+    if udp:
+        expected = [udp_checksum(ip, hdr, payload) for ip, hdr, payload, _ in segments]
+        assert udp_checksums(packets).tolist() == expected
+    else:
+        expected = [tcp_checksum(ip, hdr, payload) for ip, hdr, payload, _ in segments]
+        assert tcp_checksums(packets).tolist() == expected
+
+
+def test_transport_checksums_missing_layer():
+    """Test batch transport checksums of packets without an IP or transport layer raise."""
+    pytest.importorskip("numpy")
+    _, hdr, _, _ = _segment(random.Random(0), False, False)
+    with pytest.raises(ValueError):
+        tcp_checksums([Packet(memoryview(hdr), [("tcp", None, 0, len(hdr), len(hdr))])])
+    with pytest.raises(KeyError):
+        udp_checksums([Packet(memoryview(hdr), [("tcp", None, 0, len(hdr), len(hdr))])])
+
+
+def test_udp_zero_checksum():
+    """Test a UDP checksum of zero is transmitted as 0xFFFF."""
+    ip = struct.pack("!BBHHHBBH4s4s", 0x45, 0, 28, 0, 0, 64, 17, 0, bytes(4), bytes(4))
+    # The segment and pseudo header sum to 0xFFFF
+    hdr = struct.pack("!HHHH", 0xFFFF - 17 - 8 - 8, 0, 8, 0)
+    assert udp_checksum(ip, hdr) == 0xFFFF
+
+
+def test_update_checksum():
+    """Test incremental checksum updates match a full computation."""
+    rng = random.Random(0)
+    for _ in range(100):
+        data = bytearray(rng.randbytes(20))
+        csum = checksum(data)
+        offset = rng.randrange(0, 20, 2)
+        old = bytes(data[offset : offset + 2])
+        data[offset : offset + 2] = rng.randbytes(2)
+        assert update_checksum(csum, old, bytes(data[offset : offset + 2])) == checksum(data)
+        new = int.from_bytes(data[offset : offset + 2], "big")
+        assert update_checksum(csum, int.from_bytes(old, "big"), new) == checksum(data)
+    with pytest.raises(ValueError):
+        update_checksum(0, b"\x00", b"\x00")
+
+
+@pytest.mark.parametrize("name,value", [("time_to_live", 63), ("protocol", 6), ("identification", 0x1234)])
+def test_update_field(name, value):
+    """Test updating a header member keeps the header checksum valid."""
+    hdr = IPv4Hdr.from_buffer(bytearray(IPV4_HDR))
+    update_field(hdr, name, value)
+    assert getattr(hdr, name).value == value
+    assert verify_ipv4_checksum(hdr)
+    assert hdr.header_checksum.value == ipv4_checksum(hdr)
+    with pytest.raises(AttributeError):
+        update_field(hdr, "missing", 0)
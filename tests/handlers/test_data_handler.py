@@ -0,0 +1,112 @@
+"""Test suite for memory mapped data handlers."""
+
+import pytest
+
+from byteclasses.handlers.executables.elf import Elf64
+from byteclasses.handlers.executables.elf.elf_hdr import ElfHdr64
+
+ELF_PATH = "tests/data/hello_world.elf"
+
+
+@pytest.fixture(name="elf_path")
+def fixture_elf_path(tmp_path):
+    """Return the path of a copy of the test ELF file."""
+    path = tmp_path / "hello_world.elf"
+    with open(ELF_PATH, "rb") as file:
+        path.write_bytes(file.read())
+    return path
+
+
+def test_open_read_only(elf_path):
+    """Test opening a file read-only."""
+    elf = Elf64.open(elf_path)
+    assert bytes(elf) == elf_path.read_bytes()
+    assert elf.hdr.e_ident.data[:4] == b"\x7fELF"
+    assert elf.data.readonly
+    with pytest.raises(TypeError):
+        elf.data[0] = 0
+    elf.close()
+    assert elf._mmap is None  # pylint: disable=W0212
+
+
+def test_open_invalid_mode(elf_path):
+    """Test opening a file with an invalid mode."""
+    with pytest.raises(ValueError):
+        Elf64.open(elf_path, "w")
+
+
+def test_open_write_back(elf_path):
+    """Test changes to a file opened read-write are written back on flush and close."""
+    elf = Elf64.open(elf_path, "r+")
+    elf.hdr.e_entry = 0x1234
+    elf.flush()
+    assert ElfHdr64(data=elf_path.read_bytes()[:64]).e_entry == 0x1234
+    elf.data[-1] = 0xFF
+    elf.close()
+    assert elf_path.read_bytes()[-1] == 0xFF
+
+
+def test_close_releases_mapping(elf_path):
+    """Test close unmaps the file after releasing the handler views."""
+    elf = Elf64.open(elf_path)
+    mapping = elf._mmap  # pylint: disable=W0212
+    assert elf.hdr.e_entry == elf.entry
+    assert "_start" in elf.symbols().names
+    elf.close()
+    assert mapping.closed
+    assert len(elf) == 0
+    elf.close()
+
+
+def test_close_with_views_in_use(elf_path):
+    """Test close raises while views of the mapping are still in use."""
+    elf = Elf64.open(elf_path)
+    mapping = elf._mmap  # pylint: disable=W0212
+    view = elf.data[:4]
+    with pytest.raises(BufferError):
+        elf.close()
+    assert not mapping.closed
+    view.release()
+    elf.close()
+    assert mapping.closed
+
+
+def test_context_manager(elf_path):
+    """Test the data handler context manager closes the mapping."""
+    with Elf64.open(elf_path, "r+") as elf:
+        mapping = elf._mmap  # pylint: disable=W0212
+        elf.hdr.e_entry = 0x5678
+    assert mapping.closed
+    assert ElfHdr64(data=elf_path.read_bytes()[:64]).e_entry == 0x5678
+
+
+def test_context_manager_exception(elf_path):
+    """Test an exception leaving the context is not replaced by the close error."""
+    with pytest.raises(KeyError):
+        with Elf64.open(elf_path) as elf:
+            view = elf.data[:4]
+            raise KeyError(bytes(view))
+
+
+def test_open_invalid_data(tmp_path):
+    """Test the handler error is raised when a mapped file cannot be parsed."""
+    path = tmp_path / "truncated.elf"
+    path.write_bytes(b"\x7fELF\x02")
+    with pytest.raises(ValueError):
+        Elf64.open(path)
+
+
+def test_memoryview_aliasing():
+    """Test memoryview data is used in place while other data is copied."""
+    with open(ELF_PATH, "rb") as file:
+        source = bytearray(file.read())
+    elf = Elf64(memoryview(source))
+    source[0x10] = 3
+    assert elf.hdr.e_type.value == 3
+    elf.hdr.e_type = 2
+    assert source[0x10] == 2
+    with pytest.raises(BufferError):
+        source.append(0)
+    copied = Elf64(bytes(memoryview(source)))
+    source[0x10] = 3
+    assert copied.hdr.e_type.value == 2
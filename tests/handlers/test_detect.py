@@ -0,0 +1,92 @@
+"""Test suite for data format detection."""
+
+import struct
+
+import pytest
+
+from byteclasses.handlers import detect, open_any, register_magic
+from byteclasses.handlers.executables.elf import Elf64
+from byteclasses.handlers.executables.mach import Fat, Mach64
+from byteclasses.handlers.executables.pe import PE32
+from byteclasses.handlers.images import JPG
+from byteclasses.handlers.network.pcap import Pcap, PcapWriter
+from byteclasses.handlers.network.pcapng import PcapNG, PcapNGWriter
+
+from .network_helpers import write_capture
+
+DATA_FILES = {
+    "tests/data/hello_world.elf": Elf64,
+    "tests/data/hello_world.pe": PE32,
+    "tests/data/hello_world.mach-o": Mach64,
+    "tests/data/sample.jpg": JPG,
+}
+
+
+def _read(path):
+    """Return the contents of a file."""
+    with open(path, "rb") as file:
+        return file.read()
+
+
+@pytest.mark.parametrize("path,handler_cls", DATA_FILES.items())
+def test_detect_files(path, handler_cls):
+    """Test detecting the test data files."""
+    assert detect(_read(path)) is handler_cls
+
+
+def test_detect_captures():
+    """Test detecting pcap and pcapng captures."""
+    assert detect(write_capture(PcapWriter)) is Pcap
+    assert detect(write_capture(PcapNGWriter)) is PcapNG
+
+
+def test_detect_fat():
+    """Test fat binaries are told apart from Java class files."""
+    assert detect(struct.pack(">4sI", b"\xca\xfe\xba\xbe", 2) + bytes(40)) is Fat
+    assert detect(struct.pack(">4sHH", b"\xca\xfe\xba\xbe", 0, 61) + bytes(40)) is None
+
+
+def test_detect_unknown():
+    """Test unrecognized and truncated data."""
+    assert detect(b"") is None
+    assert detect(b"\x7fEL") is None
+    assert detect(b"MZ" + bytes(100)) is None
+    assert detect(bytes(64)) is None
+
+
+def test_register_magic():
+    """Test registering a handler for a longer magic prefix."""
+    register_magic(b"\x7fELF\x02\x01\x01\xfe", Fat)
+    try:
+        assert detect(b"\x7fELF\x02\x01\x01\xfe" + bytes(56)) is Fat
+        assert detect(_read("tests/data/hello_world.elf")) is Elf64
+    finally:
+        register_magic(b"\x7fELF\x02\x01\x01\xfe", lambda _: None)
+    with pytest.raises(ValueError):
+        register_magic(b"", Fat)
+
+
+@pytest.mark.parametrize("path,handler_cls", DATA_FILES.items())
+def test_open_any_file(path, handler_cls):
+    """Test opening the test data files as memory mapped files."""
+    with open_any(path) as handler:
+        assert type(handler) is handler_cls  # pylint: disable=C0123
+        assert bytes(handler) == _read(path)
+
+
+def test_open_any_buffer():
+    """Test opening a buffer in place."""
+    data = bytearray(_read("tests/data/hello_world.elf"))
+    elf = open_any(data)
+    assert isinstance(elf, Elf64)
+    assert elf.data.obj is data
+
+
+def test_open_any_unknown(tmp_path):
+    """Test opening unrecognized data."""
+    path = tmp_path / "unknown.bin"
+    path.write_bytes(bytes(64))
+    with pytest.raises(ValueError):
+        open_any(path)
+    with pytest.raises(ValueError):
+        open_any(bytes(64))
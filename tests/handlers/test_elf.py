@@ -0,0 +1,86 @@
+"""Test suite for the ELF executable handler.
+
+Expected values are taken from readelf output for tests/data/hello_world.elf.
+"""
+
+import pytest
+
+from byteclasses.handlers.executables.elf import Elf64
+
+ELF_PATH = "tests/data/hello_world.elf"
+
+
+@pytest.fixture(name="elf")
+def fixture_elf():
+    """Return the test ELF handler."""
+    with open(ELF_PATH, "rb") as file:
+        return Elf64(file.read())
+
+
+def test_elf_header(elf):
+    """Test ELF header properties."""
+    assert elf.entry == 0x640
+    assert len(elf.section_table) == elf.hdr.e_shnum.value
+    assert len(elf.program_table) == elf.hdr.e_phnum.value
+
+
+def test_elf_section_lookup(elf):
+    """Test section lookup by name."""
+    assert elf.section_names[:4] == ("", ".interp", ".note.gnu.build-id", ".note.ABI-tag")
+    text = elf.section_by_name(".text")
+    assert text.hdr.sh_addr.value == 0x640
+    assert len(elf.section_data(text)) == text.hdr.sh_size.value
+    assert bytes(elf.section_data(elf.section_by_name(".interp"))) == b"/lib/ld-linux-aarch64.so.1\x00"
+    with pytest.raises(KeyError):
+        elf.section_by_name(".missing")
+
+
+def test_elf_symbol_lookup(elf):
+    """Test symbol lookup by name and by address."""
+    symbols = elf.symbols()
+    assert len(symbols) == 88
+    main = symbols.by_name("main")
+    assert (main.st_value.value, main.st_size.value) == (0x754, 40)
+    assert symbols.by_name("_start").st_value.value == 0x640
+    assert symbols.by_address(0x754 + 39).st_value.value == 0x754
+    assert symbols.by_address(0x10) is None
+    with pytest.raises(KeyError):
+        symbols.by_name("missing")
+    dynamic = elf.symbols(dynamic=True)
+    assert len(dynamic) == 10
+    assert "puts" in dynamic.names
+
+
+def test_elf_relocations(elf):
+    """Test relocation iteration, columns and record arrays."""
+    offsets = {section.hdr.sh_offset.value for section in elf.relocation_sections}
+    assert offsets == {0x480, 0x540}
+    entries = [(entry.r_offset.value, entry.r_addend.value) for entry in elf.iter_relocations(".rela.dyn")]
+    assert entries[:4] == [(0x10D90, 0x750), (0x10D98, 0x700), (0x10FF0, 0x754), (0x11008, 0x11008)]
+    assert len(entries) == 8
+    columns = elf.relocation_columns(".rela.plt")
+    assert columns["r_offset"] == [0x10FA8, 0x10FB0, 0x10FB8, 0x10FC0, 0x10FC8]
+    assert columns["r_sym"] == [3, 5, 6, 7, 8]
+    assert columns["r_type"] == [0x402] * 5
+    array = elf.relocation_array(".rela.dyn")
+    assert array.item_count == 8
+    assert array[4].r_info.value == 0x000400000401
+    with pytest.raises(ValueError):
+        elf.relocation_columns(".text")
+
+
+def test_elf_dynamic(elf):
+    """Test dynamic section iteration stops at the NULL entry."""
+    tags = [int(entry.d_tag) for entry in elf.iter_dynamic()]
+    assert tags
+    assert 0 not in tags
+    assert 1 in tags  # DT_NEEDED
+
+
+def test_elf_notes(elf):
+    """Test note iteration."""
+    notes = [(hdr.n_type.value, bytes(name), bytes(desc)) for hdr, name, desc in elf.iter_notes()]
+    assert notes == [
+        (3, b"GNU\x00", bytes.fromhex("ed7bfa4b7832cce6e1af834a846cfcd3c921bf39")),
+        (1, b"GNU\x00", bytes.fromhex("00000000030000000700000000000000")),
+    ]
@@ -0,0 +1,143 @@
+"""Test suite for compiled packet filters."""
+
+import random
+import struct
+
+import pytest
+
+from byteclasses.handlers.network.filter import F
+from byteclasses.handlers.network.packet import IPProto, LinkType, _decoders, decode, register_decoder
+from byteclasses.handlers.network.pcap import Pcap, PcapWriter
+from byteclasses.handlers.network.pcapng import PcapNG, PcapNGWriter
+
+from .network_helpers import ETH, ipv4, ipv6, write_capture
+
+np = pytest.importorskip("numpy")
+
+
+def _tcp(dst_port, payload=b""):
+    """Return a TCP segment."""
+    return struct.pack("!HHIIHHHH", 40000, dst_port, 1, 0, 0x5018, 65535, 0, 0) + payload
+
+
+def _udp(dst_port, payload=b""):
+    """Return a UDP datagram."""
+    return struct.pack("!HHHH", 53, dst_port, 8 + len(payload), 0) + payload
+
+
+def _ext(next_hdr, length=0):
+    """Return an IPv6 hop-by-hop, routing or destination options extension header."""
+    return struct.pack("!BB", next_hdr, length) + bytes(6 + length * 8)
+
+
+def _frag(next_hdr, offset=0):
+    """Return an IPv6 fragment extension header."""
+    return struct.pack("!BxHI", next_hdr, offset << 3, 1)
+
+
+FRAMES = [
+    ETH + b"\x08\x00" + ipv4(6, _tcp(443)),
+    ETH + b"\x08\x00" + ipv4(6, _tcp(80)),
+    ETH + b"\x08\x00" + ipv4(6, _tcp(443), frag=0x0010),
+    ETH + b"\x08\x00" + ipv4(17, _udp(443)),
+    ETH + b"\x81\x00\x00\x05\x08\x00" + ipv4(6, _tcp(443)),
+    ETH + b"\x81\x00\x00\x05\x81\x00\x00\x06\x08\x00" + ipv4(6, _tcp(443)),
+    ETH + b"\x86\xdd" + ipv6(6, _tcp(443)),
+    ETH + b"\x86\xdd" + ipv6(44, _frag(6) + _tcp(443)),
+    ETH + b"\x86\xdd" + ipv6(44, _frag(6, 100) + _tcp(443)),
+    ETH + b"\x86\xdd" + ipv6(0, _ext(43, 1) + _ext(60) + _ext(44) + _frag(17) + _udp(443)),
+    ETH + b"\x86\xdd" + ipv6(0, _ext(6, 4)[:12]),
+    ETH + b"\x08\x00" + ipv4(6, _tcp(443))[:30],
+    ETH[:10],
+]
+
+EXPRESSIONS = [
+    F.tcp,
+    F.udp,
+    F.vlan,
+    F.ipv6,
+    (F.tcp.dst_port == 443),
+    (F.udp.dst_port == 443) | (F.tcp.dst_port == 80),
+    (F.ipv4.protocol == 6) & F.tcp.dst_port.in_({80, 443}),
+    ~F.tcp | (F.vlan.tci == 5),
+]
+
+
+def test_filter_match():
+    """Test matching decoded packets."""
+    packet_filter = ((F.ipv4.protocol == 6) & F.tcp.dst_port.in_({80, 443})).compile()
+    assert packet_filter(decode(FRAMES[0]))
+    assert not packet_filter(decode(FRAMES[3]))
+    assert not packet_filter(decode(FRAMES[2]))
+    assert (F.tcp.dst_port == 443).compile()(decode(FRAMES[7]))
+    assert not F.tcp.compile()(decode(FRAMES[8]))
+    assert F.udp.compile()(decode(FRAMES[9]))
+
+
+@pytest.mark.parametrize("expr", EXPRESSIONS, ids=repr)
+@pytest.mark.parametrize("writer_cls,capture_cls", [(PcapWriter, Pcap), (PcapNGWriter, PcapNG)])
+def test_filter_indices_agree(expr, writer_cls, capture_cls):
+    """Test capture masks agree with matching every decoded packet."""
+    capture = capture_cls(memoryview(write_capture(writer_cls, FRAMES)))
+    packet_filter = expr.compile()
+    expected = [idx for idx, packet in enumerate(capture.iter_packets()) if packet_filter(packet)]
+    assert packet_filter.indices(capture).tolist() == expected
+
+
+def test_filter_indices_agree_mutated():
+    """Test capture masks agree with matching every decoded packet of mutated frames."""
+    rng = random.Random(1)
+    frames = []
+    for _ in range(2000):
+        frame = bytearray(rng.choice(FRAMES))
+        for _ in range(rng.randrange(3)):
+            frame[rng.randrange(len(frame))] = rng.choice(
+                (0, 4, 6, 17, 43, 44, 60, 0x45, 0x60, 0xFF, rng.randrange(256))
+            )
+        frames.append(bytes(frame[: rng.randrange(len(frame) + 1)] if rng.random() < 0.1 else frame))
+    capture = Pcap(memoryview(write_capture(PcapWriter, frames)))
+    for expr in EXPRESSIONS:
+        packet_filter = expr.compile()
+        expected = [idx for idx, packet in enumerate(capture.iter_packets()) if packet_filter(packet)]
+        assert packet_filter.indices(capture).tolist() == expected, repr(expr)
+
+
+def test_filter_raw_link_type():
+    """Test masks of raw IP captures."""
+    frames = [ipv4(6, _tcp(443)), ipv6(60, _ext(6) + _tcp(443)), ipv6(17, _udp(443))]
+    capture = Pcap(memoryview(write_capture(PcapWriter, frames, link_type=LinkType.RAW)))
+    assert (F.tcp.dst_port == 443).compile().indices(capture).tolist() == [0, 1]
+
+
+def test_filter_mask_unsupported_layer():
+    """Test masks of layers not decoded by the NumPy decoders."""
+    packet_filter = F.ipv6_frag.compile()
+    capture = Pcap(memoryview(write_capture(PcapWriter, FRAMES)))
+    with pytest.raises(ValueError):
+        packet_filter.mask(capture.data, *capture.packet_bounds())
+    assert packet_filter.indices(capture).tolist() == [7, 8, 9]
+
+
+def test_filter_out_of_range_value():
+    """Test comparing fields to integers outside of the field range."""
+    for make_expr in (
+        lambda: F.tcp.dst_port.in_([-1, 80]),
+        lambda: F.tcp.dst_port == 0x10000,
+        lambda: F.tcp.dst_port < -1,
+        lambda: F.ipv4.ver_ihl.ihl == 16,
+    ):
+        with pytest.raises(ValueError):
+            make_expr()
+    assert repr(F.ipv4.ver_ihl.ihl == 15) == "(F.ipv4.ver_ihl.ihl == 15)"
+
+
+def test_filter_indices_registered_decoder():
+    """Test captures are matched packet by packet while a decoder is overridden."""
+    udp_decoder = _decoders["ip"][IPProto.UDP]
+    register_decoder("ip", IPProto.UDP, lambda data, offset, end: None)
+    try:
+        capture = Pcap(memoryview(write_capture(PcapWriter, FRAMES)))
+        assert F.udp.compile().indices(capture).tolist() == []
+    finally:
+        register_decoder("ip", IPProto.UDP, udp_decoder)
+    assert F.udp.compile().indices(capture).tolist() == [3, 9]
@@ -0,0 +1,108 @@
+"""Test suite for the Mach-O executable and fat binary handlers."""
+
+import struct
+from uuid import UUID
+
+import pytest
+
+from byteclasses.handlers.executables.mach import Fat, Mach64
+from byteclasses.handlers.executables.mach.fat import FAT_MAGIC32, FAT_MAGIC64
+from byteclasses.handlers.executables.mach.load_command import LoadCmdType
+
+MACH_PATH = "tests/data/hello_world.mach-o"
+CPU_TYPE_ARM64 = 0x0100000C
+CPU_TYPE_X86_64 = 0x01000007
+
+
+@pytest.fixture(name="mach_data")
+def fixture_mach_data():
+    """Return the test Mach-O data."""
+    with open(MACH_PATH, "rb") as file:
+        return file.read()
+
+
+def _fat(slices, magic=FAT_MAGIC32):
+    """Return a fat binary of (cputype, data) slices, each aligned to 4096 bytes."""
+    data = bytearray(struct.pack(">4sI", magic, len(slices)))
+    offsets = []
+    offset = 4096
+    for _, slice_data in slices:
+        offsets.append(offset)
+        offset += -(-len(slice_data) // 4096) * 4096
+    for (cputype, slice_data), offset in zip(slices, offsets):
+        if magic == FAT_MAGIC32:
+            data += struct.pack(">iiIII", cputype, 0, offset, len(slice_data), 12)
+        else:
+            data += struct.pack(">iiQQII", cputype, 0, offset, len(slice_data), 12, 0)
+    for (_, slice_data), offset in zip(slices, offsets):
+        data = data.ljust(offset, b"\x00") + slice_data
+    return bytes(data)
+
+
+def test_mach_header(mach_data):
+    """Test Mach-O header properties."""
+    mach = Mach64(mach_data)
+    assert mach.cpu_type == "ARM64"
+    assert mach.cpu_subtype == "ARM64_ALL"
+    assert mach.num_cmds.value == 17
+    assert mach.uuid == UUID("f0faad35-6707-3228-87cd-c7aa7a754d7d")
+
+
+def test_mach_load_commands(mach_data):
+    """Test load command walking."""
+    mach = Mach64(mach_data)
+    commands = [(cmd.cmd.value, cmd.cmdsize.value) for cmd in mach.iter_load_commands()]
+    assert len(commands) == 17
+    segment_sizes = [72, 392, 152, 72]
+    assert commands[:4] == [(LoadCmdType.SEGMENT_64, size) for size in segment_sizes]
+    assert (LoadCmdType.UUID, 24) in commands
+    assert (LoadCmdType.SYMTAB, 24) in commands
+    assert sum(size for _, size in commands) == mach.cmd_size.value
+
+
+def test_mach_segments(mach_data):
+    """Test segment and section tables."""
+    mach = Mach64(mach_data)
+    assert [(seg.cmd.segname.value, len(seg.sections)) for seg in mach.segments] == [
+        ("__PAGEZERO", 0),
+        ("__TEXT", 4),
+        ("__DATA_CONST", 1),
+        ("__LINKEDIT", 0),
+    ]
+    text = mach.segment_by_name("__TEXT")
+    assert text.cmd.vmaddr.value == 0x100000000
+    assert [section.sectname.value for section in text.sections] == ["__text", "__stubs", "__cstring", "__unwind_info"]
+    with pytest.raises(KeyError):
+        mach.segment_by_name("__MISSING")
+
+
+def test_mach_invalid_load_commands(mach_data):
+    """Test load commands exceeding sizeofcmds are rejected."""
+    data = bytearray(mach_data)
+    struct.pack_into("<I", data, 20, 32)  # sizeofcmds
+    with pytest.raises(ValueError):
+        list(Mach64(data).iter_load_commands())
+
+
+@pytest.mark.parametrize("magic", [FAT_MAGIC32, FAT_MAGIC64])
+def test_fat_binary(mach_data, magic):
+    """Test fat binary architecture slices."""
+    fat = Fat(_fat([(CPU_TYPE_X86_64, mach_data), (CPU_TYPE_ARM64, mach_data)], magic))
+    assert len(fat.arch_table) == 2
+    assert fat.cpu_types == ["X86_64", "ARM64"]
+    assert bytes(fat.arch_data(1)) == mach_data
+    arch = fat.arch(1)
+    assert isinstance(arch, Mach64)
+    assert arch is fat.arch(-1)
+    assert arch.uuid == UUID("f0faad35-6707-3228-87cd-c7aa7a754d7d")
+
+
+def test_fat_binary_invalid(mach_data):
+    """Test invalid fat binaries."""
+    with pytest.raises(ValueError):
+        Fat(b"\xca\xfe")
+    with pytest.raises(ValueError):
+        Fat(b"\x00" * 64)
+    fat = Fat(_fat([(CPU_TYPE_ARM64, mach_data)])[:8192])
+    with pytest.raises(ValueError):
+        fat.arch_data(0)
@@ -0,0 +1,105 @@
+"""Test suite for layered packet decoding."""
+
+import struct
+
+import pytest
+
+from byteclasses.handlers.network.packet import LinkType, _decoders, decode, register_decoder
+
+from .network_helpers import ETH, ipv4, ipv6
+
+TCP = struct.pack("!HHIIHHHH", 40000, 443, 1, 0, 0x6018, 65535, 0, 0) + b"\x02\x04\x05\xb4"
+UDP = struct.pack("!HHHH", 53, 5353, 8 + 4, 0) + b"data"
+
+
+def test_decode_ipv4_tcp():
+    """Test decoding a TCP segment with options over IPv4 over Ethernet."""
+    frame = ETH + b"\x08\x00" + ipv4(6, TCP + b"payload") + b"\x00" * 4
+    packet = decode(frame)
+    assert packet.names == ["eth", "ipv4", "tcp"]
+    assert [layer.offset for layer in packet] == [0, 14, 34]
+    tcp = packet["tcp"]
+    assert tcp.hdr_length == 24
+    assert bytes(tcp.payload) == b"payload"
+    assert bytes(packet.payload) == b"payload"
+    assert tcp.hdr.dst_port.value == 443
+    assert packet["ipv4"].hdr.protocol.value == 6
+    assert packet["ipv4"].end == len(frame) - 4
+    assert packet.layer_offset("tcp") == 34
+    assert packet.bounds == [
+        ("eth", 0, 14, len(frame)),
+        ("ipv4", 14, 20, len(frame) - 4),
+        ("tcp", 34, 24, len(frame) - 4),
+    ]
+    assert "udp" not in packet
+    assert packet.get("udp") is None
+    with pytest.raises(KeyError):
+        _ = packet["udp"]
+
+
+def test_decode_zero_copy():
+    """Test layer payloads are views of the packet data."""
+    frame = bytearray(ETH + b"\x08\x00" + ipv4(17, UDP))
+    packet = decode(frame)
+    payload = packet["udp"].payload
+    assert bytes(payload) == b"data"
+    frame[-4:] = b"DATA"
+    assert bytes(payload) == b"DATA"
+    packet["udp"].hdr.dst_port = 53
+    assert frame[36:38] == b"\x00\x35"
+
+
+def test_decode_vlan_ipv6_udp():
+    """Test decoding stacked VLAN tags and IPv6 extension headers."""
+    hop_by_hop = struct.pack("!BB", 44, 0) + bytes(6)
+    fragment = struct.pack("!BxHI", 17, 0, 1)
+    frame = ETH + b"\x81\x00\x00\x05\x81\x00\x00\x06\x86\xdd" + ipv6(0, hop_by_hop + fragment + UDP)
+    packet = decode(frame)
+    assert packet.names == ["eth", "vlan", "vlan", "ipv6", "ipv6_hopopt", "ipv6_frag", "udp"]
+    assert bytes(packet["udp"].payload) == b"data"
+    assert packet["vlan"].hdr.tci.value == 5
+
+
+def test_decode_fragments():
+    """Test transport headers are only decoded from first fragments."""
+    assert decode(ETH + b"\x08\x00" + ipv4(6, TCP, frag=0x0010)).names == ["eth", "ipv4"]
+    fragment = struct.pack("!BxHI", 6, 100 << 3, 1)
+    assert decode(ETH + b"\x86\xdd" + ipv6(44, fragment + TCP)).names == ["eth", "ipv6", "ipv6_frag"]
+
+
+def test_decode_truncated():
+    """Test decoding stops at the first truncated header."""
+    assert decode(ETH[:10]).names == []
+    assert decode(ETH + b"\x08\x00" + ipv4(6, TCP)[:30]).names == ["eth"]
+    assert decode(ETH + b"\x08\x00" + ipv4(6, TCP[:10])).names == ["eth", "ipv4"]
+    assert decode(ETH + b"\x08\x00" + ipv4(17, UDP)[:-2]).names == ["eth"]
+
+
+@pytest.mark.parametrize(
+    "link_type,data,names",
+    [
+        (LinkType.RAW, ipv4(6, TCP), ["ipv4", "tcp"]),
+        (LinkType.RAW, ipv6(17, UDP), ["ipv6", "udp"]),
+        (LinkType.IPV4, ipv4(17, UDP), ["ipv4", "udp"]),
+        (LinkType.IPV6, ipv6(6, TCP), ["ipv6", "tcp"]),
+    ],
+)
+def test_decode_link_types(link_type, data, names):
+    """Test decoding raw IP link types."""
+    assert decode(data, link_type).names == names
+
+
+def test_register_decoder():
+    """Test registering a decoder."""
+
+    def decode_gre(view, offset, end):
+        return ("gre", None, 4, end, "ether", struct.unpack_from("!2xH", view, offset)[0])
+
+    register_decoder("ip", 47, decode_gre)
+    try:
+        packet = decode(ETH + b"\x08\x00" + ipv4(47, b"\x00\x00\x08\x00" + ipv4(17, UDP)))
+        assert packet.names == ["eth", "ipv4", "gre", "ipv4", "udp"]
+    finally:
+        del _decoders["ip"][47]
+    with pytest.raises(ValueError):
+        register_decoder("transport", 1, decode_gre)
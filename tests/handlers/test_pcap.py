@@ -0,0 +1,107 @@
+"""Test suite for pcap and pcapng capture files."""
+
+import io
+import struct
+
+import pytest
+
+from byteclasses.handlers.network.packet import LinkType
+from byteclasses.handlers.network.pcap import Pcap, PcapWriter
+from byteclasses.handlers.network.pcapng import PcapNG, PcapNGWriter
+
+from .network_helpers import write_capture
+
+PACKETS = [bytes(range(60)), b"\xff" * 7, bytes(1500)]
+TIMESTAMPS = [1700000000.25, 1700000001.5, 1700000002.000125]
+
+
+def _capture(writer_cls, **kwargs):
+    """Return the bytes of a capture of PACKETS written with writer_cls."""
+    return write_capture(writer_cls, PACKETS, TIMESTAMPS, **kwargs)
+
+
+@pytest.mark.parametrize("reader_cls,writer_cls", [(Pcap, PcapWriter), (PcapNG, PcapNGWriter)])
+def test_capture_round_trip(reader_cls, writer_cls):
+    """Test reading back written packets and timestamps."""
+    capture = reader_cls(_capture(writer_cls, link_type=LinkType.RAW))
+    assert capture.packet_count == len(PACKETS)
+    assert [bytes(capture.packet_data(idx)) for idx in range(capture.packet_count)] == PACKETS
+    for idx, timestamp in enumerate(TIMESTAMPS):
+        assert capture.timestamp(idx) == pytest.approx(timestamp, abs=1e-6)
+    assert capture.record_hdr(1).orig_len.value == 7
+
+
+@pytest.mark.parametrize("reader_cls,writer_cls", [(Pcap, PcapWriter), (PcapNG, PcapNGWriter)])
+def test_capture_snaplen(reader_cls, writer_cls):
+    """Test packets longer than the snapshot length are truncated."""
+    capture = reader_cls(_capture(writer_cls, snaplen=16))
+    assert [len(capture.packet_data(idx)) for idx in range(capture.packet_count)] == [16, 7, 16]
+    assert capture.record_hdr(2).orig_len.value == 1500
+
+
+@pytest.mark.parametrize("reader_cls,writer_cls", [(Pcap, PcapWriter), (PcapNG, PcapNGWriter)])
+def test_capture_packet_bounds(reader_cls, writer_cls):
+    """Test packet bounds match the packet data views."""
+    pytest.importorskip("numpy")
+    data = _capture(writer_cls)
+    capture = reader_cls(data)
+    starts, lengths = capture.packet_bounds()
+    assert [data[start : start + length] for start, length in zip(starts, lengths)] == PACKETS
+
+
+def test_pcap_header():
+    """Test the pcap file header fields."""
+    pcap = Pcap(_capture(PcapWriter, link_type=LinkType.RAW))
+    assert pcap.link_type == LinkType.RAW
+    assert not pcap.nanosecond
+    assert pcap.hdr.snaplen.value == 0x40000
+
+
+def test_pcap_nanosecond():
+    """Test nanosecond resolution timestamps."""
+    file = io.BytesIO()
+    with PcapWriter(file, nanosecond=True) as writer:
+        writer.write(b"data", 12.000000125)
+    pcap = Pcap(file.getvalue())
+    assert pcap.nanosecond
+    assert pcap.record_hdr(0).ts_frac.value == 125
+    assert pcap.timestamp(0) == pytest.approx(12.000000125, abs=1e-9)
+
+
+def test_pcap_truncated():
+    """Test a truncated trailing record is not indexed."""
+    data = _capture(PcapWriter)
+    assert Pcap(data[:-1]).packet_count == 2
+    with pytest.raises(ValueError):
+        Pcap(b"\x00" * 24)
+
+
+def test_pcapng_interfaces():
+    """Test pcapng interface description."""
+    pcapng = PcapNG(_capture(PcapNGWriter, link_type=LinkType.RAW, snaplen=128))
+    assert len(pcapng.interfaces) == 1
+    iface = pcapng.interface(0)
+    assert iface.link_type == LinkType.RAW
+    assert iface.snaplen == 128
+    assert iface.ts_unit == pytest.approx(1e-6)
+    assert iface.byte_order == "<"
+
+
+def test_pcapng_big_endian():
+    """Test reading a big endian pcapng section with a simple packet block."""
+    shb = struct.pack(">IIIHHqI", 0x0A0D0D0A, 28, 0x1A2B3C4D, 1, 0, -1, 28)
+    idb = struct.pack(">IIHHII", 1, 20, int(LinkType.RAW), 0, 0, 20)
+    spb = struct.pack(">III", 3, 24, 5) + b"hello\x00\x00\x00" + struct.pack(">I", 24)
+    pcapng = PcapNG(shb + idb + spb)
+    assert pcapng.packet_count == 1
+    assert pcapng.interface(0).byte_order == ">"
+    assert bytes(pcapng.packet_data(0)) == b"hello"
+    assert pcapng.timestamp(0) is None
+
+
+def test_pcapng_truncated():
+    """Test indexing stops at a truncated block."""
+    data = _capture(PcapNGWriter)
+    assert PcapNG(data[:-4]).packet_count == 2
+    with pytest.raises(ValueError):
+        PcapNG(b"\x00" * 28)
@@ -0,0 +1,69 @@
+"""Test suite for the PE executable handler.
+
+Expected values are taken from objdump -p and objdump -h output for
+tests/data/hello_world.pe.
+"""
+
+import pytest
+
+from byteclasses.handlers.executables.pe import PE32
+from byteclasses.handlers.executables.pe.data_dir import DirEntry
+
+PE_PATH = "tests/data/hello_world.pe"
+
+
+@pytest.fixture(name="pe")
+def fixture_pe():
+    """Return the test PE handler."""
+    with open(PE_PATH, "rb") as file:
+        return PE32(file.read())
+
+
+def test_pe_header(pe):
+    """Test PE header properties."""
+    assert pe.dos_hdr.e_magic.data == b"MZ"
+    assert pe.hdr.opt_hdr.addr_of_entrypoint.value == 0x11023
+    assert len(pe.section_table) == 9
+    assert [section.name.value for section in pe.section_table][:5] == [
+        ".textbss",
+        ".text",
+        ".rdata",
+        ".data",
+        ".idata",
+    ]
+
+
+def test_pe_rva_mapping(pe):
+    """Test RVA to file offset translation."""
+    assert pe.rva_to_offset(0x11000) == 0x400
+    assert pe.rva_to_offset(0x17010) == 0x5A10
+    assert pe.rva_to_offset(0x1B1C4) == 0x81C4
+    assert pe.rva_to_offset(0x100) == 0x100
+    assert bytes(pe.rva_data(0x1B49E, 17)) == b"VCRUNTIME140D.dll"
+    with pytest.raises(ValueError):
+        pe.rva_to_offset(0x1000)  # .textbss has no file data
+    with pytest.raises(ValueError):
+        pe.rva_to_offset(0x99999999)
+
+
+def test_pe_data_directory(pe):
+    """Test data directory entries."""
+    assert pe.data_directory(DirEntry.IMPORT).vaddr.value == 0x1B1C4
+    assert pe.data_directory(DirEntry.EXPORT).vaddr.value == 0
+    assert pe.export_dir is None
+    assert not list(pe.iter_exports())
+    with pytest.raises(KeyError):
+        pe.export_by_name("main")
+
+
+def test_pe_imports(pe):
+    """Test import parsing."""
+    imports = list(pe.iter_imports())
+    counts = {}
+    for imp in imports:
+        counts[imp.dll] = counts.get(imp.dll, 0) + 1
+    assert counts == {"VCRUNTIME140D.dll": 8, "ucrtbased.dll": 37, "KERNEL32.dll": 23}
+    first = imports[0]
+    assert (first.name, first.hint, first.ordinal, first.iat_rva) == ("__vcrt_GetModuleFileNameW", 46, None, 0x1B098)
+    assert ("strcat_s", 1349) in [(imp.name, imp.hint) for imp in imports]
+    assert [imp.name for imp in imports if imp.dll == "KERNEL32.dll"][:2] == ["HeapAlloc", "IsDebuggerPresent"]
@@ -0,0 +1,141 @@
+"""Test suite for TCP stream reassembly."""
+
+import struct
+
+from byteclasses.handlers.network.packet import decode
+from byteclasses.handlers.network.reassembly import FlowKey, Stream, TCPReassembler
+
+CLIENT = (b"\x0a\x00\x00\x01", 40000)
+SERVER = (b"\x0a\x00\x00\x02", 80)
+
+SYN = 0x02
+ACK = 0x10
+FIN = 0x01
+RST = 0x04
+
+
+def _segment(src, dst, seq, flags=ACK, payload=b""):
+    """Return the IPv4 header, TCP header and payload of a segment."""
+    tcp = struct.pack("!HHIIHHHH", src[1], dst[1], seq & 0xFFFFFFFF, 0, 0x5000 | flags, 65535, 0, 0)
+    ip = struct.pack("!BBHHHBBH4s4s", 0x45, 0, 40 + len(payload), 1, 0, 64, 6, 0, src[0], dst[0])
+    return ip, tcp, payload
+
+
+def _stream(isn=0):
+    """Return a stream started by a SYN with initial sequence number isn."""
+    stream = Stream()
+    stream._add(isn, b"", True)  # pylint: disable=W0212
+    return stream
+
+
+def test_stream_in_order():
+    """Test in-order segments are appended without copying."""
+    stream = _stream()
+    stream._add(1, b"hello ", False)  # pylint: disable=W0212
+    stream._add(7, b"world", False)  # pylint: disable=W0212
+    assert len(stream.chunks) == 2
+    assert bytes(stream) == b"hello world"
+    buffer = bytearray(5)
+    assert stream.readinto(buffer, 6) == 5
+    assert buffer == b"world"
+
+
+def test_stream_out_of_order():
+    """Test segments received ahead of a gap are held until the gap is filled."""
+    stream = _stream()
+    stream._add(11, b"B" * 10, False)  # pylint: disable=W0212
+    assert len(stream) == 0
+    assert stream.pending_bytes == 10
+    stream._add(1, b"A" * 10, False)  # pylint: disable=W0212
+    assert stream.data == b"A" * 10 + b"B" * 10
+    assert stream.pending_bytes == 0
+
+
+def test_stream_overlap_first_received_wins():
+    """Test overlapping data is resolved in favour of the data received first."""
+    stream = _stream()
+    stream._add(11, b"A" * 20, False)  # pylint: disable=W0212
+    stream._add(1, b"B" * 12, False)  # pylint: disable=W0212
+    assert stream.data == b"B" * 10 + b"A" * 20
+    stream = _stream()
+    stream._add(21, b"C" * 20, False)  # pylint: disable=W0212
+    stream._add(11, b"D" * 20, False)  # pylint: disable=W0212
+    stream._add(1, b"E" * 50, False)  # pylint: disable=W0212
+    assert stream.data == b"E" * 10 + b"D" * 10 + b"C" * 20 + b"E" * 10
+    stream._add(41, b"F" * 20, False)  # pylint: disable=W0212
+    assert stream.data[40:] == b"E" * 10 + b"F" * 10
+
+
+def test_stream_sequence_wraparound():
+    """Test streams crossing the sequence number wraparound."""
+    stream = _stream(0xFFFFFFF0)
+    stream._add(0, b"B" * 8, False)  # pylint: disable=W0212
+    stream._add(0xFFFFFFF1, b"A" * 15, False)  # pylint: disable=W0212
+    stream._add(8, b"C" * 4, False)  # pylint: disable=W0212
+    assert stream.data == b"A" * 15 + b"B" * 8 + b"C" * 4
+
+
+def test_stream_truncated():
+    """Test stream data beyond max_bytes is dropped."""
+    stream = Stream(max_bytes=8)
+    stream._add(0, b"", True)  # pylint: disable=W0212
+    stream._add(1, b"x" * 10, False)  # pylint: disable=W0212
+    assert stream.data == b"x" * 8
+    assert stream.truncated
+
+
+def test_reassembler_flow():
+    """Test a TCP flow is reassembled per direction and released when closed."""
+    released = []
+    reassembler = TCPReassembler(on_release=released.append)
+    flow = reassembler.add_segment(*_segment(CLIENT, SERVER, 100, SYN))
+    assert flow.key == FlowKey(CLIENT[0], CLIENT[1], SERVER[0], SERVER[1])
+    assert reassembler.add_segment(*_segment(SERVER, CLIENT, 500, SYN | ACK)) is flow
+    reassembler.add_segment(*_segment(CLIENT, SERVER, 101, ACK, b"GET / HTTP/1.1\r\n"))
+    reassembler.add_segment(*_segment(SERVER, CLIENT, 501, ACK | FIN, b"HTTP/1.1 200 OK\r\n"))
+    assert len(reassembler) == 1
+    reassembler.add_segment(*_segment(CLIENT, SERVER, 117, ACK | FIN))
+    assert len(reassembler) == 0
+    assert released == [flow]
+    assert flow.client.data == b"GET / HTTP/1.1\r\n"
+    assert flow.server.data == b"HTTP/1.1 200 OK\r\n"
+
+
+def test_reassembler_closed_flow():
+    """Test late segments of a closed flow do not open a new flow."""
+    released = []
+    reassembler = TCPReassembler(on_release=released.append)
+    flow = reassembler.add_segment(*_segment(CLIENT, SERVER, 100, SYN))
+    reassembler.add_segment(*_segment(SERVER, CLIENT, 500, SYN | RST))
+    assert flow.reset
+    assert reassembler.add_segment(*_segment(CLIENT, SERVER, 101, ACK), timestamp=1.0) is flow
+    assert reassembler.add_segment(*_segment(SERVER, CLIENT, 501, ACK)) is flow
+    assert len(reassembler) == 0
+    assert released == [flow]
+    new_flow = reassembler.add_segment(*_segment(CLIENT, SERVER, 900, SYN))
+    assert new_flow is not flow
+    assert len(reassembler) == 1
+
+
+def test_reassembler_eviction_and_expiry():
+    """Test least recently used eviction and expiry of flows."""
+    released = []
+    reassembler = TCPReassembler(max_flows=2, on_release=released.append)
+    for port, timestamp in ((1, 1.0), (2, 2.0), (3, 3.0)):
+        reassembler.add_segment(*_segment((CLIENT[0], port), SERVER, 0, SYN), timestamp=timestamp)
+    assert len(reassembler) == 2
+    assert released[0].key.src_port == 1
+    assert reassembler.expire(2.5) == 1
+    assert [flow.key.src_port for flow in reassembler] == [3]
+    reassembler.flush()
+    assert len(reassembler) == 0
+    assert len(released) == 3
+
+
+def test_reassembler_add_packet():
+    """Test adding decoded packets."""
+    reassembler = TCPReassembler()
+    ip, tcp, payload = _segment(CLIENT, SERVER, 7, ACK, b"data")
+    flow = reassembler.add(decode(ip + tcp + payload, 228))
+    assert flow.client.data == b"data"
+    assert reassembler.add(decode(b"\x45" + bytes(19), 228)) is None
@@ -446,3 +446,115 @@ def test_convert_bitpos_to_bit_mask():
                 bit_pos = BitPos(idx, bit_width=bit_width)
                 assert bitpos2mask(bit_pos) == val
             val <<= 1
+
+
+def test_bitfield_byte_order():
+    """Test bit positions count from the least significant bit in the instance byte order."""
+
+    class WordBitField(BitField):
+        """Custom 16-bit BitField."""
+
+        byte_length = 2
+        high = BitPos(12, bit_width=4)
+        low = BitPos(0, bit_width=13)
+
+    big = WordBitField(byte_order=b"!", data=b"\x45\x01")
+    assert big.high == 4
+    assert big.low == 0x0501
+    assert big[0] is True
+    assert big[14] is True
+    little = WordBitField(byte_order=b"<", data=b"\x45\x01")
+    assert little.high == 0
+    assert little.low == 0x0145
+    big.low = 0x1FFF
+    assert big.data == b"\x5f\xff"
+    big.high = 0x1F
+    assert big.data == b"\xff\xff"
+    big.low = 0
+    assert big.data == b"\xe0\x00"
+    big.set_bit(0)
+    assert big.data == b"\xe0\x01"
+
+
+def test_bitfield_bitpos_out_of_range():
+    """Test accessing a BitPos beyond the bitfield length."""
+
+    class ShortBitField(BitField):
+        """BitField with an out of range BitPos."""
+
+        wide = BitPos(4, bit_width=8)
+
+    sbf = ShortBitField()
+    with pytest.raises(IndexError):
+        _ = sbf.wide
+    with pytest.raises(IndexError):
+        sbf.wide = 1
+
+
+def test_bitfield_inherited_flags():
+    """Test named bit positions are collected from base classes."""
+
+    class ChildBitField(TestBitField):
+        """BitField extending TestBitField."""
+
+        extra_bit = BitPos(14)
+
+    cbf = ChildBitField(data=b"\x01\x40")
+    assert cbf.flags == {"first_bit": True, "middle_bit": 0, "last_bit": False, "extra_bit": True}
+    assert cbf.flags_tuple() == (True, 0, False, True)
+    assert cbf.flags_int() == 0x4001
+
+
+def test_bitfield_decode_flags():
+    """Test decoding the named bit positions of many bitfields at once."""
+    data = b"\x01\x00\x00\x8a\xff\xff"
+    assert TestBitField.decode_flags(data, byte_order=b"<") == {
+        "first_bit": [True, False, True],
+        "middle_bit": [0, 10, 15],
+        "last_bit": [False, True, True],
+    }
+    assert TestBitField.decode_flags(data, byte_order=b">")["middle_bit"] == [1, 0, 15]
+    with pytest.raises(ValueError):
+        TestBitField.decode_flags(data[:-1])
+
+
+class BigEndianBitField(BitField):
+    """Two byte bitfield split into a 4 bit and a 12 bit field."""
+
+    byte_length = 2
+    high = BitPos(12, bit_width=4)
+    low = BitPos(0, bit_width=12)
+
+
+def test_user_defined_big_endian_bitfield():
+    """Test reading a user defined multibyte big endian bitfield."""
+    bf = BigEndianBitField(byte_order=b"!", data=b"\x40\x10")
+    assert bf.flags_int() == 0x4010
+    assert bf.high == 0x4
+    assert bf.low == 0x010
+    bf.low = 0xABC
+    assert bytes(bf.data) == b"\x4a\xbc"
+    assert BigEndianBitField.decode_flags(b"\x40\x10\x12\x34", byte_order=b"!") == {
+        "high": [0x4, 0x1],
+        "low": [0x010, 0x234],
+    }
+
+
+def test_legacy_bit_numbering():
+    """Test that legacy bit numbering counts from the first byte irrespective of byte order."""
+
+    class LegacyBitField(BigEndianBitField):
+        legacy_bit_numbering = True
+
+    bf = LegacyBitField(byte_order=b"!", data=b"\x40\x10")
+    assert bf.flags_int() == 0x1040
+    assert bf.high == 0x1
+    assert bf.low == 0x040
+    assert bf[0] is False
+    assert bf[6] is True
+    bf.low = 0xABC
+    assert bytes(bf.data) == b"\xbc\x1a"
+    assert LegacyBitField.decode_flags(b"\x40\x10\x12\x34", byte_order=b"!") == {
+        "high": [0x1, 0x3],
+        "low": [0x040, 0x412],
+    }
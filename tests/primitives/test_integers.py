@@ -1,5 +1,6 @@
 """Unit tests for byteclasses primitive integer type constructors."""
 
+import io
 import math
 import operator
 
@@ -740,3 +741,30 @@ def test_ptr64_instance_properties():
     ptr = Ptr64(0xFFFFFFFFFFFFFFFF)
     assert str(ptr) == "0xffffffffffffffff"
     assert repr(ptr) == "Ptr64(0xffffffffffffffff)"
+
+
+def test_integer_iter_from():
+    """Test iterating integers from buffers and streams."""
+    data = b"".join(i.to_bytes(2, "little") for i in range(100))
+    assert [int(value) for value in UInt16.iter_from(data, byte_order=b"<")] == list(range(100))
+    values = UInt16.iter_from(io.BytesIO(data), chunk_size=5, byte_order=b"<")
+    assert [int(value) for value in values] == list(range(100))
+    values = list(UInt16.iter_from(io.BytesIO(data), chunk_size=5, reuse=False, byte_order=b"<"))
+    assert [int(value) for value in values] == list(range(100))
+    with pytest.raises(ValueError):
+        list(UInt16.iter_from(data[:-1]))
+
+
+def test_integer_precompiled_structs():
+    """Test integer classes share precompiled structs and write values in place."""
+    uint32 = UInt32(1, byte_order=b">")
+    assert uint32.fmt == b">I"
+    assert uint32._struct is UInt32._structs[uint32.byte_order]
+    uint32.byte_order = b"<"
+    assert uint32.fmt == b"<I"
+    assert uint32._struct is UInt32._structs[uint32.byte_order]
+    buffer = bytearray(6)
+    uint32.attach(memoryview(buffer)[1:5], False)
+    uint32.value = 0x01020304
+    assert buffer == b"\x00\x04\x03\x02\x01\x00"
+    assert uint32.value == 0x01020304
@@ -0,0 +1,77 @@
+"""Test suite for NumPy dtype conversion."""
+
+import pytest
+
+from byteclasses._enums import ByteOrder
+from byteclasses.handlers.network.tcp_hdr import OffFlag
+from byteclasses.types.collections import ByteArray, String, member, structure, union
+from byteclasses.types.primitives.integers import Int16, UInt8, UInt32
+
+np = pytest.importorskip("numpy")
+
+from byteclasses.numpy import from_dtype, to_dtype  # noqa: E402 pylint: disable=C0413
+
+
+@union
+class NumUnion:  # pylint: disable=R0903
+    """Test union class."""
+
+    a: UInt32
+    b: UInt8
+
+
+@structure(byte_order=ByteOrder.BE)
+class NumStruct:  # pylint: disable=R0903
+    """Test structure class."""
+
+    a: UInt8
+    b: NumUnion
+    c: ByteArray = member(factory=lambda byte_order: ByteArray(3, Int16, byte_order=byte_order))
+    d: String = member(factory=lambda byte_order: String(4))
+
+
+def test_to_dtype():
+    """Test dtype creation from a byteclass collection."""
+    dtype = to_dtype(NumStruct)
+    assert dtype.names == ("a", "b", "c", "d")
+    assert dtype.itemsize == len(NumStruct())
+    assert [dtype.fields[name][1] for name in dtype.names] == [0, 4, 12, 20]
+    assert dtype.fields["b"][0].fields["b"][1] == 0
+    assert dtype.fields["c"][0].subdtype[0] == np.dtype(">i2")
+    assert dtype.fields["d"][0] == np.dtype("S4")
+    with pytest.raises(TypeError):
+        to_dtype(UInt8)
+
+
+def test_to_dtype_view():
+    """Test dtype view of collection data."""
+    ns = NumStruct()
+    ns.a = 1
+    ns.c[1] = -2
+    view = np.frombuffer(bytes(ns), dtype=to_dtype(NumStruct))
+    assert view["a"][0] == 1
+    assert view["c"][0].tolist() == [0, -2, 0]
+
+
+def test_from_dtype():
+    """Test byteclass collection creation from a dtype."""
+    dtype = np.dtype({"names": ["a", "b"], "formats": ["<u1", "<u4"], "offsets": [0, 4], "itemsize": 12})
+    new_cls = from_dtype(dtype, "NewStruct")
+    instance = new_cls()
+    assert len(instance) == 12
+    assert instance.b.byte_order == ByteOrder.LE
+    assert to_dtype(new_cls).fields["b"][1] == 4
+    union_cls = from_dtype(np.dtype({"names": ["a", "b"], "formats": [">u4", ">u2"], "offsets": [0, 0]}), "NewUnion")
+    assert len(union_cls()) == 4
+    with pytest.raises(ValueError):
+        from_dtype(np.dtype([("a", "<u2"), ("b", ">u2")]), "Mixed")
+
+
+def test_decode_flags_array():
+    """Test vectorized BitField flag decoding."""
+    words = np.frombuffer(b"\x50\x12\x80\x10", dtype=">u2")
+    flags = OffFlag.decode_flags_array(words)
+    assert flags["data_offset"].tolist() == [5, 8]
+    assert flags["flags"].tolist() == [0x012, 0x010]
+    with pytest.raises(TypeError):
+        OffFlag.decode_flags_array(np.zeros(2, dtype="f4"))